@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:24:03 2026
+
+@author: JoanaCatarino
+
+Test of the laser pulses (replaces calibration_opto_10ms/100ms)
+- calibration_opto(0.01) plays 30 pulses of 10 ms, one per second, on the pulse scheduler's pulse train
+- Returns the PulseTrain right away (the GUI does not wait for the 30 s); the timing of the train is printed at the end
+  and the planned/actual edges of every pulse are saved in SAVE_DIRECTORY/calibration (or log_path)
+"""
+
+from gpio_map import *
+from pulse_scheduler import pulse_train, pulse_log_path
+from file_writer import calibration_file_path
+
+def calibration_opto(pulse_duration, quant=30, period=1.0, log_path=None): # 30 pulses just to test, one pulse per second
+    name = f'{pulse_duration*1000:g}ms'
+    if log_path is None:
+        log_path = pulse_log_path(calibration_file_path(f'OptoCalibration_{name}'))
+
+    def finished(train):
+        print(f'Finished calibration for Opto {name}')
+
+    return pulse_train(laser, pulse_duration, period, quant, label=f'Opto {name}', callback=finished, log_path=log_path)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:40:12 2026
+
+@author: JoanaCatarino
+
+Clocks of the tasks
+- The TaskEngine takes every time from its clock (task.clock): time() for the times saved in the csv,
+  monotonic() for its timers, and sleep() for anything that has to wait
+- RealClock is the computer's clock (time.time, time.monotonic, time.sleep) - used on the rig and in the GUI
+- SimulatedClock is virtual: it only moves when the driver moves it (replay.drive jumps it to the next sample or
+  to the next timer deadline, so nothing is ever waited for) and sleep() just moves it forward.
+  Used by the replay and the fast headless simulation
+"""
+
+import time
+
+
+class RealClock:
+
+    def time(self):
+        return time.time()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def monotonic_ns(self):
+        return time.monotonic_ns()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class SimulatedClock:
+
+    def __init__(self, start=0.0, wall_offset=0.0):
+        self.t = start # monotonic time (s)
+        self.wall_offset = wall_offset # time() - monotonic()
+
+    def set(self, t):
+        """Moves the clock to t (it never goes back)."""
+        self.t = max(self.t, t)
+
+    def time(self):
+        return self.wall_offset + self.t
+
+    def monotonic(self):
+        return self.t
+
+    def monotonic_ns(self):
+        return int(round(self.t * 1e9))
+
+    def sleep(self, seconds):
+        self.t += max(0.0, seconds)
+
+
+# The clock of the rig
+real_clock = RealClock()
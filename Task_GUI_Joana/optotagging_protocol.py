@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:10:26 2026
+
+@author: JoanaCatarino
+
+Protocol for optotagging units after task
+- One protocol for every pulse width (replaces optotagging_protocol_2ms/10ms/100ms): OptoProtocol(ui, width=0.010)
+  or one of the presets in OPTO_PROTOCOLS, e.g. OptoProtocol(ui, **OPTO_PROTOCOLS['2ms'])
+- The laser train is a pulse_train of the pulse scheduler: onsets on absolute deadlines of the monotonic clock and
+  the width timed by the scheduler, so the error does not build up over the 100 pulses. The planned and actual edges
+  of every pulse are saved to log_path: by default <session>_opto_<width>.csv next to csv_file_path, or a file in
+  SAVE_DIRECTORY/calibration when the protocol is run without a session
+"""
+
+from gpio_map import *
+from pulse_scheduler import pulse_train, pulse_log_path
+from file_writer import calibration_file_path
+
+# Default protocols: 100 pulses at 1 Hz
+OPTO_PROTOCOLS = {
+    '2ms': dict(width=0.002, period=1.0, count=100),
+    '10ms': dict(width=0.010, period=1.0, count=100),
+    '100ms': dict(width=0.100, period=1.0, count=100),
+    }
+
+
+class OptoProtocol:
+
+    def __init__(self, ui, gui_controls=None, width=0.010, period=1.0, count=100, csv_file_path=None, log_path=None):
+
+        self.ui = ui
+        self.gui_controls = gui_controls
+        self.width = width
+        self.period = period
+        self.count = count
+        self.name = f'{width*1000:g}ms'
+
+        # csv with the planned/actual edges of every pulse
+        if log_path is None:
+            if csv_file_path is not None:
+                log_path = pulse_log_path(csv_file_path, f'opto_{self.name}')
+            else:
+                log_path = pulse_log_path(calibration_file_path(f'Optotagging_{self.name}'))
+        self.log_path = log_path
+
+        self.running = False
+        self.train = None
+        self.start()
+
+    def start(self):
+        print(f'Optotagging protocol {self.name} starting')
+
+        # Pumps on (valves closed) and laser LOW to start
+        pump_l.on()
+        pump_r.on()
+        laser.off()
+
+        self.running = True
+        self.train = pulse_train(laser, self.width, self.period, self.count, label=f"{self.name} block",
+                                 callback=self.sequence_finished, log_path=self.log_path)
+
+    def stop(self):
+        print(f"Stopping Passive Optotagging Protocol {self.name}...")
+        self.running = False
+        if self.train is not None:
+            self.train.stop()
+        pump_l.on()
+        pump_r.on()
+        laser.off()
+
+    def sequence_finished(self, train):
+        if not self.running:
+            return
+
+        print("Sequence of laser pulses is finished!")
+        self.stop() # Stop protocol once all pulses were played
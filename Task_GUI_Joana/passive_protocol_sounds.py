@@ -19,7 +19,7 @@ import time
 from gpio_map import *
 from gpiozero import LED
 from time import sleep
-from sound_generator import tone_16KHz, tone_8KHz
+from sound_generator import play_cue_async
 from form_updt import Ui_TaskGui
 
 class PassiveSoundRecordings:
@@ -56,14 +56,9 @@ class PassiveSoundRecordings:
          
      
     def play_sound(self, frequency):
-        if frequency == "8KHz":
-            ttl_stim.on()
-            tone_8KHz()   # Your function for 8KHz sound
-            ttl_stim.off()
-        elif frequency == "16KHz":
-            ttl_stim.on()
-            tone_16KHz()  # Your function for 16KHz sound
-            ttl_stim.off()
+        if frequency in ("8KHz", "16KHz"):
+            # TTL is raised/lowered by the audio callback with the buffers that start/end the tone
+            play_cue_async(frequency, ttl=ttl_stim).wait()
             
          
     def run_sequence(self):
@@ -1,124 +1,180 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Fri Jan 31 13:06:27 2025
-
-@author: JoanaCatarino
-
-Sets the real-time plots in the GUI for the free licking and spout sampling tasks
-     - This plots have the number of licks over trials and in which spout the licks happened
-"""
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.ticker import FuncFormatter
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QMainWindow, QSizePolicy
-import datetime
-import numpy as np
-from scipy.stats import norm
-
-class PlotLicks(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-
-        # Create Figure and Canvas
-        self.figure = Figure()
-        self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111)
-
-        # Initialize Data Lists
-        self.trial_numbers = []
-        self.total_trials = []
-        self.total_licks = []
-        self.licks_left = []
-        self.licks_right = []
-
-        # Set Up Plot
-        #self.ax.set_xlabel("Time (s)")
-        self.ax.set_ylabel("Licks")
-        self.ax.grid(True)
-
-        # Layout
-        layout = QVBoxLayout()
-        layout.addWidget(self.canvas)
-        layout.setContentsMargins(0,0,0,0) 
-        layout.setSpacing(0) 
-        self.setLayout(layout)
-        
-        #  new!! test to see if it improves layout of the plots
-        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding) 
-        
-        # Apply tight layout to ensure everything fits 
-        self.figure.tight_layout(pad=2.9)  
-
-    def update_plot(self, total_trials, total_licks, licks_left, licks_right):
-        """Update stair plot with new lick data."""
-        
-        # Increment trial number (should match total number of trials, including omissions)
-        trial_number = len(self.trial_numbers)   # Use independent counter
-        self.trial_numbers.append(trial_number)
-        
-        # Always append total trials to keep trial history
-        self.total_trials.append(total_trials)
-        
-        # Append Data
-        self.total_licks.append(total_licks)
-        self.licks_left.append(licks_left)
-        self.licks_right.append(licks_right)
-        
-        # Ensure trial numbers are actual trial count
-        trial_numbers = np.array(self.trial_numbers, dtype=int)
-        # Convert lists to NumPy arrays
-        total_trials_arr = np.array(self.total_trials)
-
-        # Clear and Redraw Stair Plot
-        self.ax.clear()
-        self.ax.step(trial_numbers, self.total_licks, where='post', color='#FF864E', linewidth=2, label='Total licks')
-        self.ax.step(trial_numbers, self.licks_left, where='post', color='#955C66', linewidth=2, linestyle= 'dashed', label='Licks left')
-        self.ax.step(trial_numbers, self.licks_right, where='post', color='#4E8070', linewidth=2, linestyle= 'dashed', label='Licks right')
-        
-        # Update Labels & Formatting
-        self.ax.set_ylabel("Licks", labelpad=9)
-        self.ax.grid(True)
-        
-        # Set y-axis tick labels to whole numbers
-        self.ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'{int(x)}'))
-        
-        # Ensure x-axis labels are integers (no decimals)
-        self.ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
-        
-        # Add legend and set colors
-        legend = self.ax.legend(loc='upper center', bbox_to_anchor=(0.5, 1.18), ncol=3, frameon=False, prop={'size':8.5})
-        for text, color in zip(legend.get_texts(), ['#FF864E', '#955C66', '#4E8070']):
-            text.set_color(color)
-            
-        # Adjust layout to increase padding at the top
-        self.figure.subplots_adjust(top=0.85)  
-        self.figure.subplots_adjust(right=0.95)
-
-        # Redraw Canvas
-        self.ax.relim() 
-        self.ax.autoscale_view() 
-        self.canvas.draw()
-        
-    def reset_plot(self):
-        """Clears the plot data and refreshes the figure."""
-        self.trial_numbers.clear()
-        self.total_trials.clear()
-        self.total_licks.clear()
-        self.licks_left.clear()
-        self.licks_right.clear()
-    
-        self.ax.clear()  # Clear the existing plot
-        self.ax.set_ylabel("Licks")
-        self.ax.grid(True)
-        
-        # Keep a placeholder data point to avoid dimension mismatches
-        self.trial_numbers.append(0)
-        self.total_trials.append(0)
-        self.total_licks.append(0)
-        self.licks_left.append(0)
-        self.licks_right.append(0)
-    
-        # Redraw the canvas
-        self.canvas.draw()
\ No newline at end of file
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Jan 31 13:06:27 2025
+
+@author: JoanaCatarino
+
+Sets the real-time plots in the GUI for the free licking and spout sampling tasks
+     - This plots have the number of licks over trials and in which spout the licks happened
+     - LickData keeps the counts (one point per trial) in arrays that grow by doubling, so adding a trial does not
+       depend on how many trials there were. The main and overview plots share one LickData
+     - add_trial() can be called from the task thread: it only appends the point. Each PlotLicks redraws from its own
+       QTimer (GUI thread) at most frame_rate times per second: the step lines are persistent artists that are extended
+       in place and blitted over a saved background, the full figure is only redrawn when an axis has to grow
+"""
+import threading
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.ticker import FuncFormatter
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
+from PyQt5.QtCore import QTimer
+import numpy as np
+
+
+class LickData:
+    """Licks after every trial (rows of points: trial number, total licks, licks left, licks right)."""
+
+    def __init__(self, capacity=256):
+        self.lock = threading.Lock()
+        self.points = np.zeros((4, capacity))
+        self.n = 0
+        self.version = 0 # +1 for every change (the plots redraw when it is not the one they drew)
+        self.session = 0 # +1 for every reset (the plots reset their axes)
+
+    def add_trial(self, total_trials, total_licks, licks_left, licks_right):
+        with self.lock:
+            if self.n == self.points.shape[1]:
+                grown = np.zeros((4, 2 * self.n)) # amortized growth - views of the old array stay valid
+                grown[:, :self.n] = self.points
+                self.points = grown
+            self.points[:, self.n] = (self.n, total_licks, licks_left, licks_right) # trial number is an independent counter
+            self.n += 1
+            self.version += 1
+
+    def reset(self):
+        with self.lock:
+            self.n = 0
+            self.version += 1
+            self.session += 1
+        # Keep a placeholder point (no licks yet) so the plot starts at trial 0
+        self.add_trial(0, 0, 0, 0)
+
+    def view(self):
+        """(points[:, :n], version, session) - the points are a view, the rows are not changed later."""
+        with self.lock:
+            return self.points[:, :self.n], self.version, self.session
+
+
+class PlotLicks(QWidget):
+
+    frame_rate = 10 # max redraws per second
+    x_min_range = 10 # trials shown before the x axis starts to grow
+    y_min_range = 10 # licks shown before the y axis starts to grow
+
+    def __init__(self, parent=None, data=None):
+        super().__init__(parent)
+
+        # Points of the session (shared with the other lick plot)
+        self.data = data if data is not None else LickData()
+        self.drawn_version = None
+        self.drawn_session = None
+
+        # Create Figure and Canvas
+        self.figure = Figure()
+        self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot(111)
+
+        # Persistent step lines - animated: only drawn by blitting, over the background saved after a full draw
+        colors = ['#FF864E', '#955C66', '#4E8070']
+        self.lines = [
+            self.ax.plot([], [], drawstyle='steps-post', color=colors[0], linewidth=2, label='Total licks', animated=True)[0],
+            self.ax.plot([], [], drawstyle='steps-post', color=colors[1], linewidth=2, linestyle='dashed', label='Licks left', animated=True)[0],
+            self.ax.plot([], [], drawstyle='steps-post', color=colors[2], linewidth=2, linestyle='dashed', label='Licks right', animated=True)[0],
+            ]
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+        # Set Up Plot
+        self.ax.set_ylabel("Licks", labelpad=9)
+        self.ax.grid(True)
+
+        # Set y-axis tick labels to whole numbers
+        self.ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'{int(x)}'))
+
+        # Ensure x-axis labels are integers (no decimals)
+        self.ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+
+        # Add legend and set colors
+        legend = self.ax.legend(loc='upper center', bbox_to_anchor=(0.5, 1.18), ncol=3, frameon=False, prop={'size':8.5})
+        for text, color in zip(legend.get_texts(), colors):
+            text.set_color(color)
+        self.reset_axes()
+
+        # Layout
+        layout = QVBoxLayout()
+        layout.addWidget(self.canvas)
+        layout.setContentsMargins(0,0,0,0)
+        layout.setSpacing(0)
+        self.setLayout(layout)
+
+        #  new!! test to see if it improves layout of the plots
+        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # Apply tight layout to ensure everything fits, with more padding at the top for the legend
+        self.figure.tight_layout(pad=2.9)
+        self.figure.subplots_adjust(top=0.85, right=0.95)
+
+        # Redraws are coalesced: the timer draws whatever arrived since the last frame
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000 // self.frame_rate)
+
+    def update_plot(self, total_trials, total_licks, licks_left, licks_right):
+        """Adds the point of a new trial (drawn with the next frame)."""
+        self.data.add_trial(total_trials, total_licks, licks_left, licks_right)
+
+    def reset_plot(self):
+        """Clears the plot data (the axes are reset with the next frame)."""
+        self.data.reset()
+
+    def reset_axes(self):
+        self.ax.set_xlim(0, self.x_min_range)
+        self.ax.set_ylim(0, self.y_min_range)
+
+    def rescale(self, points):
+        """Grows the axes if the new points do not fit; returns True if they changed (full redraw)."""
+        if not len(points[0]):
+            return False
+        changed = False
+        x_max = self.ax.get_xlim()[1]
+        if points[0, -1] >= x_max:
+            self.ax.set_xlim(0, max(self.x_min_range, int(points[0, -1] * 1.5))) # room for the next trials
+            changed = True
+
+        y_max = self.ax.get_ylim()[1]
+        if points[1, -1] >= y_max: # the total is the largest count and never goes down
+            self.ax.set_ylim(0, max(self.y_min_range, int(points[1, -1] * 1.5)))
+            changed = True
+        return changed
+
+    def refresh(self):
+        """Timer (GUI thread) - draws the points that arrived since the last frame."""
+        points, version, session = self.data.view()
+        if version == self.drawn_version:
+            return
+        self.drawn_version = version
+
+        for line, counts in zip(self.lines, points[1:]):
+            line.set_data(points[0], counts)
+
+        full = session != self.drawn_session or self.background is None
+        if session != self.drawn_session:
+            self.drawn_session = session
+            self.reset_axes()
+        if self.rescale(points) or full:
+            self.canvas.draw() # on_draw saves the new background and draws the lines
+            return
+
+        self.canvas.restore_region(self.background)
+        self.draw_lines()
+        self.canvas.blit(self.figure.bbox)
+
+    def on_draw(self, event):
+        """After every full draw (new limits, resize): saves the background and draws the lines over it."""
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_lines()
+
+    def draw_lines(self):
+        for line in self.lines:
+            self.ax.draw_artist(line)
@@ -1,173 +1,202 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Tue Mar  4 10:50:44 2025
-
-@author: JoanaCatarino
-
-Sets the real-time plots in the GUI for the Two-choice auditory, Adaptive sensorimotor and Adaptive sensorimotor with distractor tasks
-     - This plots have the hit rate / false alarm rations ans the d´
-"""
-
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.ticker import FuncFormatter
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QMainWindow, QSizePolicy
-import datetime
-import numpy as np
-from scipy.stats import norm
-
-class PlotPerformance(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-
-        # Create Figure and Canvas
-        self.figure = Figure()
-        self.canvas = FigureCanvas(self.figure)
-        self.ax = self.figure.add_subplot(111)
-        self.ax2 = self.ax.twinx()  # Create secondary y-axis
-
-        # Initialize Data Lists
-        self.trial_numbers = []
-        self.total_trials = []
-        self.correct_trials = []
-        self.incorrect_trials = []
-        
-        # Set Up Plot
-        self.ax.set_ylabel("HR/FA")
-        self.ax2.set_ylabel("d'", color='#9DB4C0')
-        self.ax.set_ylim(0, 1)  # Ensure HR/FA stays within 0-1
-        self.ax.grid(True)
-       
-        # Layout
-        layout = QVBoxLayout()
-        layout.addWidget(self.canvas)
-        layout.setContentsMargins(0,0,0,0) 
-        layout.setSpacing(0) 
-        self.setLayout(layout)
-        
-        #  new!! test to see if it improves layout of the plots
-        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding) 
-        
-        # Apply tight layout to ensure everything fits 
-        self.figure.tight_layout(pad=2.9)
-        
-    def update_plot(self, total_trials, correct_trials, incorrect_trials):
-        """Update stair plot with new lick data."""
-
-        # Increment trial number (should match total number of trials, including omissions)
-        trial_number = len(self.trial_numbers)   # Use independent counter
-        self.trial_numbers.append(trial_number)
-        
-        # Always append total trials to keep trial history
-        self.total_trials.append(total_trials)
-    
-        # If this is the first trial, initialize previous values
-        if len(self.correct_trials) > 0:
-            last_correct = self.correct_trials[-1]
-            last_incorrect = self.incorrect_trials[-1]
-        else:
-            last_correct = 0
-            last_incorrect = 0
-    
-        # Keep previous values if no new correct/incorrect trial data is received
-        self.correct_trials.append(correct_trials if correct_trials is not None else last_correct)
-        self.incorrect_trials.append(incorrect_trials if incorrect_trials is not None else last_incorrect)
-    
-        # Convert lists to NumPy arrays
-        total_trials_arr = np.array(self.total_trials)
-        correct_trials_arr = np.array(self.correct_trials)
-        incorrect_trials_arr = np.array(self.incorrect_trials)
-    
-        # Calculate Hit Rate (HR) and False Alarm Rate (FA)
-        HR = (correct_trials_arr + 0.5) / (total_trials_arr + 1) #Hit rate
-        FA = (incorrect_trials_arr + 0.5) / (total_trials_arr + 1) # False alarm
-        
-        # Clip HR and FA to avoid -inf and inf issues in norm.ppf()
-        HR = np.clip(HR, 0.01, 0.99)
-        FA = np.clip(FA, 0.01, 0.99)
-        
-        # Calculate d' (d-prime)
-        d_prime = norm.ppf(HR) - norm.ppf(FA)
-
-        # Ensure trial numbers are actual trial count
-        trial_numbers = np.array(self.trial_numbers, dtype=int)
-
-        # Clear and Redraw Stair Plot
-        self.ax.clear()
-        self.ax2.clear()        
-        
-        self.ax.step(trial_numbers, HR, where='post', color='black', linewidth=2, label='Hit Rate')
-        self.ax.step(trial_numbers, FA, where='post', color='red', linewidth=2, label='False Alarm')
-        
-        # Plot d' (d-prime) on the secondary y-axis (right)
-        self.ax2.step(trial_numbers, d_prime, color='#9DB4C0', linewidth=2, label="d'")
-      
-        # Update Labels & Formatting
-        self.ax.set_ylabel("HR/FA", labelpad=7)
-        self.ax2.set_ylabel("d'", color='#9DB4C0')
-        self.ax.grid(True)
-        
-        # Set y-axis tick labels to whole numbers
-        self.ax.set_ylim(0, 1)
-        
-        # **Explicitly Set Y-Axis Limits for d'**
-        self.ax2.set_ylim(min(d_prime) - 0.5, max(d_prime) + 0.5)  # Expand limits slightly
-        
-        # Ensure x-axis labels are integers (no decimals)
-        self.ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
-        
-        # Format y-axes
-        self.ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'{x:.1f}'))
-        self.ax2.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'{x:.1f}'))
-        
-        # Ensure right y-axis labels are visible
-        self.ax2.tick_params(axis='y', labelcolor='#27605F')
-        
-        # Add legend and set colors
-        # Combine Legends for both axes
-        lines1, labels1 = self.ax.get_legend_handles_labels()
-        lines2, labels2 = self.ax2.get_legend_handles_labels()
-        self.ax.legend(lines1 + lines2, labels1 + labels2, loc='upper center', bbox_to_anchor=(0.5, 1.2), ncol=3, frameon=False, prop={'size':9})
-            
-        # Adjust layout to increase padding at the top
-        self.figure.subplots_adjust(top=0.85)  
-
-        # Redraw Canvas
-        self.ax.relim() 
-        self.ax.autoscale_view()
-        self.ax2.relim()
-        self.ax2.autoscale_view()
-        self.canvas.draw()
-        
-    def reset_plot(self):
-        """Clears the plot data and refreshes the figure."""
-        self.trial_numbers.clear()
-        self.total_trials.clear()
-        self.correct_trials.clear()
-        self.incorrect_trials.clear()
-
-        # Clear both axes
-        self.ax.clear()
-        self.ax2.clear()
-
-        # Reinitialize the primary y-axis (HR & FA)
-        self.ax.set_xlabel("Trial Number")
-        self.ax.set_ylabel("HR / FA", color='black')
-        self.ax.set_ylim(0, 1)
-        self.ax.grid(True, linestyle='dotted')
-
-        # Reinitialize the secondary y-axis (d-prime)
-        self.ax2.set_ylabel("d'", color='#9DB4C0')
-        self.ax2.set_ylim(-2, 2)  # Reset range for d'
-        self.ax2.tick_params(axis='y', labelcolor='#27605F')
-        
-        # Ensure that lists remain the same size when the next trial starts
-        self.trial_numbers.append(0)
-        self.total_trials.append(0)
-        self.correct_trials.append(0)
-        self.incorrect_trials.append(0)
-
-        # Redraw the canvas
-        self.canvas.draw()
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Mar  4 10:50:44 2025
+
+@author: JoanaCatarino
+
+Sets the real-time plots in the GUI for the Two-choice auditory, Adaptive sensorimotor and Adaptive sensorimotor with distractor tasks
+     - This plots have the hit rate / false alarm rations ans the d´
+     - PerformanceData keeps the points (one per trial) in preallocated arrays and computes HR/FA/d' only for the new
+       trial, so a trial costs the same at trial 1000 as at trial 1. The main and overview plots share one PerformanceData
+     - add_trial() can be called from the task thread: it only appends the point. Each PlotPerformance redraws from its
+       own QTimer (GUI thread) at most frame_rate times per second and only when there are new points: the lines are
+       persistent artists drawn over a saved background (blitting), the full figure is only redrawn when an axis has to grow
+"""
+
+import threading
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.ticker import FuncFormatter
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
+from PyQt5.QtCore import QTimer
+import numpy as np
+from scipy.stats import norm
+
+
+class PerformanceData:
+    """HR, FA and d' after every trial (rows of points: trial number, HR, FA, d')."""
+
+    def __init__(self, capacity=256):
+        self.lock = threading.Lock()
+        self.points = np.zeros((4, capacity))
+        self.n = 0
+        self.last_correct = 0
+        self.last_incorrect = 0
+        self.d_range = (0.0, 0.0) # min and max of d' so far
+        self.version = 0 # +1 for every change (the plots redraw when it is not the one they drew)
+        self.session = 0 # +1 for every reset (the plots reset their axes)
+
+    def add_trial(self, total_trials, correct_trials, incorrect_trials):
+        # Keep previous values if no new correct/incorrect trial data is received
+        correct = correct_trials if correct_trials is not None else self.last_correct
+        incorrect = incorrect_trials if incorrect_trials is not None else self.last_incorrect
+        self.last_correct, self.last_incorrect = correct, incorrect
+
+        # Calculate Hit Rate (HR) and False Alarm Rate (FA), clipped to avoid -inf and inf in norm.ppf()
+        HR = min(max((correct + 0.5) / (total_trials + 1), 0.01), 0.99)
+        FA = min(max((incorrect + 0.5) / (total_trials + 1), 0.01), 0.99)
+        d_prime = norm.ppf(HR) - norm.ppf(FA)
+
+        with self.lock:
+            if self.n == self.points.shape[1]:
+                grown = np.zeros((4, 2 * self.n)) # amortized growth - views of the old array stay valid
+                grown[:, :self.n] = self.points
+                self.points = grown
+            self.points[:, self.n] = (self.n, HR, FA, d_prime) # trial number is an independent counter
+            self.n += 1
+            self.d_range = (min(self.d_range[0], d_prime), max(self.d_range[1], d_prime))
+            self.version += 1
+
+    def reset(self):
+        with self.lock:
+            self.n = 0
+            self.d_range = (0.0, 0.0)
+            self.version += 1
+            self.session += 1
+        self.last_correct = 0
+        self.last_incorrect = 0
+        # Keep a placeholder point (no trials yet) so the plot starts at trial 0
+        self.add_trial(0, 0, 0)
+
+    def view(self):
+        """(points[:, :n], d' range, version, session) - the points are a view, the rows are not changed later."""
+        with self.lock:
+            return self.points[:, :self.n], self.d_range, self.version, self.session
+
+
+class PlotPerformance(QWidget):
+
+    frame_rate = 10 # max redraws per second
+    x_min_range = 10 # trials shown before the x axis starts to grow
+
+    def __init__(self, parent=None, data=None):
+        super().__init__(parent)
+
+        # Points of the session (shared with the other performance plot)
+        self.data = data if data is not None else PerformanceData()
+        self.drawn_version = None
+        self.drawn_session = None
+
+        # Create Figure and Canvas
+        self.figure = Figure()
+        self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot(111)
+        self.ax2 = self.ax.twinx()  # Create secondary y-axis
+
+        # Persistent lines - animated: only drawn by blitting, over the background saved after a full draw
+        self.line_HR, = self.ax.plot([], [], drawstyle='steps-post', color='black', linewidth=2, label='Hit Rate', animated=True)
+        self.line_FA, = self.ax.plot([], [], drawstyle='steps-post', color='red', linewidth=2, label='False Alarm', animated=True)
+        self.line_d, = self.ax2.plot([], [], drawstyle='steps-pre', color='#9DB4C0', linewidth=2, label="d'", animated=True)
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+        # Set Up Plot
+        self.ax.set_ylabel("HR/FA", labelpad=7)
+        self.ax2.set_ylabel("d'", color='#9DB4C0')
+        self.ax.set_ylim(0, 1)  # Ensure HR/FA stays within 0-1
+        self.ax.grid(True)
+
+        # Ensure x-axis labels are integers (no decimals)
+        self.ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+
+        # Format y-axes
+        self.ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'{x:.1f}'))
+        self.ax2.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f'{x:.1f}'))
+
+        # Ensure right y-axis labels are visible
+        self.ax2.tick_params(axis='y', labelcolor='#27605F')
+
+        # Combine Legends for both axes
+        self.ax.legend([self.line_HR, self.line_FA, self.line_d], ['Hit Rate', 'False Alarm', "d'"], loc='upper center',
+                       bbox_to_anchor=(0.5, 1.2), ncol=3, frameon=False, prop={'size':9})
+        self.reset_axes()
+
+        # Layout
+        layout = QVBoxLayout()
+        layout.addWidget(self.canvas)
+        layout.setContentsMargins(0,0,0,0)
+        layout.setSpacing(0)
+        self.setLayout(layout)
+
+        #  new!! test to see if it improves layout of the plots
+        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # Apply tight layout to ensure everything fits, with more padding at the top for the legend
+        self.figure.tight_layout(pad=2.9)
+        self.figure.subplots_adjust(top=0.85)
+
+        # Redraws are coalesced: the timer draws whatever arrived since the last frame
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000 // self.frame_rate)
+
+    def update_plot(self, total_trials, correct_trials, incorrect_trials):
+        """Adds the point of a new trial (drawn with the next frame)."""
+        self.data.add_trial(total_trials, correct_trials, incorrect_trials)
+
+    def reset_plot(self):
+        """Clears the plot data (the axes are reset with the next frame)."""
+        self.data.reset()
+
+    def reset_axes(self):
+        self.ax.set_xlim(0, self.x_min_range)
+        self.ax2.set_ylim(-2, 2)  # Reset range for d'
+
+    def rescale(self, points, d_range):
+        """Grows the axes if the new points do not fit; returns True if they changed (full redraw)."""
+        changed = False
+        x_max = self.ax.get_xlim()[1]
+        if len(points[0]) and points[0, -1] >= x_max:
+            self.ax.set_xlim(0, max(self.x_min_range, int(points[0, -1] * 1.5))) # room for the next trials
+            changed = True
+
+        low, high = self.ax2.get_ylim()
+        if d_range[0] < low or d_range[1] > high:
+            self.ax2.set_ylim(min(low, d_range[0] - 0.5), max(high, d_range[1] + 0.5)) # Expand limits slightly
+            changed = True
+        return changed
+
+    def refresh(self):
+        """Timer (GUI thread) - draws the points that arrived since the last frame."""
+        points, d_range, version, session = self.data.view()
+        if version == self.drawn_version:
+            return
+        self.drawn_version = version
+
+        trial_numbers, HR, FA, d_prime = points
+        self.line_HR.set_data(trial_numbers, HR)
+        self.line_FA.set_data(trial_numbers, FA)
+        self.line_d.set_data(trial_numbers, d_prime)
+
+        full = session != self.drawn_session or self.background is None
+        if session != self.drawn_session:
+            self.drawn_session = session
+            self.reset_axes()
+        if self.rescale(points, d_range) or full:
+            self.canvas.draw() # on_draw saves the new background and draws the lines
+            return
+
+        self.canvas.restore_region(self.background)
+        self.draw_lines()
+        self.canvas.blit(self.figure.bbox)
+
+    def on_draw(self, event):
+        """After every full draw (new limits, resize): saves the background and draws the lines over it."""
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_lines()
+
+    def draw_lines(self):
+        self.ax.draw_artist(self.line_HR)
+        self.ax.draw_artist(self.line_FA)
+        self.ax2.draw_artist(self.line_d)
@@ -1,75 +1,57 @@
-
-import matplotlib
-matplotlib.use('Qt5Agg')
-
-import sys
-import serial
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QHBoxLayout, QPushButton, QSizePolicy
-from PyQt5.QtCore import QTimer
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from piezo_reader import PiezoReader
-from time import sleep
-
-
-class LivePlotWidget(QWidget):
-    def __init__(self, max_data_points, color='blue', parent=None):
-        super().__init__(parent)
-
-        self.max_data_points = max_data_points
-
-        # Set up the plot figure and canvas
-        self.figure, self.ax = plt.subplots()
-        self.canvas = FigureCanvas(self.figure)
-        
-
-        # Configure plot appearance
-        self.ax.set_xlim(0, self.max_data_points / 60)
-        self.ax.set_ylim(0, 100)
-        self.ax.set_xlabel("Time (s)", labelpad=10)
-        self.ax.set_ylabel("", labelpad=10)
-        self.line, = self.ax.plot([], [], lw=2, color=color) # set line color for the plots
-
-        # Set up layout for the widget
-        layout = QVBoxLayout()
-        layout.addWidget(self.canvas)
-        layout.setContentsMargins(0, 0, 0, 0)  # Remove margins
-        layout.setSpacing(0)  # Remove spacing
-        self.setLayout(layout)
-        
-        #  new!! test to see if it improves layout of the plots
-        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        
-        # Apply tight layout to ensure everything fits 
-        self.figure.tight_layout(pad=2.0)  # Adjust the padding as needed 
-
-        # Initialize data lists for x-axis and y-axis
-        self.x_data = []
-        self.y_data = []
-
-    def update_plot(self, y_data):
-        # Update x and y data for plotting
-        self.x_data = [i / 60 for i in range(len(y_data))]
-        self.y_data = y_data
-
-        # Update the line data
-        self.line.set_data(self.x_data, self.y_data)
-
-        # Redraw the canvas
-        self.ax.relim()
-        self.ax.autoscale_view()  # Update scale if necessary
-        self.canvas.draw()
-        
-
-    def get_last_active_time(self, threshold=1):
-        """
-        Returns the last time (x value) the piezo sensor was active,
-        defined as the last occurrence where y data > threshold.
-        """
-        last_active_time = None
-        # Find last active time
-        for i in reversed(range(len(self.y_data))):
-            if self.y_data[i] > threshold:
-                last_active_time = self.x_data[i]
-                break
-        return last_active_time
\ No newline at end of file
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtWidgets import QVBoxLayout, QWidget, QSizePolicy
+
+# Plain lines are enough for the lick traces (antialiasing costs more than the traces themselves on the Pi)
+pg.setConfigOptions(antialias=False, background='w', foreground='k')
+
+
+class LivePlotWidget(QWidget):
+    """
+    Live piezo trace of one spout (pyqtgraph, no matplotlib redraws)
+    - One PlotDataItem that is updated with setData only: the x values are computed once and the y values are the
+      zero-copy view of the PiezoReader ring buffer, so a frame only repaints the line
+    - The x range is fixed (max_data_points at 60 Hz), the y range follows the data like the old autoscale
+    """
+
+    def __init__(self, max_data_points, color='blue', parent=None):
+        super().__init__(parent)
+
+        self.max_data_points = max_data_points
+        self.x = np.arange(max_data_points) / 60 # Serial runs in 60 Hz
+
+        # Set up the plot
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setMenuEnabled(False)
+        self.plot_widget.setMouseEnabled(x=False, y=False)
+        self.plot_widget.hideButtons()
+
+        plot = self.plot_widget.getPlotItem()
+        plot.setLabel('bottom', "Time (s)")
+        plot.setXRange(0, self.max_data_points / 60, padding=0)
+        plot.setYRange(0, 100)
+        plot.enableAutoRange(axis='y') # Update scale if necessary
+        self.line = plot.plot(pen=pg.mkPen(color, width=2)) # set line color for the plots
+
+        # Set up layout for the widget
+        layout = QVBoxLayout()
+        layout.addWidget(self.plot_widget)
+        layout.setContentsMargins(0, 0, 0, 0)  # Remove margins
+        layout.setSpacing(0)  # Remove spacing
+        self.setLayout(layout)
+        self.plot_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self.y_data = np.zeros(0)
+
+    def update_plot(self, y_data):
+        """Shows the latest samples (oldest first); y_data can be a view of the ring buffer."""
+        self.y_data = y_data
+        self.line.setData(self.x[:len(y_data)], y_data, skipFiniteCheck=True) # integer samples are always finite
+
+    def get_last_active_time(self, threshold=1):
+        """
+        Returns the last time (x value) the piezo sensor was active,
+        defined as the last occurrence where y data > threshold.
+        """
+        active = np.flatnonzero(np.asarray(self.y_data) > threshold)
+        return self.x[active[-1]] if len(active) else None
@@ -1,70 +1,412 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Mon Jan 13 16:46:04 2025
-
-@author: JoanaCatarino
-
-piezo reader  - new file just to test the printing of the piezo info
-"""
-
-
-import serial
-
-class PiezoReader:
-    def __init__(self):
-        self.port = '/dev/ttyACM0'
-        self.baudrate = 115200
-        self.timeout = 1
-        self.packet_size = 6
-        self.max_data_points = 180
-
-        self.ser = None  # Serial connection
-        self.piezo_adder1 = []
-        self.piezo_adder2 = []
-        self.buffer = bytearray()
-        self.running = True
-
-        # Attempt to set up the serial connection on initialization
-        self.setup_serial_connection()
-
-    def setup_serial_connection(self):
-        """Set up the serial connection."""
-        try:
-            self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
-            print(f"Serial connection established on {self.port}")
-        except serial.SerialException as e:
-            self.ser = None
-            print(f"Failed to connect to serial port: {e}")
-
-    def read_serial_data(self):
-        """Reads data from the serial port and updates the buffer."""
-        if not self.ser or not self.ser.is_open:
-            print("Serial connection is not open. Cannot read data.")
-            return
-
-        try:
-            bytes_to_read = self.packet_size * 10
-            self.buffer.extend(self.ser.read(bytes_to_read))
-
-            while len(self.buffer) >= self.packet_size:
-                if self.buffer[0] == 0x7F and self.buffer[5] == 0x80:
-                    self.piezo_adder1.append(self.buffer[1]* 10) # multiply by 10 to amplify signal
-                    self.piezo_adder2.append(self.buffer[3]* 10)
-                    
-                    if len(self.piezo_adder1) > self.max_data_points:
-                        self.piezo_adder1.pop(0)
-                    if len(self.piezo_adder2) > self.max_data_points:
-                        self.piezo_adder2.pop(0)
-
-                    self.buffer = self.buffer[self.packet_size:]
-                else:
-                    self.buffer.pop(0)
-        except serial.SerialException as e:
-            print(f"Serial error: {e}")
-
-    def close_connection(self):
-        """Close the serial connection."""
-        if self.ser and self.ser.is_open:
-            self.ser.close()
-            print("Serial connection closed.")
-
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Jan 13 16:46:04 2025
+
+@author: JoanaCatarino
+
+Piezo reader
+- Owns the serial connection to the Arduino and reads the 60 Hz piezo stream in a background acquisition thread
+- Packets are 6 bytes: 0x7F (start), adder1, bool1, adder2, bool2, 0x80 (end)
+- Samples are written into a preallocated ring buffer with a sample counter that never wraps
+- Readers (tasks and live plots) get zero-copy views of the latest samples, so lick detection does not depend on the GUI timer
+- Every sample has a host arrival time (time.monotonic_ns), interpolated per packet inside each read burst,
+  so the time of a sample can be looked up from its index instead of being guessed from the buffer length
+- Tracks how long each spout has been quiet (see quiet_window.py), updated per burst
+- Publishes lick events (threshold crossings per spout) that task threads can block on instead of polling the buffers,
+  and touch events (any contact: first sample > 0) for the response windows that do not depend on the lick amplitude
+- Optionally records every decoded packet to a raw binary file (see piezo_recorder.py) from the acquisition thread
+"""
+
+
+import os
+import threading
+import time
+from collections import deque, namedtuple
+import numpy as np
+import serial
+from piezo_recorder import PiezoRecorder
+from quiet_window import QuietWindowTracker
+
+# One lick (kind 'lick') = the first sample of a spout above its threshold after a sample that was not.
+# One touch (kind 'touch') = the first sample of a spout above 0 after a sample at 0 (amplitude-independent).
+# seq numbers every event since the reader started, time is on the wall clock (same base as time.time())
+LickEvent = namedtuple('LickEvent', ['seq', 'side', 'sample_index', 't_ns', 'time', 'kind'])
+
+class PiezoReader:
+    def __init__(self, port=None):
+        if port is None and os.environ.get('TASKGUI_SIMULATION', '0') == '1':
+            from simulation import start_fake_arduino # simulated Arduino on a pty without the rig (pty/tty are POSIX only)
+            port = start_fake_arduino()
+        self.port = port or '/dev/ttyACM0'
+        self.baudrate = 115200
+        self.timeout = 1
+        self.packet_size = 6
+        self.max_data_points = 180 # samples shown in the live plots (3 s at 60 Hz)
+        self.capacity = 4096 # samples kept in the ring buffer (~68 s at 60 Hz)
+        self.sample_rate = 60 # Hz - one packet every 20 cycles of the 1200 Hz loop in the Arduino
+        self.sample_period_ns = 1_000_000_000 // self.sample_rate
+
+        self.ser = None  # Serial connection
+
+        # Receive buffer for raw serial bytes - framed in place, only the unframed tail (< 1 packet) is ever moved
+        self.rx_size = 64 * 1024 # bytes (~18 s of backlog at 60 packets/s)
+        self._rx = np.zeros(self.rx_size, dtype=np.uint8)
+        self._rx_view = memoryview(self._rx)
+        self._rx_start = 0 # first byte that is not framed yet
+        self._rx_fill = 0 # end of the received bytes
+        self.running = False
+        self.acquisition_thread = None
+
+        # Ring buffer - every sample is written twice (at i and i + capacity) so the latest n samples
+        # are always one contiguous slice and can be handed out as a view without copying
+        self._adder1 = np.zeros(2 * self.capacity, dtype=np.uint16)
+        self._adder2 = np.zeros(2 * self.capacity, dtype=np.uint16)
+        self._stamps = np.zeros(2 * self.capacity, dtype=np.int64) # host arrival time of each sample (monotonic ns)
+        self.sample_count = 0 # total number of samples received (never wraps)
+        self.last_stamp = 0 # arrival time of the newest sample
+        self.recorder = None # PiezoRecorder while a session is being recorded
+
+        # Lick events - set_thresholds() is called by the running task (and when the thresholds change in the GUI)
+        self.threshold_left = 1
+        self.threshold_right = 1
+        self.lick_events = deque(maxlen=1024) # latest events, oldest first
+        self.lick_seq = 0 # seq of the newest event (0 = none yet)
+        self.lick_condition = threading.Condition() # notified when new events arrive
+        self.wake_count = 0 # bumped by release_waiters() to wake blocked tasks (e.g. on stop)
+
+        # Samples since the last sample at/above threshold on each spout (quiet windows)
+        self.quiet = QuietWindowTracker(self.threshold_left, self.threshold_right)
+
+        # Anchor to convert monotonic sample times into wall-clock times (time.time) used by the tasks
+        self.wall_anchor = time.time()
+        self.mono_anchor = time.monotonic_ns()
+
+        # Attempt to set up the serial connection on initialization
+        self.setup_serial_connection()
+
+        # Start reading in the background as soon as the Arduino is connected
+        self.start()
+
+    def setup_serial_connection(self):
+        """Set up the serial connection."""
+        try:
+            self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+            print(f"Serial connection established on {self.port}")
+        except serial.SerialException as e:
+            self.ser = None
+            print(f"Failed to connect to serial port: {e}")
+
+    def start(self):
+        """Start the acquisition thread (only one runs at a time)."""
+        if not self.ser or not self.ser.is_open:
+            print("Serial connection is not open. Piezo acquisition not started.")
+            return
+
+        if self.acquisition_thread and self.acquisition_thread.is_alive():
+            return
+
+        self.running = True
+        self.acquisition_thread = threading.Thread(target=self.acquisition_loop, daemon=True)
+        self.acquisition_thread.start()
+
+    def stop(self):
+        """Stop the acquisition thread."""
+        self.running = False
+        if self.acquisition_thread and self.acquisition_thread.is_alive():
+            self.acquisition_thread.join(timeout=2 * self.timeout)
+        self.acquisition_thread = None
+
+    def acquisition_loop(self):
+        """Acquisition thread - blocks on the serial port until data arrives, so no GUI timer is needed."""
+        while self.running:
+            self.read_serial_data()
+
+    def read_serial_data(self):
+        """Reads data from the serial port and appends the decoded packets to the ring buffer."""
+        if not self.ser or not self.ser.is_open:
+            print("Serial connection is not open. Cannot read data.")
+            self.running = False
+            return
+
+        try:
+            # Make room at the end of the receive buffer by moving the unframed tail to the front
+            if self._rx_fill + self.packet_size > self.rx_size:
+                tail = self._rx_fill - self._rx_start
+                self._rx[:tail] = self._rx[self._rx_start:self._rx_fill]
+                self._rx_start, self._rx_fill = 0, tail
+
+            # Wait for at least one packet, then take everything that is already waiting (as much as fits)
+            bytes_to_read = min(max(self.packet_size, self.ser.in_waiting), self.rx_size - self._rx_fill)
+            n_read = self.ser.readinto(self._rx_view[self._rx_fill:self._rx_fill + bytes_to_read])
+            t_read = time.monotonic_ns() # arrival time of the newest packet in this burst
+            self._rx_fill += n_read or 0
+
+            adder1, adder2, bool1, bool2 = self.frame_packets()
+            stamps = self.burst_stamps(len(adder1), t_read)
+
+            recorder = self.recorder
+            if recorder is not None:
+                recorder.write(self.sample_count, stamps, adder1, adder2, bool1, bool2)
+
+            self.ingest(adder1, adder2, stamps)
+
+        except serial.SerialException as e:
+            print(f"Serial error: {e}")
+            self.running = False
+
+    def ingest(self, adder1, adder2, stamps):
+        """Adds one burst of decoded samples: ring buffer, quiet windows and lick events (also used by the replay)."""
+        first_index = self.sample_count
+        previous = self.latest_values() # last samples before this burst
+        self.append_samples(adder1, adder2, stamps)
+        self.quiet.update(first_index, adder1, adder2)
+        self.publish_licks(first_index, adder1, adder2, stamps, previous)
+
+    def frame_packets(self):
+        """
+        Finds every complete packet (0x7F ... 0x80) in the unframed bytes in one NumPy pass and returns (adder1, adder2, bool1, bool2).
+        Bytes that cannot belong to a packet are skipped, like the old byte-by-byte loop, and the read offset
+        is advanced past everything that was framed; at most packet_size - 1 bytes are left for the next read.
+        """
+        size = self.packet_size
+        data = self._rx[self._rx_start:self._rx_fill]
+        n_candidates = len(data) - size + 1
+        if n_candidates <= 0:
+            empty = np.zeros(0, dtype=np.uint16)
+            return empty, empty, self._rx[:0], self._rx[:0]
+
+        # Positions where both the start and the end byte match
+        starts = np.flatnonzero((data[:n_candidates] == 0x7F) & (data[size - 1:] == 0x80))
+
+        # Keep packets that do not overlap the previous one (rare - only when a data byte looks like a start byte)
+        if starts.size > 1 and np.any(np.diff(starts) < size):
+            keep = []
+            next_free = 0
+            for start in starts.tolist():
+                if start >= next_free:
+                    keep.append(start)
+                    next_free = start + size
+            starts = np.array(keep, dtype=np.intp)
+
+        k = starts.size
+        if k and starts[-1] - starts[0] == size * (k - 1):
+            # Back-to-back packets (the normal case) - strided views of the adder columns, no fancy indexing
+            packets = data[starts[0]:starts[0] + size * k].reshape(k, size)
+            raw1, bool1, raw2, bool2 = packets[:, 1], packets[:, 2], packets[:, 3], packets[:, 4]
+        else:
+            raw1, bool1, raw2, bool2 = data[starts + 1], data[starts + 2], data[starts + 3], data[starts + 4]
+
+        # Everything up to the end of the last packet, and any byte that is too far back to start a new one, is done
+        consumed = max(int(starts[-1]) + size if k else 0, n_candidates)
+        self._rx_start += consumed
+
+        # bool1/bool2 may be views of the receive buffer - only valid until the next read
+        return raw1.astype(np.uint16) * 10, raw2.astype(np.uint16) * 10, bool1, bool2 # multiply by 10 to amplify signal
+
+    def burst_stamps(self, n, t_read):
+        """
+        Arrival times for the n packets of one read burst (the last one arrived at t_read).
+        Packets are spaced by the 60 Hz sample period going back from t_read; if that would overlap the previous
+        burst (backlog after a stall), they are spread evenly between the previous stamp and t_read instead.
+        """
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        first = t_read - (n - 1) * self.sample_period_ns
+        if first > self.last_stamp:
+            return first + self.sample_period_ns * np.arange(n, dtype=np.int64)
+
+        return self.last_stamp + (t_read - self.last_stamp) * np.arange(1, n + 1, dtype=np.int64) // n
+
+    def append_samples(self, adder1, adder2, stamps):
+        """
+        Writes a burst of samples and their arrival times into the ring buffer.
+        Only the acquisition thread writes, and the counter is advanced after the data,
+        so readers never see a sample that is not written yet.
+        """
+        n = len(adder1)
+        if n == 0:
+            return
+
+        # A burst longer than the ring can only keep its tail
+        skipped = max(0, n - self.capacity)
+        if skipped:
+            adder1 = adder1[skipped:]
+            adder2 = adder2[skipped:]
+            stamps = stamps[skipped:]
+            n = self.capacity
+
+        first = self.sample_count + skipped
+        idx = (first + np.arange(n)) % self.capacity
+        self._adder1[idx] = adder1
+        self._adder1[idx + self.capacity] = adder1
+        self._adder2[idx] = adder2
+        self._adder2[idx + self.capacity] = adder2
+        self._stamps[idx] = stamps
+        self._stamps[idx + self.capacity] = stamps
+
+        self.last_stamp = int(stamps[-1])
+        self.sample_count = first + n
+
+    def set_thresholds(self, threshold_left, threshold_right):
+        """
+        Per-spout thresholds: a lick is a sample > threshold, a spout is quiet while its samples are < threshold
+        (same as the tasks use). Can be changed at any time, the quiet windows are recomputed from the ring buffer.
+        """
+        self.threshold_left = threshold_left
+        self.threshold_right = threshold_right
+        self.quiet.set_thresholds(threshold_left, threshold_right, lambda: self.snapshot(self.capacity)[:3])
+
+    def quiet_samples(self):
+        """Number of samples since the last sample at/above threshold on either spout (O(1))."""
+        return self.quiet.quiet_samples()
+
+    def latest_above(self):
+        """(left, right): is the newest sample above the lick threshold of each spout."""
+        if self.sample_count == 0:
+            return False, False
+        i = (self.sample_count - 1) % self.capacity
+        return bool(self._adder1[i] > self.threshold_left), bool(self._adder2[i] > self.threshold_right)
+
+    def latest_values(self):
+        """(left, right) of the newest sample (0, 0 before the first one)."""
+        if self.sample_count == 0:
+            return 0, 0
+        i = (self.sample_count - 1) % self.capacity
+        return int(self._adder1[i]), int(self._adder2[i])
+
+    def publish_licks(self, first_index, adder1, adder2, stamps, previous):
+        """
+        Finds the touches (> 0) and the threshold crossings of one burst (vectorized, per spout and kind) and wakes
+        the waiting tasks. previous is the (left, right) sample before the burst.
+        """
+        if len(adder1) == 0:
+            return
+
+        new_events = []
+        for side, values, threshold, last in (('left', adder1, self.threshold_left, previous[0]),
+                                              ('right', adder2, self.threshold_right, previous[1])):
+            values = np.concatenate(([last], values))
+            for kind, level in (('touch', 0), ('lick', threshold)):
+                above = values > level
+                rising = np.flatnonzero(above[1:] & ~above[:-1])
+                for i in rising.tolist():
+                    new_events.append((int(stamps[i]), kind == 'lick', side, first_index + i, kind))
+
+        if not new_events:
+            return
+
+        new_events.sort() # both spouts in the order they happened (a touch before the lick of the same sample)
+        with self.lick_condition:
+            for t_ns, _, side, index, kind in new_events:
+                self.lick_seq += 1
+                self.lick_events.append(LickEvent(self.lick_seq, side, index, t_ns, self.wall_time(t_ns), kind))
+            self.lick_condition.notify_all()
+
+    def lick_cursor(self):
+        """seq of the newest lick event - pass it to wait_for_lick() to only get licks from now on."""
+        return self.lick_seq
+
+    def wait_for_lick(self, cursor, timeout=None):
+        """
+        Blocks until there is a lick event newer than `cursor` and returns the first one (oldest first), or None
+        after `timeout` seconds or when release_waiters() is called. Each caller keeps its own cursor
+        (cursor = event.seq after handling an event), so several threads can follow the same events.
+        Touches and licks come in the same stream - callers pick the kind they need (event.kind).
+        """
+        deadline = None if timeout is None else time.monotonic() + max(0.0, timeout)
+        with self.lick_condition:
+            wake_count = self.wake_count
+            while self.lick_seq <= cursor:
+                if self.wake_count != wake_count:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.lick_condition.wait(remaining)
+
+            # Events older than the deque were dropped - return the oldest one still kept
+            for event in self.lick_events:
+                if event.seq > cursor:
+                    return event
+        return None
+
+    def release_waiters(self):
+        """Wakes every thread blocked in wait_for_lick() (they return None) - used when a task stops."""
+        with self.lick_condition:
+            self.wake_count += 1
+            self.lick_condition.notify_all()
+
+    def snapshot(self, n):
+        """
+        Returns (start_index, left, right, stamps) for the latest n samples, oldest first.
+        start_index is the stream index of the first sample, so sample i of the views is stream index start_index + i.
+        The arrays are zero-copy views; they are overwritten when the ring wraps (~68 s later), so copy them if they need to be kept.
+        """
+        count = self.sample_count
+        n = max(0, min(int(n), count, self.capacity))
+        end = count % self.capacity + self.capacity
+        return count - n, self._adder1[end - n:end], self._adder2[end - n:end], self._stamps[end - n:end]
+
+    def latest(self, n):
+        """Returns zero-copy views (left, right) of the latest n samples, oldest first."""
+        _, adder1, adder2, _ = self.snapshot(n)
+        return adder1, adder2
+
+    def sample_time_ns(self, index):
+        """Host arrival time (monotonic ns) of the sample with stream index `index`, or None if it is no longer in the ring."""
+        if not (self.sample_count - self.capacity <= index < self.sample_count) or index < 0:
+            return None
+        return int(self._stamps[index % self.capacity])
+
+    def sample_time(self, index):
+        """Arrival time of the sample with stream index `index` on the wall clock (same base as time.time()), or None."""
+        t_ns = self.sample_time_ns(index)
+        if t_ns is None:
+            return None
+        return self.wall_time(t_ns)
+
+    def wall_time(self, t_ns):
+        """Converts a monotonic sample time (ns) to the wall clock."""
+        return self.wall_anchor + (t_ns - self.mono_anchor) / 1e9
+
+    @property
+    def piezo_adder1(self):
+        """Latest max_data_points samples of the left piezo."""
+        return self.latest(self.max_data_points)[0]
+
+    @property
+    def piezo_adder2(self):
+        """Latest max_data_points samples of the right piezo."""
+        return self.latest(self.max_data_points)[1]
+
+    def latest_sample_time_ns(self):
+        """Arrival time (monotonic ns) of the newest sample, or None if nothing was received yet."""
+        return self.sample_time_ns(self.sample_count - 1)
+
+    def latest_sample_time(self):
+        """Wall-clock arrival time of the newest sample, or None if nothing was received yet."""
+        return self.sample_time(self.sample_count - 1)
+
+    def start_recording(self, file_path):
+        """Start saving the raw stream to file_path (replaces any recording that is still open)."""
+        self.stop_recording()
+        try:
+            self.recorder = PiezoRecorder(file_path)
+        except OSError as e:
+            self.recorder = None
+            print(f"Could not start raw piezo recording: {e}")
+
+    def stop_recording(self):
+        """Stop saving the raw stream and close the file."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.close()
+
+    def close_connection(self):
+        """Close the serial connection."""
+        self.stop()
+        self.stop_recording()
+        if self.ser and self.ser.is_open:
+            self.ser.close()
+            print("Serial connection closed.")
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 10:12:41 2026
+
+@author: JoanaCatarino
+
+Raw piezo recorder
+- Saves every decoded piezo packet of a session to a binary file next to the session csv (<session>_piezo.bin)
+- One fixed-size record per packet: sample index, host arrival time (monotonic ns), both adders and both bool bytes
+- The file is preallocated and memory-mapped; the acquisition thread writes whole bursts with NumPy slices,
+  so nothing is allocated per sample. 22 bytes per sample is ~4.8 MB per hour at 60 Hz
+- When the recording is closed the file is truncated to the samples that were actually written
+- Load a recording with load_piezo_recording(path)
+"""
+
+import os
+import threading
+import numpy as np
+
+# Layout of one record (little endian, no padding)
+RECORD_DTYPE = np.dtype([
+    ('sample', '<u8'), # stream index of the sample (counts every packet since the reader started)
+    ('t_ns', '<i8'), # host arrival time, time.monotonic_ns()
+    ('adder1', '<u2'), # left piezo (x10, same as PiezoReader)
+    ('adder2', '<u2'), # right piezo (x10)
+    ('bool1', 'u1'), # left piezo active flag sent by the Arduino
+    ('bool2', 'u1'), # right piezo active flag
+    ])
+
+
+def raw_piezo_path(csv_file_path):
+    """Path of the raw piezo file that belongs to a session csv."""
+    return os.path.splitext(csv_file_path)[0] + '_piezo.bin'
+
+
+def load_piezo_recording(path):
+    """Reads a raw piezo recording into a structured array (fields as in RECORD_DTYPE)."""
+    return np.fromfile(path, dtype=RECORD_DTYPE)
+
+
+class PiezoRecorder:
+    def __init__(self, file_path, chunk_samples=60*60*60):
+        self.file_path = file_path
+        self.chunk_samples = chunk_samples # preallocate one hour at a time
+        self.n_written = 0
+        self.lock = threading.Lock() # write() runs in the acquisition thread, close() in the GUI thread
+
+        self.file = open(self.file_path, 'w+b')
+        self.records = None
+        self.grow(self.chunk_samples)
+        print(f"Recording raw piezo stream to {self.file_path}")
+
+    def grow(self, n_samples):
+        """Extends the file to hold n_samples records and maps it again."""
+        if self.records is not None:
+            self.records.flush()
+            self.records = None
+        self.file.truncate(n_samples * RECORD_DTYPE.itemsize)
+        self.records = np.memmap(self.file, dtype=RECORD_DTYPE, mode='r+', shape=(n_samples,))
+
+    def write(self, first_sample, stamps, adder1, adder2, bool1, bool2):
+        """Appends one burst of samples (arrays of equal length) - called from the acquisition thread."""
+        n = len(stamps)
+        if n == 0:
+            return
+
+        with self.lock:
+            if self.records is None:
+                return
+
+            if self.n_written + n > len(self.records):
+                self.grow(len(self.records) + max(n, self.chunk_samples))
+
+            block = self.records[self.n_written:self.n_written + n]
+            block['sample'] = np.arange(first_sample, first_sample + n, dtype=np.uint64)
+            block['t_ns'] = stamps
+            block['adder1'] = adder1
+            block['adder2'] = adder2
+            block['bool1'] = bool1
+            block['bool2'] = bool2
+            self.n_written += n
+
+    def close(self):
+        """Flushes the data and trims the preallocated space that was not used."""
+        with self.lock:
+            if self.records is None:
+                return
+            self.records.flush()
+            self.records = None
+            self.file.truncate(self.n_written * RECORD_DTYPE.itemsize)
+            self.file.close()
+        print(f"Raw piezo recording closed: {self.n_written} samples")
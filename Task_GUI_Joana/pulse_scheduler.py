@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:02:14 2026
+
+@author: JoanaCatarino
+
+Pulse scheduler - timed on/off pulses on the GPIO outputs (valves, TTLs, LEDs)
+- pulse(device, duration) sets the device for `duration` seconds and returns right away with a Pulse handle;
+  value=0 is for the devices that are active low (pumps: off() opens the valve), e.g. pulse(pump_l, 0.08, value=0)
+- pulse(..., at_ns=t) starts the pulse later, at t on time.monotonic_ns(): the caller only queues it and the timing
+  thread sets both edges (e.g. the TTL of a cue, which has to start with the sound and not when the buffer is handed over)
+- Where gpiozero runs on lgpio (Raspberry Pi 5) or pigpio, the pulse is sent as a waveform, so both edges are timed
+  by lgpio/pigpio with microsecond resolution and not by Python. Otherwise (mock pins, RPi.GPIO, a pigpio wave
+  that is already busy) the pulse falls back to the timing thread
+- The timing thread is one persistent thread with real-time priority (SCHED_FIFO, when the OS allows it): it sleeps
+  until just before the end of the pulse and spins on time.monotonic_ns() for the last ms, so the width does not depend
+  on when the OS wakes up a sleeping thread. It only ends pulses: finished pulses go on a queue, and a worker thread
+  writes them to the log and runs their callbacks, so a slow callback never delays the next edge
+- Every pulse reports its width (Pulse.width): measured for the thread backend (the time between the two writes),
+  planned for the waveforms (the width programmed in lgpio/pigpio - their edges are not read back, Pulse.measured is
+  False). With start_log(path) every pulse is written to <session>_pulses.csv (measured_width empty when planned)
+- pulse_train(device, width, period, count) runs a train on its own thread: the onset of pulse i is due at
+  t0 + i*period on the monotonic clock (no drift from the time spent in the loop) and every pulse is a pulse() of the
+  scheduler. The planned and actual edges of every pulse are kept in PulseTrain.edges and written to log_path
+  (the actual off edge of a waveform pulse is the planned one - 'measured' column 0)
+"""
+
+import os
+import time
+import heapq
+import queue
+import threading
+from gpiozero import Device
+
+try:
+    import lgpio
+except ImportError:
+    lgpio = None
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
+
+def set_realtime_priority(name):
+    """Gives the calling thread real-time priority (SCHED_FIFO) if the OS allows it."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+    except (AttributeError, PermissionError, OSError):
+        print(f"{name}: no real-time priority (run as root or give CAP_SYS_NICE for tighter pulses)")
+
+
+def sleep_until(deadline, stopped=None, spin=0.001):
+    """Sleeps until deadline (time.monotonic_ns()), spinning for the last `spin` seconds; False if stopped was set."""
+    remaining = deadline - time.monotonic_ns() - int(spin * 1e9)
+    if remaining > 0:
+        if stopped is not None:
+            if stopped.wait(remaining / 1e9):
+                return False
+        else:
+            time.sleep(remaining / 1e9)
+    while time.monotonic_ns() < deadline:
+        pass
+    return stopped is None or not stopped.is_set()
+
+
+def pulse_log_path(csv_file_path, kind='pulses'):
+    """Path of a pulse log that belongs to a session csv: <session>_pulses.csv, or <session>_<kind>.csv (e.g. a laser train)."""
+    return os.path.splitext(csv_file_path)[0] + f'_{kind}.csv'
+
+
+class Pulse:
+    """
+    One pulse on one device. onset_time is on the wall clock (time.time()). width is in seconds: measured for the
+    timing thread, the planned width for waveforms (measured tells which).
+    """
+
+    def __init__(self, device, duration, value, name, callback):
+        self.device = device
+        self.duration = duration # planned width (s)
+        self.value = value # device value during the pulse (1 = on)
+        self.name = name
+        self.callback = callback # called with the Pulse when it is over (from the worker thread)
+        self.backend = None # 'lgpio', 'pigpio' or 'thread'
+        self.onset_time = None
+        self.t_on_ns = None # time.monotonic_ns() of the first edge
+        self.t_off_ns = None # time.monotonic_ns() of the second edge
+        self.width = None
+        self.measured = False # True if width (and t_off_ns) were measured, False if they are the planned ones
+        self.done = threading.Event()
+
+    def wait(self, timeout=None):
+        """Blocks until the pulse is over; returns its width (see measured)."""
+        self.done.wait(timeout)
+        return self.width
+
+
+class PulseScheduler:
+    def __init__(self, spin=0.001):
+        self.spin_ns = int(spin * 1e9) # last part of a pulse that is timed by spinning instead of sleeping
+        self.pending = [] # heap of (edge time in monotonic ns, seq, Pulse, 'on' or 'off')
+        self.seq = 0
+        self.active = {} # id(device) -> last pulse started on the device (its end is the one that counts)
+        self.cond = threading.Condition()
+        self.thread = None
+        self.finished = queue.Queue() # pulses that are over, for the worker (log + callbacks)
+        self.worker = None
+        self.log_file = None
+        self.log_lock = threading.Lock()
+        self.names = None
+
+    # Backends
+
+    def pin_level(self, device, value):
+        return value if getattr(device, 'active_high', True) else 1 - value
+
+    def send_lgpio(self, device, duration, value):
+        pin = device.pin
+        handle, gpio = pin.factory._handle, pin._number
+        level = self.pin_level(device, value)
+        pulses = [lgpio.pulse(level, 1, int(duration * 1e6)), lgpio.pulse(1 - level, 1, 0)]
+        return lgpio.tx_wave(handle, gpio, pulses) >= 0
+
+    def send_pigpio(self, device, duration, value):
+        pin = device.pin
+        pi, mask = pin.factory.connection, 1 << pin._number
+        if pi.wave_tx_busy():
+            return False # pigpio plays one wave at a time
+        on, off = (mask, 0) if self.pin_level(device, value) else (0, mask)
+        pi.wave_clear()
+        pi.wave_add_generic([pigpio.pulse(on, off, int(duration * 1e6)), pigpio.pulse(off, on, 0)])
+        return pi.wave_send_once(pi.wave_create()) >= 0
+
+    def send_hardware(self, device, duration, value):
+        """Sends the pulse as a waveform if the pin factory can; returns the backend name or None."""
+        factory = type(getattr(device.pin, 'factory', None) or Device.pin_factory).__name__
+        try:
+            if factory == 'LGPIOFactory' and lgpio is not None and self.send_lgpio(device, duration, value):
+                return 'lgpio'
+            if factory == 'PiGPIOFactory' and pigpio is not None and self.send_pigpio(device, duration, value):
+                return 'pigpio'
+        except Exception as e:
+            print(f"Waveform pulse failed ({e}) - using the timing thread")
+        return None
+
+    def set_device(self, device, value):
+        if value:
+            device.on()
+        else:
+            device.off()
+
+    # Pulses
+
+    def pulse(self, device, duration, value=1, callback=None, name=None, at_ns=None):
+        """Sets device to value for duration seconds (then back); returns the Pulse without waiting.
+        With at_ns the pulse starts at that time.monotonic_ns() instead of now (set by the timing thread)."""
+        self.start()
+        pulse = Pulse(device, duration, value, name or self.device_name(device), callback)
+        if at_ns is None:
+            self.begin(pulse)
+        else:
+            self.push(at_ns, pulse, 'on')
+        return pulse
+
+    def begin(self, pulse):
+        """First edge of a pulse; queues the second one."""
+        pulse.backend = self.send_hardware(pulse.device, pulse.duration, pulse.value) or 'thread'
+        pulse.t_on_ns = time.monotonic_ns()
+        pulse.onset_time = time.time()
+        if pulse.backend == 'thread':
+            self.set_device(pulse.device, pulse.value)
+
+        with self.cond:
+            self.active[id(pulse.device)] = pulse
+        self.push(pulse.t_on_ns + int(pulse.duration * 1e9), pulse, 'off')
+
+    def push(self, deadline, pulse, edge):
+        with self.cond:
+            self.seq += 1
+            heapq.heappush(self.pending, (deadline, self.seq, pulse, edge))
+            self.cond.notify()
+
+    def start(self):
+        if self.thread is None:
+            with self.cond:
+                if self.thread is None:
+                    self.worker = threading.Thread(target=self.work, daemon=True)
+                    self.worker.start()
+                    self.thread = threading.Thread(target=self.loop, daemon=True)
+                    self.thread.start()
+
+    def loop(self):
+        """Timing thread - starts the delayed pulses and ends all of them at their deadline."""
+        set_realtime_priority('Pulse scheduler')
+
+        while True:
+            with self.cond:
+                while not self.pending:
+                    self.cond.wait()
+                deadline, _, pulse, edge = self.pending[0]
+                remaining = deadline - time.monotonic_ns()
+                if remaining > self.spin_ns:
+                    self.cond.wait((remaining - self.spin_ns) / 1e9) # a new pulse may end earlier
+                    continue
+                heapq.heappop(self.pending)
+
+            while time.monotonic_ns() < deadline:
+                pass
+            if edge == 'on':
+                self.begin(pulse)
+            else:
+                self.finish(pulse)
+
+    def finish(self, pulse):
+        with self.cond:
+            last = self.active.get(id(pulse.device)) is pulse
+            if last:
+                del self.active[id(pulse.device)]
+
+        if pulse.backend == 'thread':
+            if last: # a newer pulse on the same device keeps it set until that one ends
+                self.set_device(pulse.device, 1 - pulse.value)
+            pulse.t_off_ns = time.monotonic_ns()
+            pulse.width = (pulse.t_off_ns - pulse.t_on_ns) / 1e9
+            pulse.measured = True
+        else:
+            # Edges timed by lgpio/pigpio and not read back: the off edge and the width are the planned ones
+            pulse.t_off_ns = pulse.t_on_ns + int(pulse.duration * 1e9)
+            pulse.width = pulse.duration
+        pulse.done.set()
+        self.finished.put(pulse) # log and callback on the worker - the timing thread goes straight back to the next edge
+
+    def work(self):
+        """Worker thread - writes the finished pulses to the log and runs their callbacks."""
+        while True:
+            pulse = self.finished.get()
+            self.log(pulse)
+            if pulse.callback is not None:
+                try:
+                    pulse.callback(pulse)
+                except Exception as e:
+                    print(f"Error in pulse callback: {e}")
+
+    # Session log
+
+    def device_name(self, device):
+        if self.names is None:
+            import gpio_map
+            self.names = {id(getattr(gpio_map, name)): name for name in gpio_map.__all__}
+        return self.names.get(id(device), str(device))
+
+    def start_log(self, file_path):
+        """Writes every pulse from now on to file_path (csv)."""
+        self.stop_log()
+        with self.log_lock:
+            self.log_file = open(file_path, 'w')
+            self.log_file.write('device,value,planned_width,measured_width,onset_time,backend\n')
+
+    def stop_log(self):
+        with self.log_lock:
+            if self.log_file is not None:
+                self.log_file.close()
+                self.log_file = None
+
+    def log(self, pulse):
+        with self.log_lock:
+            if self.log_file is not None:
+                measured = f'{pulse.width:.6f}' if pulse.measured else '' # waveforms: only the planned width
+                self.log_file.write(f'{pulse.name},{pulse.value},{pulse.duration:.6f},{measured},{pulse.onset_time:.6f},{pulse.backend}\n')
+                self.log_file.flush()
+
+
+# One scheduler for the whole program
+pulse_scheduler = PulseScheduler()
+
+
+def pulse(device, duration, value=1, callback=None, name=None):
+    """Pulses a GPIO output for duration seconds without blocking; returns the Pulse (see PulseScheduler.pulse)."""
+    return pulse_scheduler.pulse(device, duration, value, callback, name)
+
+
+class PulseTrain:
+    """count pulses of width seconds, one every period seconds; onsets are absolute deadlines from the first one."""
+
+    def __init__(self, device, width, period, count, value=1, label='', callback=None, log_path=None):
+        if not (0 < width < period):
+            raise ValueError("Invalid timing: ensure 0 < width < period.")
+        self.device = device
+        self.width = width
+        self.period = period
+        self.count = count
+        self.value = value
+        self.label = label # printed with every pulse (e.g. "10 ms block")
+        self.callback = callback # called with the PulseTrain when it is over (also when stopped)
+        self.log_path = log_path
+        self.edges = [] # per pulse: (index, planned on, actual on, planned off, actual off, measured) in monotonic ns
+        self.stopped = threading.Event()
+        self.done = threading.Event()
+        self.thread = None
+
+    def start(self, delay=0):
+        self.thread = threading.Thread(target=self.run, args=(delay,), daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stops the train after the pulse that is playing."""
+        self.stopped.set()
+
+    def wait(self, timeout=None):
+        self.done.wait(timeout)
+        return self.edges
+
+    def run(self, delay):
+        set_realtime_priority('Pulse train')
+        period, width = int(self.period * 1e9), int(self.width * 1e9)
+        t0 = time.monotonic_ns() + int(delay * 1e9)
+
+        pulses = []
+        for i in range(self.count):
+            planned_on = t0 + i * period
+            if not sleep_until(planned_on, self.stopped):
+                break
+            pulses.append((i, planned_on, pulse_scheduler.pulse(self.device, self.width, self.value)))
+            if self.label:
+                print(f"{self.label}: pulse {i+1}/{self.count}")
+
+        for i, planned_on, p in pulses:
+            p.wait()
+            self.edges.append((i, planned_on, p.t_on_ns, planned_on + width, p.t_off_ns, p.measured))
+
+        self.report()
+        self.done.set()
+        if self.callback is not None:
+            self.callback(self)
+
+    def report(self):
+        """Prints the timing errors of the train and writes every edge to log_path."""
+        if not self.edges:
+            return
+        edges = self.edges
+        onset_errors = [(on - planned_on) / 1e6 for _, planned_on, on, _, _, _ in edges]
+        widths = [(off - on) / 1e6 for _, _, on, _, off, measured in edges if measured]
+        width = f"width {min(widths):.3f}-{max(widths):.3f} ms" if widths else "width not measured (waveforms)"
+        print(f"{len(edges)} pulses: onset error mean {sum(onset_errors)/len(edges):.3f} ms, max {max(onset_errors):.3f} ms; "
+              f"{width} (planned {self.width*1000:.3f} ms)")
+
+        if self.log_path:
+            t0 = edges[0][1]
+            with open(self.log_path, 'w') as f:
+                f.write('pulse,planned_on,actual_on,planned_off,actual_off,measured\n') # seconds from the first planned onset
+                for i, planned_on, on, planned_off, off, measured in edges:
+                    f.write(f'{i+1},{(planned_on-t0)/1e9:.6f},{(on-t0)/1e9:.6f},{(planned_off-t0)/1e9:.6f},{(off-t0)/1e9:.6f},{int(measured)}\n')
+
+
+def pulse_train(device, width, period, count, value=1, label='', callback=None, log_path=None, delay=0):
+    """Starts a PulseTrain on its own thread and returns it without waiting."""
+    return PulseTrain(device, width, period, count, value, label, callback, log_path).start(delay)
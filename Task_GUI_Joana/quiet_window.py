@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:41:27 2026
+
+@author: JoanaCatarino
+
+Quiet window tracker
+- Keeps, for each spout, the stream index of the last sample at or above its threshold
+  (the animal is quiet on a spout while its samples stay below the threshold)
+- Updated by the PiezoReader once per read burst, so asking "has the animal been quiet for N samples"
+  is one subtraction and one comparison instead of a max() over the last QW seconds of the buffer
+- When a threshold changes the last active sample is looked up again in the samples that are still in the ring buffer
+"""
+
+import threading
+import numpy as np
+
+
+class QuietWindowTracker:
+    def __init__(self, threshold_left=1, threshold_right=1):
+        self.threshold_left = threshold_left
+        self.threshold_right = threshold_right
+        self.last_active_left = -1 # stream index of the last sample >= threshold (-1 = none yet)
+        self.last_active_right = -1
+        self.sample_count = 0 # samples seen so far (same counter as the PiezoReader)
+        self.lock = threading.Lock() # update() runs in the acquisition thread, set_thresholds() in the GUI/task threads
+
+    def update(self, first_index, adder1, adder2):
+        """Takes one burst of samples (stream indices first_index, first_index + 1, ...)."""
+        n = len(adder1)
+        if n == 0:
+            return
+
+        with self.lock:
+            active = np.flatnonzero(adder1 >= self.threshold_left)
+            if active.size:
+                self.last_active_left = first_index + int(active[-1])
+
+            active = np.flatnonzero(adder2 >= self.threshold_right)
+            if active.size:
+                self.last_active_right = first_index + int(active[-1])
+
+            self.sample_count = first_index + n
+
+    def set_thresholds(self, threshold_left, threshold_right, snapshot):
+        """
+        Changes the thresholds and finds the last active sample again in the samples that are still kept.
+        snapshot() returns (first_index, adder1, adder2) for the whole ring buffer, oldest first; it is called
+        under the lock so a burst that arrives meanwhile is applied again afterwards with the new thresholds.
+        If there is no active sample the spout has been quiet at least since first_index.
+        """
+        with self.lock:
+            self.threshold_left = threshold_left
+            self.threshold_right = threshold_right
+            first_index, adder1, adder2 = snapshot()
+
+            active = np.flatnonzero(adder1 >= threshold_left)
+            self.last_active_left = first_index + int(active[-1]) if active.size else first_index - 1
+
+            active = np.flatnonzero(adder2 >= threshold_right)
+            self.last_active_right = first_index + int(active[-1]) if active.size else first_index - 1
+
+            self.sample_count = first_index + len(adder1)
+
+    def quiet_samples(self, side=None):
+        """Number of samples since the last active sample on `side` ('left'/'right'), or on either spout if side is None."""
+        with self.lock:
+            return self.count_quiet(side)
+
+    def count_quiet(self, side=None):
+        # Callers hold the lock (the indices and sample_count are changed together by update/set_thresholds)
+        if side == 'left':
+            last_active = self.last_active_left
+        elif side == 'right':
+            last_active = self.last_active_right
+        else:
+            last_active = max(self.last_active_left, self.last_active_right)
+        return self.sample_count - 1 - last_active
+
+    def state(self):
+        """(sample_count, quiet_samples) read together, for callers that also count samples themselves."""
+        with self.lock:
+            return self.sample_count, self.count_quiet()
+
+    def is_quiet(self, n_samples):
+        """True if both spouts were quiet for the last n_samples samples."""
+        return self.quiet_samples() >= n_samples
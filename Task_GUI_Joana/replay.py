@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:58:06 2026
+
+@author: JoanaCatarino
+
+Offline replay - runs a recorded session (<session>_piezo.bin) through the decision code of a task class
+- The recorded samples are fed to a PiezoReader without a serial port (same ring buffer, quiet windows and lick
+  events as on the rig) and the TaskEngine is driven from this thread instead of its own: its SimulatedClock (clock.py)
+  jumps from one recorded sample to the next and to the engine's timer deadlines, so an hour of session replays in
+  seconds. drive() does the same for any sample stream (the fast headless simulation uses it)
+- Samples are fed in bursts that end at a lick (threshold crossing), at a touch onset (tasks with RW_touch) or at the
+  next timer, so the clock is at the time of the lick when the task handles it and at the deadline when a timer runs
+- Outputs are stubbed: GPIO uses gpiozero's mock pins (TASKGUI_SIMULATION=1), cues are virtual Playbacks that start
+  cue_latency after the call and the valve/TTL pulses are not timed by the pulse scheduler
+- The task parameters (RW, QW, WW, ITI, thresholds, valve) are taken from the first row of the session csv; params
+  overrides them (e.g. to test a rule change)
+- The trials follow the session: the ITI, block, catch trial, distractor and tone of every recorded trial are read from
+  the csv and the task's random draws are replaced by them (the correct spout follows from the tone and block). Trials
+  past the end of the csv, and all of them with redraw=True (--redraw), are new draws with the random seed `seed`
+- With the clock anchor of the session json (written by the engine), the replayed session_start is the wall-clock
+  time of the recorded samples; the other csv times are seconds from the start of the session as on the rig
+- The replayed trials are written like a session (csv with header + trial table), e.g.:
+      python replay.py AdaptiveSensorimotorTask ~/save_dir/M1/AdaptSensorimotor_M1_..._box1.csv replay.csv [--redraw]
+"""
+
+import os
+import sys
+import csv
+import json
+import random
+import numpy as np
+
+os.environ.setdefault('TASKGUI_SIMULATION', '1') # mock pins - a replay must never drive the rig
+
+from simulation import SIMULATION, HeadlessControls, load_task_class
+from piezo_reader import PiezoReader
+from piezo_recorder import load_piezo_recording, raw_piezo_path
+from file_writer import CSV_HEADERS
+from clock import SimulatedClock
+from sound_generator import STIMULI
+
+# Session csv column -> task attribute
+SESSION_PARAMS = {'RW': 'RW', 'QW': 'QW', 'WW': 'WW', 'valve_opening': 'valve_opening', 'ITImin': 'ITI_min',
+                  'ITImax': 'ITI_max', 'threshold_left': 'threshold_left', 'threshold_right': 'threshold_right'}
+
+
+class VirtualPlayback:
+    """Stands in for a sound_generator Playback: the cue starts at onset_time (onset_ns) and nothing is played."""
+
+    def __init__(self, onset_time, onset_ns, duration=0.0):
+        self.onset_time = onset_time
+        self.onset_ns = onset_ns
+        self.duration = duration
+        self.offset_time = onset_time + duration
+
+    def wait_onset(self, timeout=1.0):
+        return self.onset_time
+
+    def wait(self, timeout=None):
+        return self.onset_time
+
+
+class VirtualPulse:
+    """Stands in for a pulse_scheduler Pulse that was delivered as planned."""
+
+    def __init__(self, device, duration, value, onset_time):
+        self.device = device
+        self.duration = self.width = duration
+        self.measured = False # planned width, like a waveform pulse
+        self.value = value
+        self.onset_time = onset_time
+
+
+class VirtualPiezoReader(PiezoReader):
+    """PiezoReader without a serial port - drive() feeds it with ingest()."""
+
+    def __init__(self, clock):
+        super().__init__(port='virtual')
+        self.wall_anchor = clock.wall_offset # sample times are the clock's monotonic times
+        self.mono_anchor = 0
+
+    def setup_serial_connection(self):
+        self.ser = None
+
+
+def replay_class(task_class):
+    """Subclass of task_class with the outputs stubbed (replay and fast simulation); with recorded trials (see
+    recorded_trials) the draws of ITI and trial type are replaced by the recorded ones."""
+
+    class Replay(task_class):
+        cue_latency = 0.01 # onset of a virtual cue after the call (about one audio buffer)
+        recorded = {} # trial number -> recorded trial (recorded_trials), empty for new draws
+        trial = None # recorded trial being prepared
+
+        def prepare_trial(self):
+            self.trial = self.recorded.get(self.total_trials)
+            if self.trial is not None and self.trial['block'] is not None and hasattr(self, 'current_block'):
+                self.current_block = self.trial['block']
+            try:
+                super().prepare_trial()
+            finally:
+                self.trial = None
+
+        def recorded_spout(self):
+            """Correct spout of the recorded trial: the block side in action blocks, the spout of the tone otherwise."""
+            if self.trial['block'] in ('action-left', 'action-right'):
+                return self.trial['block'].split('-')[1]
+            return self.spout_8KHz if self.trial['tone'] == '8KHz' else self.spout_16KHz
+
+        def next_ITI(self):
+            trial = self.recorded.get(self.total_trials)
+            if trial is None or trial['ITI'] is None:
+                return super().next_ITI()
+            return trial['ITI']
+
+        def debias(self):
+            return super().debias() if self.trial is None else self.recorded_spout()
+
+        def choose_next_trial_blockwise(self):
+            if self.trial is None:
+                return super().choose_next_trial_blockwise()
+            self.current_block_side = self.recorded_spout()
+            return self.current_block_side
+
+        def choose_action_sound(self):
+            return super().choose_action_sound() if self.trial is None else self.trial['tone']
+
+        def decide_session_catch(self):
+            return super().decide_session_catch() if self.trial is None else self.trial['catch']
+
+        def decide_catch_trial(self):
+            return super().decide_catch_trial() if self.trial is None else self.trial['catch']
+
+        def choose_distractor(self):
+            return super().choose_distractor() if self.trial is None else self.trial['distractor_led']
+
+        def play_cue(self, name, ttl=None):
+            return VirtualPlayback(self.clock.time() + self.cue_latency,
+                                   self.clock.monotonic_ns() + int(self.cue_latency * 1e9), STIMULI[name][2])
+
+        def pulse_output(self, device, duration, value=1, callback=None):
+            pulse = VirtualPulse(device, duration, value, self.clock.time())
+            if callback is not None:
+                callback(pulse)
+            return pulse
+
+    Replay.__name__ = 'Replay' + task_class.__name__
+    return Replay
+
+
+def session_params(csv_file_path):
+    """Task parameters of a session from the first row of its csv."""
+    with open(csv_file_path, newline='') as file:
+        reader = csv.reader(file)
+        header, row = next(reader, []), next(reader, [])
+    if len(row) != len(header):
+        # Tasks that write fewer columns than the header (the values are shifted) - keep the task defaults
+        print(f"Session parameters not read: {len(row)} values for {len(header)} columns")
+        return {}
+    row = dict(zip(header, row))
+    params = {}
+    for column, name in SESSION_PARAMS.items():
+        try:
+            value = float(row[column])
+        except (KeyError, ValueError):
+            continue
+        if value == value: # not NaN
+            params[name] = value
+    return params
+
+
+def recorded_trials(csv_file_path):
+    """ITI and trial type of every trial of a session csv: trial number -> dict (ITI, block, catch, tone, distractor_led)."""
+    with open(csv_file_path, newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        rows = list(reader)
+    if any(len(row) != len(header) for row in rows):
+        # Tasks that write fewer columns than the header (the values are shifted) - those trials are new draws
+        print(f"{sum(len(row) != len(header) for row in rows)} of {len(rows)} rows do not match the header - not replayed as recorded")
+    rows = [dict(zip(header, row)) for row in rows if len(row) == len(header)]
+
+    def number(value):
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        return None if value != value else value # NaN -> None
+
+    trials = {}
+    for row in rows:
+        trial_number = number(row.get('trial_number'))
+        if trial_number is None:
+            continue
+        tone = '8KHz' if number(row.get('8KHz')) == 1 else '16KHz' if number(row.get('16KHz')) == 1 else None
+        distractor_led = 'left' if number(row.get('distractor_left')) == 1 else 'right' if number(row.get('distractor_right')) == 1 else None
+        block = row.get('block', '')
+        trials[int(trial_number)] = {'ITI': number(row.get('ITI')),
+                                     'block': None if block in ('', 'nan') else block,
+                                     'catch': number(row.get('catch_trial')) == 1,
+                                     'tone': tone,
+                                     'distractor_led': distractor_led}
+    return trials
+
+
+def session_wall_offset(csv_file_path, default=0.0):
+    """time.time() - time.monotonic() of a recorded session, from the clock anchor in its json (default if there is none)."""
+    json_file_path = os.path.splitext(csv_file_path)[0] + '.json'
+    try:
+        with open(json_file_path) as json_file:
+            anchor = json.load(json_file)['clock_anchor']
+    except (OSError, ValueError, KeyError):
+        return default # older sessions, or no json
+    return anchor['wall_time'] - anchor['monotonic_ns'] / 1e9
+
+
+def lick_onsets(values, threshold):
+    """Indices of the samples where a spout crosses its threshold (the lick events of the PiezoReader)."""
+    above = values > threshold
+    return np.flatnonzero(above & ~np.concatenate(([False], above[:-1])))
+
+
+def drive(task, reader, clock, adder1, adder2, stamps):
+    """
+    Runs the task engine on a SimulatedClock over a stream of samples (stamps in ns on the clock's monotonic time):
+    the clock jumps to the next sample or timer deadline, whichever comes first. Stops the task at the end.
+    """
+    times = stamps / 1e9
+
+    # Samples that end a burst: every lick on either spout, and every touch (> 0) where the response window takes touches
+    licks = np.union1d(lick_onsets(adder1, task.threshold_left), lick_onsets(adder2, task.threshold_right))
+    if getattr(task, 'RW_touch', False):
+        licks = np.union1d(licks, np.union1d(lick_onsets(adder1, 0), lick_onsets(adder2, 0)))
+
+    n = len(stamps)
+    if n:
+        clock.set(times[0])
+    task.open_session()
+
+    i = 0 # next sample to feed
+    k = 0 # next lick in licks
+    while i < n:
+        deadline = task.next_deadline()
+        if deadline is not None and deadline < times[i]:
+            clock.set(deadline)
+            task.run_timers()
+            continue
+
+        # Feed up to the next lick (included) or the last sample before the next timer
+        while k < len(licks) and licks[k] < i:
+            k += 1
+        end = int(licks[k]) + 1 if k < len(licks) else n
+        if deadline is not None:
+            end = min(end, int(np.searchsorted(times, deadline, side='left')))
+        end = max(end, i + 1)
+
+        clock.set(times[end - 1])
+        reader.ingest(adder1[i:end], adder2[i:end], stamps[i:end])
+        task.poll_licks()
+        i = end
+
+    task.stop()
+
+
+def virtual_task(task_class, clock, csv_file_path, params=None, recorded=None):
+    """A task_class with stubbed outputs on clock, reading from a VirtualPiezoReader (trials go to csv_file_path);
+    recorded (see recorded_trials) replaces the draws of ITI and trial type."""
+    reader = VirtualPiezoReader(clock)
+    csv_file_path = os.path.abspath(csv_file_path)
+    os.makedirs(os.path.dirname(csv_file_path), exist_ok=True) # the header is written before the engine makes the folder
+    with open(csv_file_path, 'w', newline='') as file:
+        csv.writer(file).writerow(CSV_HEADERS)
+
+    task = replay_class(task_class)(HeadlessControls(reader), csv_file_path)
+    task.clock = clock
+    task.recorded = recorded or {}
+    for name, value in (params or {}).items():
+        setattr(task, name, value)
+    return task, reader
+
+
+def replay_session(task_class, recording_path, csv_file_path, session_csv=None, params=None, seed=0, wall_offset=None, redraw=False):
+    """
+    Replays a raw piezo recording through task_class; the trials are written to csv_file_path. Returns the task.
+    The ITI and trial types are the ones of session_csv unless redraw is True (then they are new draws).
+    """
+    if not SIMULATION:
+        print("Warning: replay without TASKGUI_SIMULATION=1 - the task outputs drive the real pins")
+    random.seed(seed)
+    np.random.seed(seed)
+
+    records = load_piezo_recording(recording_path)
+
+    settings = session_params(session_csv) if session_csv else {}
+    settings.update(params or {})
+    if wall_offset is None:
+        wall_offset = session_wall_offset(session_csv) if session_csv else 0.0
+    clock = SimulatedClock(wall_offset=wall_offset)
+    recorded = recorded_trials(session_csv) if session_csv and not redraw else {}
+    if session_csv and not redraw:
+        print(f"{len(recorded)} recorded trials (ITI and trial type from {os.path.basename(session_csv)})")
+    task, reader = virtual_task(task_class, clock, csv_file_path, settings, recorded)
+
+    drive(task, reader, clock, records['adder1'], records['adder2'], records['t_ns'])
+    return task
+
+
+if __name__ == '__main__':
+    redraw = '--redraw' in sys.argv # new draws of ITI and trial type instead of the recorded ones
+    args = [arg for arg in sys.argv[1:] if arg != '--redraw']
+    task_name = args[0]
+    session_csv = args[1]
+    output = args[2] if len(args) > 2 else os.path.splitext(os.path.basename(session_csv))[0] + '_replay.csv'
+
+    task = replay_session(load_task_class(task_name), raw_piezo_path(session_csv), output, session_csv=session_csv, redraw=redraw)
+    print(f"Replayed {task.total_trials} trials to {output}")
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:12:50 2026
+
+@author: JoanaCatarino
+
+Session loader - training history of an animal in one typed table
+- load_animal_sessions(animal_id) scans SAVE_DIRECTORY/<animal_id>, joins every session csv with its json
+  (animal_id, date, time, task, box) and returns (trials, sessions):
+    - trials: structured array with the csv columns (TRIAL_DTYPE of trial_table) + 'session', the row in sessions
+    - sessions: structured array with one row per session (file, json fields, number of trials), in date/time order
+- A session is read from its trial table (<session>_trials.bin/.parquet) when there is one, otherwise from the csv
+  by header name: columns that are not in the header are NaN/-1. Each cell is parsed on its own (a cell that does not
+  fit its column is NaN/-1), and a row whose length is not the one of the header is not aligned with it (SpoutSampling
+  and the distractor task write shifted rows): all its columns are NaN/-1 and the number of such rows is reported
+- A session that cannot be read (no json, unreadable file...) is reported and left out of the history; it is tried
+  again the next time
+- New sessions are parsed in parallel (one process per core) and the consolidated table is cached in
+  <animal_id>/.sessions_cache.npz, keyed by the mtime and size of every csv and json: reopening the history only
+  parses the sessions that are new or changed
+"""
+
+import os
+import csv
+import glob
+import json
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from file_writer import SAVE_DIRECTORY, CSV_HEADERS
+from trial_table import TRIAL_DTYPE, column_value, empty_trials, load_trial_table
+
+CACHE_NAME = '.sessions_cache.npz'
+
+SESSION_DTYPE = np.dtype([
+    ('file', 'U128'), # csv file name
+    ('animal_id', 'U32'),
+    ('date', 'U8'), # yyyyMMdd
+    ('time', 'U6'), # HHmmss
+    ('task', 'U64'),
+    ('box', 'U8'),
+    ('n_trials', '<i4'),
+    ])
+
+HISTORY_DTYPE = np.dtype(TRIAL_DTYPE.descr + [('session', '<i4')])
+
+# (csv mtime, csv size, json mtime, json size) of every session in the cache
+KEY_DTYPE = np.dtype([('file', 'U128'), ('csv_mtime', '<i8'), ('csv_size', '<i8'), ('json_mtime', '<i8'), ('json_size', '<i8')])
+
+
+def read_session_csv(csv_file_path):
+    """Reads a session csv into a TRIAL_DTYPE array (see the module docstring for the rows that do not fit)."""
+    with open(csv_file_path, newline='') as file:
+        rows = list(csv.reader(file))
+    if not rows:
+        return empty_trials(0)
+
+    header, rows = rows[0], [row for row in rows[1:] if row]
+    trials = empty_trials(len(rows))
+    aligned = [i for i, row in enumerate(rows) if len(row) == len(header)]
+    if len(aligned) < len(rows):
+        print(f"{os.path.basename(csv_file_path)}: {len(rows) - len(aligned)} of {len(rows)} rows do not match the header - left empty")
+
+    for name in CSV_HEADERS:
+        if name in header:
+            column = header.index(name)
+            trials[name][aligned] = [column_value(name, rows[i][column]) for i in aligned]
+    return trials
+
+
+def load_session(csv_file_path):
+    """Trials and json info of one session (runs in the worker processes)."""
+    json_file_path = os.path.splitext(csv_file_path)[0] + '.json'
+    with open(json_file_path) as json_file:
+        info = json.load(json_file)
+
+    # The trial table has the same rows, already typed
+    base = os.path.splitext(csv_file_path)[0]
+    trials = None
+    for table_path in (base + '_trials.parquet', base + '_trials.bin'):
+        if os.path.exists(table_path):
+            try:
+                trials = load_trial_table(table_path)
+                break
+            except Exception:
+                pass # e.g. parquet file without pyarrow
+
+    # The csv is the reference: a table that misses rows (last row group of a crashed session) is not used, nor one
+    # written from rows that do not match the header (tables written before those were refused)
+    if trials is not None:
+        n_rows, aligned = check_csv_rows(csv_file_path)
+        if len(trials) != n_rows or not aligned:
+            trials = None
+    if trials is None:
+        trials = read_session_csv(csv_file_path)
+    return trials, info
+
+
+def try_load_session(csv_file_path):
+    """load_session() that returns (trials, info, None), or (None, None, error message) if the session cannot be read."""
+    try:
+        trials, info = load_session(csv_file_path)
+        return trials, info, None
+    except Exception as e:
+        return None, None, f"{type(e).__name__}: {e}"
+
+
+def check_csv_rows(csv_file_path):
+    """(number of trial rows, True if they all have one value per header column)."""
+    with open(csv_file_path, newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        lengths = [len(row) for row in reader if row]
+    return len(lengths), all(length == len(header) for length in lengths)
+
+
+def session_key(csv_file_path):
+    csv_stat = os.stat(csv_file_path)
+    json_stat = os.stat(os.path.splitext(csv_file_path)[0] + '.json')
+    return (os.path.basename(csv_file_path), csv_stat.st_mtime_ns, csv_stat.st_size, json_stat.st_mtime_ns, json_stat.st_size)
+
+
+def find_sessions(animal_directory):
+    """Session csv files of an animal (the ones with a json next to them)."""
+    return sorted(path for path in glob.glob(os.path.join(animal_directory, '*.csv'))
+                  if os.path.exists(os.path.splitext(path)[0] + '.json'))
+
+
+def read_cache(cache_path):
+    """Cached sessions: file name -> (key, trials, session row)."""
+    if not os.path.exists(cache_path):
+        return {}
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache:
+            keys, sessions, trials = cache['keys'], cache['sessions'], cache['trials']
+    except Exception as e:
+        print(f"Ignoring session cache {cache_path}: {e}")
+        return {}
+
+    cached = {}
+    for i, key in enumerate(keys):
+        session_trials = trials[trials['session'] == i]
+        cached[str(key['file'])] = (tuple(key.tolist()), session_trials, sessions[i])
+    return cached
+
+
+def write_cache(cache_path, keys, sessions, trials):
+    temp_path = cache_path + '.tmp.npz'
+    np.savez(temp_path, keys=np.array(keys, dtype=KEY_DTYPE), sessions=sessions, trials=trials)
+    os.replace(temp_path, cache_path)
+
+
+def load_animal_sessions(animal_id, save_dir=SAVE_DIRECTORY, workers=None, use_cache=True):
+    """All the sessions of an animal as (trials, sessions) - see the module docstring."""
+    animal_directory = os.path.join(save_dir, animal_id)
+    cache_path = os.path.join(animal_directory, CACHE_NAME)
+    paths = find_sessions(animal_directory)
+    keys = [session_key(path) for path in paths]
+
+    cached = read_cache(cache_path) if use_cache else {}
+    new = [path for path, key in zip(paths, keys) if cached.get(key[0], (None,))[0] != key]
+
+    # Parse the new/changed sessions in parallel
+    parsed = {}
+    if new:
+        print(f"Loading {len(new)} new session(s) of {animal_id} ({len(paths) - len(new)} cached)")
+        if len(new) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(try_load_session, new))
+        else:
+            results = [try_load_session(path) for path in new]
+        for path, (trials, info, error) in zip(new, results):
+            if error is not None:
+                print(f"Skipping session {os.path.basename(path)}: {error}")
+                continue
+            session = np.zeros((), dtype=SESSION_DTYPE)
+            session['file'] = os.path.basename(path)
+            for field in ('animal_id', 'date', 'time', 'task', 'box'):
+                session[field] = str(info.get(field, ''))
+            session['n_trials'] = len(trials)
+            parsed[os.path.basename(path)] = (trials, session)
+
+    # Consolidate in date/time order (sessions that could not be read are left out)
+    entries = []
+    for path, key in zip(paths, keys):
+        name = key[0]
+        if name in parsed:
+            trials, session = parsed[name]
+        elif name in cached and cached[name][0] == key:
+            _, trials, session = cached[name]
+        else:
+            continue
+        entries.append((key, trials, session))
+    entries.sort(key=lambda entry: (str(entry[2]['date']), str(entry[2]['time']), entry[0][0]))
+
+    sessions = np.array([session for _, _, session in entries], dtype=SESSION_DTYPE)
+    history = np.empty(sum(len(trials) for _, trials, _ in entries), dtype=HISTORY_DTYPE)
+    start = 0
+    for i, (_, trials, _) in enumerate(entries):
+        block = history[start:start + len(trials)]
+        for name in TRIAL_DTYPE.names:
+            block[name] = trials[name]
+        block['session'] = i
+        start += len(trials)
+
+    if use_cache and (parsed or len(cached) != len(entries)):
+        write_cache(cache_path, [key for key, _, _ in entries], sessions, history)
+    return history, sessions
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:05:48 2026
+
+@author: JoanaCatarino
+
+Session writer - writes the trials of a session to the csv on a background thread
+- The writer owns the file handle for the whole session (opened once in append mode, after the headers written by
+  create_data_file) and takes the trial rows through a queue: write() never blocks, so the task thread never waits
+  for the SD card
+- Durability policy:
+    - flush_every: flush the file (to the OS) every N trials (1 = after every trial)
+    - fsync_every: fsync the file (to the SD card) every N trials (0 = only when the session is closed)
+    - flush_interval: the background thread also flushes whatever is pending at least this often (s)
+- With table_path the same rows also go to the typed trial table (trial_table.py), one row group at a time. If a row
+  does not match the csv header the table is deleted and the rest of the session only goes to the csv
+- close() writes what is left in the queue, flushes, fsyncs and closes the file
+"""
+
+import os
+import csv
+import queue
+import threading
+from trial_table import TrialTableWriter
+
+
+class SessionWriter:
+
+    def __init__(self, file_path, flush_every=1, fsync_every=10, flush_interval=1.0, table_path=None):
+        self.file_path = file_path
+        self.flush_every = flush_every
+        self.fsync_every = fsync_every
+        self.flush_interval = flush_interval
+
+        self.queue = queue.SimpleQueue() # rows waiting to be written (None closes the writer)
+        self.rows_written = 0
+        self.unflushed = 0 # rows written since the last flush
+        self.unsynced = 0 # rows written since the last fsync
+        self.file = open(file_path, mode='a', newline='')
+        self.writer = csv.writer(self.file)
+        self.table = TrialTableWriter(table_path) if table_path else None
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, row):
+        """Queues one trial row (returns right away)."""
+        self.queue.put(row)
+
+    def close(self):
+        """Writes the rows that are still queued and closes the file."""
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        """Background thread - writes the queued rows and applies the durability policy."""
+        try:
+            while True:
+                try:
+                    row = self.queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    self.flush() # nothing new for flush_interval seconds
+                    continue
+                if row is None:
+                    break
+
+                self.writer.writerow(row)
+                if self.table is not None:
+                    try:
+                        self.table.append(row)
+                    except Exception as e:
+                        # A row that does not fit the header would mislabel the columns: no table for this session
+                        print(f"Trial table dropped ({e}) - the trials are only in the csv")
+                        self.drop_table()
+                self.rows_written += 1
+                self.unflushed += 1
+                self.unsynced += 1
+
+                if self.fsync_every and self.unsynced >= self.fsync_every:
+                    self.flush(sync=True)
+                elif self.flush_every and self.unflushed >= self.flush_every:
+                    self.flush()
+        except Exception as e:
+            print(f"Error writing {self.file_path}: {e}")
+        finally:
+            self.flush(sync=True)
+            self.file.close()
+            if self.table is not None:
+                self.table.close()
+
+    def drop_table(self):
+        try:
+            self.table.discard()
+        except Exception as e:
+            print(f"Error removing the trial table: {e}")
+        self.table = None
+
+    def flush(self, sync=False):
+        if self.unflushed:
+            self.file.flush()
+            self.unflushed = 0
+        if sync and self.unsynced:
+            os.fsync(self.file.fileno())
+            self.unsynced = 0
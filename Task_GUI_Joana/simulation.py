@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:05:52 2026
+
+@author: JoanaCatarino
+
+Simulation backend - runs the tasks without the rig
+- Enabled with the environment variable TASKGUI_SIMULATION=1 (set it before starting the GUI or a headless run)
+- gpio_map uses gpiozero's mock pin factory, so LEDs, pumps and TTLs are mock pins
+- FakeArduino opens a pseudo-terminal and writes the real piezo protocol (0x7F, adder1, bool1, adder2, bool2, 0x80)
+  at 60 Hz against absolute deadlines; PiezoReader opens the other end of the pty like it opens /dev/ttyACM0
+- VirtualMouse decides what the piezos see: lick bouts that start at random (Poisson), ~7 Hz licks inside a bout,
+  a side preference and a lick amplitude. trigger_bout() starts a bout on demand (e.g. as a response to a cue)
+- SimulatedAudioStream stands in for the PyAudio output stream when PyAudio or a sound card is missing
+- speed > 1 writes the packets faster than real time (speed=0: as fast as the pty accepts them), to benchmark the
+  acquisition path (serial, framing, lick events); the tasks themselves still time QW/WW/RW/ITI on the real clock
+- Headless run of any task class, e.g.:  TASKGUI_SIMULATION=1 python simulation.py AdaptiveSensorimotorTask 120
+- Fast headless run on a SimulatedClock (clock.py) that jumps to the next deadline instead of waiting for it,
+  e.g. 10 hours of task in a few seconds:  python simulation.py AdaptiveSensorimotorTask 36000 fast
+"""
+
+import os
+import sys
+import time
+import random
+import threading
+
+SIMULATION = os.environ.get('TASKGUI_SIMULATION', '0') == '1'
+
+
+class VirtualMouse:
+    def __init__(self, bout_rate=0.1, licks_per_bout=(2, 8), lick_rate=7.0, lick_samples=2, amplitude=12, p_left=0.5, sample_rate=60):
+        self.bout_rate = bout_rate # spontaneous lick bouts per second
+        self.licks_per_bout = licks_per_bout # (min, max) licks in a bout
+        self.lick_rate = lick_rate # licks per second inside a bout
+        self.lick_samples = lick_samples # samples above zero per lick (one packet is 1/60 s)
+        self.amplitude = amplitude # raw adder value of a lick (the PiezoReader multiplies it by 10)
+        self.p_left = p_left # probability that a bout is on the left spout
+        self.sample_rate = sample_rate
+        self.lock = threading.Lock()
+        self.pending = [] # (sample, side) of the licks still to come
+
+    def trigger_bout(self, side=None, delay=0.0, sample=0):
+        """Schedules a lick bout `delay` seconds after `sample` (side chosen with p_left if None)."""
+        if side is None:
+            side = 'left' if random.random() < self.p_left else 'right'
+        n_licks = random.randint(*self.licks_per_bout)
+        start = sample + int(delay * self.sample_rate)
+        step = max(self.lick_samples + 1, int(self.sample_rate / self.lick_rate))
+        with self.lock:
+            self.pending.extend((start + i * step, side) for i in range(n_licks))
+
+    def sample(self, index):
+        """Raw (adder1, adder2) of packet number `index`."""
+        # Spontaneous bouts (Poisson process, one draw per packet)
+        if random.random() < self.bout_rate / self.sample_rate:
+            self.trigger_bout(sample=index)
+
+        left = right = 0
+        with self.lock:
+            if self.pending:
+                self.pending = [(s, side) for s, side in self.pending if s + self.lick_samples > index]
+                for s, side in self.pending:
+                    if s <= index:
+                        if side == 'left':
+                            left = self.amplitude
+                        else:
+                            right = self.amplitude
+        return left, right
+
+
+class FakeArduino:
+    def __init__(self, mouse=None, sample_rate=60, speed=1.0):
+        self.mouse = mouse or VirtualMouse(sample_rate=sample_rate)
+        self.sample_rate = sample_rate
+        self.speed = speed
+        self.packet = bytearray([0x7F, 0, 0, 0, 0, 0x80])
+        self.packets_sent = 0
+        self.running = False
+        self.thread = None
+
+        # The slave end of the pty behaves like the Arduino's serial port (pty/tty only exist on POSIX - imported here so the
+        # rest of this module, e.g. SIMULATION, also imports on Windows)
+        import pty
+        import tty
+        self.master_fd, self.slave_fd = pty.openpty()
+        tty.setraw(self.slave_fd)
+        self.port = os.ttyname(self.slave_fd)
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.loop, daemon=True)
+        self.thread.start()
+        print(f"Simulated Arduino on {self.port}")
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join()
+
+    def loop(self):
+        """Writes one packet per period against absolute deadlines (no drift from the write time)."""
+        period = 1 / (self.sample_rate * self.speed) if self.speed > 0 else 0
+        next_time = time.monotonic()
+        while self.running:
+            left, right = self.mouse.sample(self.packets_sent)
+            self.packet[1], self.packet[2] = left, int(left > 0)
+            self.packet[3], self.packet[4] = right, int(right > 0)
+            os.write(self.master_fd, self.packet)
+            self.packets_sent += 1
+
+            if period:
+                next_time += period
+                delay = next_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+
+class SimulatedAudioStream:
+    """Calls an audio callback at the buffer rate, like a PyAudio stream in callback mode (the output is discarded)."""
+
+    def __init__(self, rate, frames_per_buffer, stream_callback, latency=0.01):
+        self.rate = rate
+        self.frames_per_buffer = frames_per_buffer
+        self.callback = stream_callback
+        self.latency = latency
+        self.running = False
+        self.thread = None
+
+    def start_stream(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.loop, daemon=True)
+        self.thread.start()
+
+    def loop(self):
+        t0 = time.monotonic()
+        n = 0
+        while self.running:
+            now = time.monotonic()
+            self.callback(None, self.frames_per_buffer, {'current_time': now, 'output_buffer_dac_time': now + self.latency}, 0)
+            n += 1
+            delay = t0 + n * self.frames_per_buffer / self.rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    def get_output_latency(self):
+        return self.latency
+
+    def stop_stream(self):
+        self.running = False
+        if self.thread:
+            self.thread.join()
+
+    def close(self):
+        pass
+
+
+# One simulated Arduino per program, started the first time the PiezoReader asks for its port
+fake_arduino = None
+
+def start_fake_arduino(speed=1.0):
+    """Starts the simulated Arduino (once) and returns its serial port."""
+    global fake_arduino
+    if fake_arduino is None:
+        fake_arduino = FakeArduino(speed=speed)
+        fake_arduino.start()
+    return fake_arduino.port
+
+
+class _Null:
+    """Stand-in for the GUI widgets and plots: accepts any call, checkboxes are unchecked."""
+
+    def __init__(self, text=''):
+        self._text = text
+
+    def __getattr__(self, name):
+        return _Null()
+
+    def __call__(self, *args, **kwargs):
+        return None
+
+    def isChecked(self):
+        return False
+
+    def currentText(self):
+        return self._text
+
+    def text(self):
+        return self._text
+
+
+class HeadlessControls:
+    """Replaces GuiControls for headless runs: owns the PiezoReader and ignores the GUI updates."""
+
+    def __init__(self, piezo_reader, animal_id='SIM'):
+        self.piezo_reader = piezo_reader
+        self.ui = _Null()
+        self.ui.ddm_Animal_ID = _Null(animal_id)
+        self.performance_plot = self.performance_plot_ov = _Null()
+        self.lick_plot = self.lick_plot_ov = _Null()
+
+    def __getattr__(self, name):
+        return _Null() # update_* and the plot helpers
+
+
+# Task classes that can run headless (class name -> module)
+TASK_MODULES = {
+    'FreeLickingTask': 'task_free_licking',
+    'SpoutSamplingTask': 'task_spout_sampling',
+    'TwoChoiceAuditoryTask': 'task_twochoice_auditory',
+    'TwoChoiceAuditoryTask_Blocks': 'task_twochoice_auditory_blocks',
+    'AdaptiveSensorimotorTask': 'task_adaptive_sensorimotor',
+    'AdaptiveSensorimotorTaskDistractor': 'task_adaptive_sensorimotor_distractor',
+    }
+
+def load_task_class(name):
+    """Task class from its name (see TASK_MODULES)."""
+    return getattr(__import__(TASK_MODULES[name]), name)
+
+
+def run_fast(task_class, duration, csv_file_path, mouse=None, seed=None, **params):
+    """
+    Runs a task for `duration` seconds of simulated time on a SimulatedClock (no threads, no waiting): the VirtualMouse
+    samples of the whole run are generated first and the engine is driven through them like a replay.
+    """
+    import numpy as np
+    from clock import SimulatedClock
+    from replay import virtual_task, drive
+
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+    mouse = mouse or VirtualMouse()
+    n = int(duration * mouse.sample_rate)
+    samples = np.array([mouse.sample(i) for i in range(n)], dtype=np.uint16).reshape(n, 2) * 10 # x10 like the PiezoReader
+    stamps = np.arange(n, dtype=np.int64) * (1_000_000_000 // mouse.sample_rate)
+
+    clock = SimulatedClock(wall_offset=time.time())
+    task, reader = virtual_task(task_class, clock, csv_file_path, params)
+
+    start = time.time()
+    drive(task, reader, clock, samples[:, 0], samples[:, 1], stamps)
+    print(f"{task_class.__name__}: {task.total_trials} trials in {duration:.0f} s of simulated time ({time.time() - start:.1f} s)")
+    return task
+
+
+def run_headless(task_class, duration, csv_file_path, **params):
+    """Runs a task for `duration` seconds without the GUI on the simulated rig and returns the task object."""
+    from piezo_reader import PiezoReader
+
+    piezo_reader = PiezoReader()
+    task = task_class(HeadlessControls(piezo_reader), csv_file_path)
+    for name, value in params.items():
+        setattr(task, name, value) # e.g. QW=1, RW=2, ITI_min=1, ITI_max=2
+    piezo_reader.set_thresholds(task.threshold_left, task.threshold_right)
+
+    start = time.time()
+    task.start()
+    time.sleep(duration)
+    task.stop()
+    piezo_reader.close_connection()
+
+    print(f"{task_class.__name__}: {getattr(task, 'total_trials', 0)} trials in {time.time() - start:.1f} s")
+    return task
+
+
+if __name__ == '__main__':
+    os.environ['TASKGUI_SIMULATION'] = '1' # make sure gpio_map/piezo_reader are imported in simulation mode
+
+    task_name = sys.argv[1] if len(sys.argv) > 1 else 'FreeLickingTask'
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 60
+    fast = len(sys.argv) > 3 and sys.argv[3] == 'fast'
+
+    csv_file_path = os.path.join(os.getcwd(), f'simulation_{task_name}_{time.strftime("%Y%m%d_%H%M%S")}.csv')
+    if fast:
+        run_fast(load_task_class(task_name), duration, csv_file_path)
+    else:
+        run_headless(load_task_class(task_name), duration, csv_file_path)
+    print(f"Trials saved to {csv_file_path}")
@@ -1,69 +1,268 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Sat Jul 13 18:38:00 2024
-
-@author: JoanaCatarino
-
-Generates the 8 and 16KHz pure tones and white noise. How loud the sound is can be regulated with the amplitude variable.
-"""
-
-import numpy as np
-import pyaudio
-
-# For 8KHz tone
-def generate_sine_wave_8(frequency, duration, sample_rate=44100, amplitude=0.005): # before amplitude was 0.05 (for speaker with digital gain of 58%)
-    t = np.linspace(0, duration, int(sample_rate*duration), endpoint=False)
-    wave_8 = amplitude * np.sin(2 * np.pi * frequency * t)
-    return wave_8
-
-# For 16KHz tone
-def generate_sine_wave_16(frequency, duration, sample_rate=44100, amplitude=0.053): # before amplitude was 0.05 (for speaker with digital gain of 58%)
-    t = np.linspace(0, duration, int(sample_rate*duration), endpoint=False)
-    wave_16 = amplitude * np.sin(2 * np.pi * frequency * t)
-    return wave_16
-
-# For White Noise
-def generate_white_noise(duration, sample_rate=44100, amplitude=0.0014): # before amplitude was 0.01
-    return np.random.normal(0, amplitude, int(sample_rate*duration))
-
-def play_sound_blocking(sound, sample_rate=44100):
-    p = pyaudio.PyAudio()
-    stream = p.open(format=pyaudio.paFloat32,
-                    channels=1,
-                    rate=sample_rate,
-                    output=True,
-                    output_device_index=0)
-    stream.write(sound.astype(np.float32).tobytes())
-    stream.stop_stream()
-    stream.close()
-    p.terminate()
-
-def play_sound(sound, sample_rate=44100):
-    play_sound_blocking(sound, sample_rate)
-
-def tone_16KHz():
-    frequency = 16000  # frequency in Hz
-    duration = 0.4  # Duration in seconds
-    sample_rate = 44100  # Sample rate in Hz
-    sound = generate_sine_wave_16(frequency, duration, sample_rate)
-    play_sound(sound, sample_rate)
-
-def tone_8KHz():
-    frequency = 8000  # frequency in Hz
-    duration = 0.4  # Duration in seconds
-    sample_rate = 44100  # Sample rate in Hz
-    sound = generate_sine_wave_8(frequency, duration, sample_rate)
-    play_sound(sound, sample_rate)
-
-def white_noise():
-    sample_rate = 44100  # Sample rate in Hz
-    duration = 2  # Duration in seconds
-    sound = generate_white_noise(duration, sample_rate)
-    play_sound(sound, sample_rate)
-    
-
-
-
-
-
-
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Jul 13 18:38:00 2024
+
+@author: JoanaCatarino
+
+Generates the 8 and 16KHz pure tones and white noise. How loud the sound is can be regulated with the amplitude variable.
+Every cue is rendered once per session by the StimulusBank and reused from then on.
+
+Sounds are played by one AudioEngine that keeps a single output stream open and warm for the whole session
+(opening PyAudio and a stream for every tone costs tens to hundreds of ms). The stream runs in callback mode:
+each callback mixes the sounds that are playing into one small buffer, and the onset/offset of every sound is
+taken from the stream's output (DAC) timestamps, so the latency and jitter of a cue are about one buffer.
+play_cue_async() returns right away with the Playback handle. An optional TTL device follows the sound: the audio
+callback hands it to the pulse scheduler as a pulse that starts at the onset (DAC time) and lasts as long as the
+sound, so the TTL edges line up with the speaker and the audio thread never writes to the GPIO.
+"""
+
+import threading
+import time
+import numpy as np
+from simulation import SIMULATION, SimulatedAudioStream
+from pulse_scheduler import pulse_scheduler
+try:
+    import pyaudio
+except ImportError:
+    pyaudio = None # only needed on the rig - simulation mode (TASKGUI_SIMULATION=1) runs without it
+
+# Cues used by the tasks: name -> (kind, frequency (Hz), duration (s), amplitude). Add new stimuli here.
+STIMULI = {
+    '8KHz': ('tone', 8000, 0.4, 0.005), # before amplitude was 0.05 (for speaker with digital gain of 58%)
+    '16KHz': ('tone', 16000, 0.4, 0.053), # before amplitude was 0.05 (for speaker with digital gain of 58%)
+    'white_noise': ('noise', None, 2, 0.0014), # before amplitude was 0.01
+    }
+
+# Pure tone with raised-cosine onset/offset ramps (avoids the click of a hard onset)
+def generate_tone(frequency, duration, sample_rate=44100, amplitude=0.005, ramp=0.005):
+    n = int(sample_rate*duration)
+    t = np.arange(n) / sample_rate
+    wave = (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+    n_ramp = min(int(sample_rate*ramp), n // 2)
+    if n_ramp:
+        envelope = (0.5 - 0.5 * np.cos(np.pi * np.arange(n_ramp) / n_ramp)).astype(np.float32)
+        wave[:n_ramp] *= envelope
+        wave[n - n_ramp:] *= envelope[::-1]
+    return wave
+
+# For White Noise
+def generate_white_noise(duration, sample_rate=44100, amplitude=0.0014): # before amplitude was 0.01
+    return np.random.normal(0, amplitude, int(sample_rate*duration)).astype(np.float32)
+
+
+class StimulusBank:
+    """
+    Renders every stimulus once and keeps it as a read-only contiguous float32 buffer that can be handed to the audio
+    engine as is. Entries are keyed by (kind, frequency, duration, amplitude, sample_rate); noise keeps a pool of
+    different segments and hands out a random one each time, so the punishment is not the same frozen noise every trial.
+    """
+
+    def __init__(self, noise_pool_size=8):
+        self.noise_pool_size = noise_pool_size
+        self.buffers = {} # key -> list of buffers (one for tones, the pool for noise)
+        self.lock = threading.Lock()
+
+    def render(self, kind, frequency, duration, amplitude, sample_rate):
+        if kind == 'tone':
+            buffers = [generate_tone(frequency, duration, sample_rate, amplitude)]
+        elif kind == 'noise':
+            buffers = [generate_white_noise(duration, sample_rate, amplitude) for _ in range(self.noise_pool_size)]
+        else:
+            raise ValueError(f"Unknown stimulus kind: {kind}")
+
+        for buffer in buffers:
+            buffer.flags.writeable = False # shared by every trial
+        return buffers
+
+    def get(self, kind, frequency, duration, amplitude, sample_rate=44100):
+        """Returns the buffer of a stimulus, rendering it the first time it is asked for."""
+        key = (kind, frequency, duration, amplitude, sample_rate)
+        buffers = self.buffers.get(key)
+        if buffers is None:
+            with self.lock:
+                buffers = self.buffers.get(key)
+                if buffers is None:
+                    buffers = self.buffers[key] = self.render(*key)
+        return buffers[0] if len(buffers) == 1 else buffers[np.random.randint(len(buffers))]
+
+    def cue(self, name, sample_rate=44100):
+        """Buffer of one of the named cues in STIMULI."""
+        kind, frequency, duration, amplitude = STIMULI[name]
+        return self.get(kind, frequency, duration, amplitude, sample_rate)
+
+    def preload(self, names=None, sample_rate=44100):
+        """Renders the named cues (all of STIMULI by default) ahead of the session."""
+        for name in (STIMULI if names is None else names):
+            self.cue(name, sample_rate)
+
+
+class Playback:
+    """One sound handed to the AudioEngine. onset_time/offset_time are on the wall clock (time.time()) once known,
+    onset_ns is the same onset on the monotonic clock (time.monotonic_ns())."""
+
+    def __init__(self, sound, ttl=None, sample_rate=44100):
+        self.sound = sound
+        self.duration = len(sound) / sample_rate # s
+        self.ttl = ttl # output device (e.g. ttl_stim) that is on while the sound plays
+        self.position = 0 # next sample to play
+        self.onset_time = None # when the first sample reaches the speaker
+        self.onset_ns = None
+        self.offset_time = None # when the last sample has been played
+        self.started = threading.Event() # set when the first buffer was handed to the device (onset_time is known)
+        self.done = threading.Event() # set when the last buffer was handed to the device (offset_time is known)
+
+    def wait_onset(self, timeout=1.0):
+        """Blocks until the sound has started (about one buffer); returns the onset time, or None after timeout."""
+        self.started.wait(timeout)
+        return self.onset_time
+
+    def wait(self, timeout=None):
+        """Blocks until the sound has been played; returns the onset time."""
+        self.done.wait(timeout)
+        if self.offset_time is not None:
+            remaining = self.offset_time - time.time()
+            if remaining > 0:
+                time.sleep(remaining)
+        return self.onset_time
+
+
+class AudioEngine:
+    def __init__(self, sample_rate=44100, frames_per_buffer=256, output_device_index=0):
+        self.sample_rate = sample_rate
+        self.frames_per_buffer = frames_per_buffer # ~5.8 ms at 44.1 kHz
+        self.output_device_index = output_device_index
+        self.pa = None
+        self.stream = None
+        self.playing = [] # sounds being mixed into the output
+        self.ending = [] # sounds whose last sample went out with the previous buffer
+        self.lock = threading.Lock()
+        self.mix = np.zeros(self.frames_per_buffer, dtype=np.float32) # grows if the device asks for more frames
+
+    def start(self):
+        """Opens the output stream (once) and keeps it running, playing silence when there is nothing to play."""
+        with self.lock:
+            if self.stream is not None:
+                return
+            if SIMULATION:
+                self.stream = SimulatedAudioStream(self.sample_rate, self.frames_per_buffer, self.callback)
+                self.stream.start_stream()
+                return
+
+            pa = pyaudio.PyAudio()
+            try:
+                stream = pa.open(format=pyaudio.paFloat32,
+                                 channels=1,
+                                 rate=self.sample_rate,
+                                 output=True,
+                                 output_device_index=self.output_device_index,
+                                 frames_per_buffer=self.frames_per_buffer,
+                                 stream_callback=self.callback)
+            except Exception:
+                pa.terminate()
+                raise
+            self.pa, self.stream = pa, stream
+            self.stream.start_stream()
+            print(f"Audio output open (latency {self.stream.get_output_latency()*1000:.1f} ms)")
+
+    def stop(self):
+        """Closes the output stream."""
+        with self.lock:
+            stream, pa = self.stream, self.pa
+            self.stream = self.pa = None
+            playing, self.playing = self.playing + self.ending, []
+            self.ending = []
+        if stream is not None:
+            stream.stop_stream()
+            stream.close()
+        if pa is not None:
+            pa.terminate()
+        for playback in playing:
+            playback.started.set()
+            playback.done.set()
+
+    def play(self, sound, sample_rate=44100, ttl=None):
+        """Queues a sound (starts with the next buffer) and returns its Playback without waiting."""
+        if sample_rate != self.sample_rate:
+            raise ValueError(f"Sound sample rate {sample_rate} Hz does not match the output stream ({self.sample_rate} Hz)")
+
+        self.start()
+        playback = Playback(np.ascontiguousarray(sound, dtype=np.float32), ttl, sample_rate)
+        with self.lock:
+            self.playing.append(playback)
+        return playback
+
+    def callback(self, in_data, frame_count, time_info, status):
+        """Audio thread - fills one output buffer and stamps the sounds that start or end in it."""
+        if len(self.mix) < frame_count:
+            self.mix = np.zeros(frame_count, dtype=np.float32)
+        mix = self.mix[:frame_count]
+        mix.fill(0)
+
+        # Time when the first sample of this buffer reaches the speaker, on the wall and monotonic clocks
+        # (some ALSA devices report no DAC time - then use the stream latency)
+        dac_time = time_info.get('output_buffer_dac_time', 0) if time_info else 0
+        current_time = time_info.get('current_time', 0) if time_info else 0
+        if dac_time > 0:
+            latency = dac_time - current_time
+        else:
+            latency = self.stream.get_output_latency() if self.stream else 0
+        buffer_ns = time.monotonic_ns() + int(latency * 1e9)
+        buffer_time = time.time() + latency
+
+        starting = [] # sounds with a TTL that start in this buffer
+        with self.lock:
+            # Sounds that ended with the previous buffer - this buffer boundary is their offset
+            for playback in self.ending:
+                playback.done.set()
+            self.ending = []
+
+            for playback in self.playing:
+                n = min(frame_count, len(playback.sound) - playback.position)
+                mix[:n] += playback.sound[playback.position:playback.position + n]
+                if playback.position == 0:
+                    playback.onset_time = buffer_time
+                    playback.onset_ns = buffer_ns
+                    if playback.ttl is not None:
+                        starting.append(playback)
+                    playback.started.set()
+                playback.position += n
+                if playback.position >= len(playback.sound):
+                    playback.offset_time = buffer_time + n / self.sample_rate
+                    self.ending.append(playback)
+            self.playing = [p for p in self.playing if p.position < len(p.sound)]
+
+        # TTL from the onset to the offset of the sound - the timing thread of the pulse scheduler sets both edges
+        for playback in starting:
+            pulse_scheduler.pulse(playback.ttl, playback.duration, at_ns=playback.onset_ns)
+
+        return (mix.tobytes(), 0) # 0 = pyaudio.paContinue
+
+
+# One engine and one stimulus bank for the whole program
+audio_engine = AudioEngine()
+stimulus_bank = StimulusBank()
+
+
+def play_sound_blocking(sound, sample_rate=44100):
+    """Plays a sound on the shared output stream and returns when it is over; returns the onset time."""
+    return audio_engine.play(sound, sample_rate).wait()
+
+def play_sound(sound, sample_rate=44100):
+    return play_sound_blocking(sound, sample_rate)
+
+def play_cue(name, sample_rate=44100):
+    """Plays one of the cues in STIMULI from the stimulus bank; returns the onset time."""
+    return play_sound(stimulus_bank.cue(name, sample_rate), sample_rate)
+
+def play_cue_async(name, ttl=None, sample_rate=44100):
+    """Starts one of the cues in STIMULI and returns its Playback right away (ttl is on while the cue plays)."""
+    return audio_engine.play(stimulus_bank.cue(name, sample_rate), sample_rate, ttl)
+
+def tone_16KHz():
+    return play_cue('16KHz')
+
+def tone_8KHz():
+    return play_cue('8KHz')
+
+def white_noise():
+    return play_cue('white_noise')
@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:20:37 2026
+
+@author: JoanaCatarino
+
+Task engine - the trial loop shared by all the behavior tasks
+- One thread per task runs every trial as an explicit state machine:
+      ITI -> QW (quiet window) -> WW (waiting window) -> cue -> RW (response window) -> outcome -> ITI ...
+- The thread only does two things: it runs the timers that are due (end of the ITI, WW, RW, LEDs off...)
+  and otherwise sleeps on the lick events of the PiezoReader until the next timer is due.
+  Reward pulses are timed by the pulse scheduler, not by these timers.
+  No thread or threading.Timer is created per trial, and all the trial state is only changed by this thread
+- The task classes only supply the policy through the hooks below (what cue to play, which spout is correct,
+  what to count, what to save); the engine decides when things happen
+- Tasks without a waiting window (no WW attribute, e.g. Free Licking) go from the QW straight to the cue,
+  tasks without a cue (present_cue returns None) start the RW when the trial starts
+- The QW and WW use the licks above the threshold of each spout (a WW lick aborts the trial unless ignore_WW_licks). In the RW any contact with a spout is the response
+  (touch events, amplitude-independent like the old detect_licks), except for tasks with RW_touch = False
+- Trial times are taken on the monotonic clock (clock.monotonic_ns(), cannot jump with NTP corrections) and kept as
+  seconds from the start of the session (session_time). tstart is the wall-clock time of that same moment: the pair
+  is written to the session json (clock_anchor), so the wall-clock time of any time t in the csv is tstart + t
+
+Hooks for the tasks (all optional):
+    on_start()                  session starts (reset plots, counters in the GUI)
+    on_stop()                   session stops (outputs off)
+    prepare_trial()             new trial: choose the trial type, update the GUI, LEDs on
+    present_cue()               start the cue, return its Playback (or None)
+    on_early_lick(tlick)        lick in the WW (the trial is aborted)
+    on_response(side, tlick)    first lick in the RW
+    on_omission()               no lick in the RW
+    trial_ended()               the trial is over (LEDs off) - before the data is saved
+    after_trial()               after the data is saved (block switching, performance window)
+    save_data()                 queue the trial row (self.session_writer.write) - written to the csv by the session writer
+"""
+
+import os
+import heapq
+import threading
+import random
+from gpio_map import *
+from pulse_scheduler import pulse
+from sound_generator import play_cue_async
+from session_writer import SessionWriter
+from trial_table import trial_table_path
+from clock import real_clock
+from file_writer import write_clock_anchor
+
+
+class TaskEngine:
+
+    task_name = 'Task' # used in the start/stop messages
+    QW_from_start = False # True: the QW only counts from the moment it starts (quiet during the ITI does not count)
+    reward_ttl = None # output device that is on while the valve is open (e.g. ttl_reward)
+    save_on_stop = False # True: the trial that is running when the task is stopped is saved (with tend = stop time)
+    cue_onset_timeout = 0.1 # s - longest the task thread waits for the onset of a cue before starting the RW without it
+    ignore_WW_licks = False # True: licks in the WW do not abort the trial ("Ignore licks during WW" in the GUI)
+    RW_touch = True # True: any contact with a spout (sample > 0) is the response, whatever its amplitude; False: only licks above the threshold
+    clock = real_clock # all the times of the task (see clock.py) - the replay and the fast simulation use a SimulatedClock
+
+    def __init__(self, gui_controls, csv_file_path):
+
+        # Directory to save file with trials data
+        self.csv_file_path = csv_file_path
+        self.save_dir = os.path.dirname(csv_file_path)
+        os.makedirs(self.save_dir, exist_ok=True)
+        self.file_path = csv_file_path # use the csv file name
+
+        # Connection to GUI
+        self.gui_controls = gui_controls
+        self.piezo_reader = gui_controls.piezo_reader
+
+        # Counters
+        self.total_trials = 0
+        self.total_licks = 0
+        self.licks_left = 0
+        self.licks_right = 0
+
+        # Time variables
+        self.tstart = None # start of the task (wall clock)
+        self.t0_ns = None # start of the task (monotonic ns) - all the other times are seconds from here
+        self.ttrial = None # start of the trial
+        self.tlick = None # time of 1st lick within response window
+        self.RW_start = None # start of response window
+        self.tend = None # end of trial
+        self.trial_duration = None # trial duration
+
+        self.first_lick = None # side of the first lick in the response window
+        self.punishment_cue = None # Playback of the punishment noise of the trial (the ITI starts when it ends)
+        self.trial_saved = False
+
+        # Checkboxes of the GUI - copied in by GuiControls.update_task_options on the GUI thread (the task thread never reads widgets)
+        self.no_punishment = False
+        self.ignore_licks_WW = False
+        self.automatic_rewards = False
+
+        # Engine state
+        self.running = False
+        self.state = 'idle' # 'ITI', 'QW', 'WW', 'cue', 'RW' (only changed by the task thread)
+        self.timers = [] # heap of [deadline (monotonic), seq, callback, args]
+        self.timer_seq = 0
+        self.state_timer = None # timer that ends the current state (ITI, QW check, WW or RW)
+        self.QW_anchor = 0 # sample index where the current QW started
+        self.lick_cursor = 0
+        self.thread = None
+        self.session_writer = None # writes the trial rows to the csv (and the typed trial table) on its own thread
+
+
+    def start(self):
+        print(f'{self.task_name} starting')
+
+        self.open_session()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def open_session(self):
+        """Everything start() does except starting the task thread (the replay drives the engine itself)."""
+        # Pumps are active low - on() keeps the valves closed
+        pump_l.on()
+        pump_r.on()
+
+        # Lick events from the piezo reader (thresholds are kept in sync by update_task_params)
+        self.piezo_reader.set_thresholds(self.threshold_left, self.threshold_right)
+        self.lick_cursor = self.piezo_reader.lick_cursor()
+
+        self.session_writer = SessionWriter(self.csv_file_path, table_path=trial_table_path(self.csv_file_path))
+        self.on_start()
+
+        self.running = True
+        # Clock anchor: the same moment on the monotonic clock and on the wall clock
+        self.t0_ns = self.clock.monotonic_ns()
+        self.tstart = self.clock.time()
+        write_clock_anchor(self.csv_file_path, self.tstart, self.t0_ns)
+
+        # The first trial only waits for the quiet window
+        self.call_later(0, self.enter_quiet_window)
+
+
+    def stop(self):
+        print(f"Stopping {self.task_name}...")
+
+        self.running = False
+        self.piezo_reader.release_waiters() # wake the task thread if it is waiting for a lick
+
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join()
+
+        # Save the trial that was running when the task was stopped (tasks that ask for it)
+        if self.save_on_stop and self.state in ('WW', 'cue', 'RW') and not self.trial_saved:
+            self.tend = self.now()
+            self.trial_duration = self.tend - self.ttrial
+            self.gui_controls.update_trial_duration(self.trial_duration)
+            self.save_data()
+            self.trial_saved = True
+            print("Saved trial during manual stop.")
+
+        self.timers = []
+        self.state = 'idle'
+        if self.reward_ttl is not None:
+            self.reward_ttl.off()
+        pump_l.on()
+        pump_r.on()
+        self.on_stop()
+
+        if self.session_writer is not None:
+            self.session_writer.close() # writes the trials that are still queued
+
+
+    # Timers (only used from the task thread, or before it starts)
+
+    def call_later(self, delay, callback, *args):
+        """Runs callback(*args) on the task thread `delay` seconds from now; returns the timer (for cancel_timer)."""
+        self.timer_seq += 1
+        timer = [self.clock.monotonic() + max(0, delay), self.timer_seq, callback, args]
+        heapq.heappush(self.timers, timer)
+        return timer
+
+    def cancel_timer(self, timer):
+        if timer is not None:
+            timer[2] = None # dropped when it comes up
+
+    def next_deadline(self):
+        """Deadline (clock.monotonic()) of the next timer, or None if there is none."""
+        while self.timers and self.timers[0][2] is None:
+            heapq.heappop(self.timers) # cancelled
+        return self.timers[0][0] if self.timers else None
+
+    def run_timers(self):
+        """Runs the timers that are due; returns the time until the next one (None if there is none)."""
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None:
+                return None
+            delay = deadline - self.clock.monotonic()
+            if delay > 0:
+                return delay
+            _, _, callback, args = heapq.heappop(self.timers)
+            callback(*args)
+
+
+    def session_time(self, t_ns):
+        """Converts a monotonic time (ns, e.g. LickEvent.t_ns) to seconds from the start of the session."""
+        return (t_ns - self.t0_ns) / 1e9
+
+    def now(self):
+        """Seconds from the start of the session."""
+        return self.session_time(self.clock.monotonic_ns())
+
+    def cue_onset(self, cue):
+        """
+        Waits for the measured onset of a cue and returns it in session time, or None. This blocks the task thread
+        for about one audio buffer (licks that arrive meanwhile are handled right after, with their own times).
+        """
+        if cue is None or cue.wait_onset(self.cue_onset_timeout) is None:
+            return None
+        return self.session_time(cue.onset_ns)
+
+
+    def next_ITI(self):
+        """ITI after the trial that is ending: a random draw between ITI_min and ITI_max (the replay can pass the recorded one)."""
+        return round(random.uniform(self.ITI_min, self.ITI_max),1)
+
+
+    def cue_remaining(self, cue):
+        """Seconds until the last sample of a cue has been played (0 without a cue, or once it has ended)."""
+        if cue is None or cue.onset_ns is None:
+            return 0.0
+        return max(0.0, self.session_time(cue.onset_ns) + cue.duration - self.now())
+
+
+    def run(self):
+        """Task thread: runs the timers and hands the lick events to the current state."""
+        while self.running:
+            delay = self.run_timers()
+            timeout = 0.1 if delay is None else min(delay, 0.1) # also bounds how long stop() waits for this thread
+            event = self.piezo_reader.wait_for_lick(self.lick_cursor, timeout=timeout)
+            if event is not None and self.running:
+                self.lick_cursor = event.seq
+                self.handle_lick(event)
+
+    def poll_licks(self):
+        """Handles the lick events that are already waiting (without blocking)."""
+        while True:
+            event = self.piezo_reader.wait_for_lick(self.lick_cursor, timeout=0)
+            if event is None:
+                return
+            self.lick_cursor = event.seq
+            self.handle_lick(event)
+
+    def handle_lick(self, event):
+        tlick = self.session_time(event.t_ns)
+        if self.state == 'RW':
+            if event.kind != ('touch' if self.RW_touch else 'lick'):
+                return
+            if self.first_lick is None and self.RW_start <= tlick < self.RW_start + self.RW:
+                self.first_lick = event.side
+                self.tlick = tlick
+                self.on_response(event.side, tlick)
+                self.end_trial()
+            return
+
+        if event.kind != 'lick': # the QW and WW use the lick threshold
+            return
+        if self.state == 'QW':
+            print('Licks detected during Quiet Window')
+            self.check_quiet_window() # start counting again from this lick
+
+        elif self.state == 'WW' and not self.ignore_WW_licks:
+            if tlick >= self.ttrial: # ignore licks from before the trial that were still queued
+                print("Lick detected during WW! Aborting trial.")
+                self.early_lick(tlick)
+
+
+    # States
+
+    def set_state(self, state, delay=None, callback=None):
+        """Moves to a new state; if delay is given, callback ends the state after delay seconds."""
+        self.cancel_timer(self.state_timer)
+        self.state = state
+        self.state_timer = self.call_later(delay, callback) if callback is not None else None
+
+    def enter_quiet_window(self):
+        self.set_state('QW')
+        self.QW_anchor, _ = self.piezo_reader.quiet.state() # first sample that counts when QW_from_start
+        self.check_quiet_window()
+
+    def check_quiet_window(self):
+        """Starts the trial if both spouts were quiet for the last QW seconds, otherwise checks again when they can be."""
+        if self.QW == 0:
+            self.begin_trial()
+            return
+
+        required_samples = int(self.QW*60) # Serial runs in 60 Hz
+        sample_count, quiet_samples = self.piezo_reader.quiet.state()
+        if self.QW_from_start:
+            quiet_samples = min(quiet_samples, sample_count - self.QW_anchor)
+
+        if quiet_samples >= required_samples:
+            self.begin_trial()
+        else:
+            self.set_state('QW', (required_samples - quiet_samples) / 60, self.check_quiet_window)
+
+    def begin_trial(self):
+        self.set_state('trial')
+        self.trial_saved = False
+        self.total_trials += 1
+        self.gui_controls.update_total_trials(self.total_trials)
+        self.ttrial = self.now() # Update trial start time
+        self.first_lick = None # Reset first lick at the start of each trial
+        self.RW_start = None
+        self.punishment_cue = None
+
+        self.prepare_trial()
+
+        WW = getattr(self, 'WW', 0) # tasks without a waiting window don't have WW
+        if WW:
+            # Spout already touched when the WW starts
+            if not self.ignore_WW_licks and any(self.piezo_reader.latest_above()):
+                print("Lick detected during WW! Aborting trial.")
+                self.early_lick(self.session_time(self.piezo_reader.latest_sample_time_ns()))
+                return
+            self.set_state('WW', WW, self.start_cue)
+        else:
+            self.start_cue()
+
+    def early_lick(self, tlick):
+        self.on_early_lick(tlick)
+        self.end_trial()
+
+    def start_cue(self):
+        self.set_state('cue')
+        cue = self.present_cue()
+        if self.state != 'cue':
+            return # the task already ended the trial (e.g. automatic reward)
+
+        # Start the response window at the measured onset of the cue (about one audio buffer from now)
+        onset = self.cue_onset(cue)
+        self.RW_start = onset if onset is not None else self.now()
+        self.set_state('RW', self.RW_start + self.RW - self.now(), self.response_window_over)
+
+    def response_window_over(self):
+        # Licks that were stamped inside the RW but are still waiting to be handled count
+        self.poll_licks()
+        if self.state != 'RW':
+            return
+
+        print('No licks detected - aborting trial')
+        self.on_omission()
+        self.end_trial()
+
+    def end_trial(self):
+        """Outcome: stamps the end of the trial, saves it and starts the ITI."""
+        self.set_state('ITI')
+        self.tend = self.now()
+        self.trial_duration = (self.tend - self.ttrial)
+        self.gui_controls.update_trial_duration(self.trial_duration)
+        self.trial_ended()
+
+        self.ITI = self.next_ITI()
+        if not self.trial_saved:
+            self.save_data()
+            self.trial_saved = True
+        self.after_trial()
+
+        # After a punishment the ITI starts when the noise ends (the timeout is not shortened by the noise)
+        noise = self.cue_remaining(self.punishment_cue)
+        print(f"ITI duration: {self.ITI} seconds" + (f" (+{noise:.2f} s of noise)" if noise else ""))
+        self.set_state('ITI', self.ITI + noise, self.enter_quiet_window)
+
+
+    # Outputs
+
+    def reward(self, side):
+        """Opens the valve of `side` for valve_opening seconds; the pulse scheduler closes it, so the task thread keeps running."""
+        pump = pump_l if side == 'left' else pump_r
+        if self.reward_ttl is not None:
+            self.pulse_output(self.reward_ttl, self.valve_opening)
+        self.pulse_output(pump, self.valve_opening, value=0, callback=self.reward_delivered) # active low - 0 opens the valve
+        self.reward_time = self.now()
+
+    def reward_delivered(self, valve):
+        side = 'left' if valve.device is pump_l else 'right'
+        print(f'Reward delivered - {side} ({valve.width*1000:.2f} ms{"" if valve.measured else " planned"})')
+
+    def pulse_output(self, device, duration, value=1, callback=None):
+        """Timed pulse on an output (see pulse_scheduler); the replay swaps in a stub."""
+        return pulse(device, duration, value, callback)
+
+    def play_cue(self, name, ttl=None):
+        """Starts one of the cues of the stimulus bank and returns its Playback (see sound_generator); the replay swaps in a stub."""
+        return play_cue_async(name, ttl)
+
+    def count_lick(self, side):
+        """Adds a lick to the counters and the GUI."""
+        self.total_licks += 1
+        if side == 'left':
+            self.licks_left += 1
+            self.gui_controls.update_licks_left(self.licks_left)
+        else:
+            self.licks_right += 1
+            self.gui_controls.update_licks_right(self.licks_right)
+        self.gui_controls.update_total_licks(self.total_licks)
+
+
+    # Policy hooks (overridden by the tasks)
+
+    def on_start(self):
+        pass
+
+    def on_stop(self):
+        pass
+
+    def prepare_trial(self):
+        pass
+
+    def present_cue(self):
+        return None
+
+    def on_early_lick(self, tlick):
+        pass
+
+    def on_response(self, side, tlick):
+        pass
+
+    def on_omission(self):
+        pass
+
+    def trial_ended(self):
+        pass
+
+    def after_trial(self):
+        pass
+
+    def save_data(self):
+        pass
@@ -1,382 +1,133 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Sat Jul 20 17:47:58 2024
-
-@author: JoanaCatarino
-
- -- Free Licking task --
- 
-- First training stage
-- The goal of this task is to make the animals familiarized with the spouts and the reward type they give (2uL sucrose water)
-- In this task animals should receive a reward when they lick either of the spouts
-- Criterion: After 100 licks a Quiet window starts to be introduced
-    - First quite winfdow is 1 sec, after 100 licks it moves to 2 sec and after another 100 licks to 3s.
-    - After the QW=3s is achieved, a full session of 3s is done - If 100 licks are achieved in this session, the animal is moved to the next training stage
-
-Important
-- when pump is set to ON it is actually OFF and when it is set to OFF it is pumping water
-
-Version - 2025 saved in the drive (Behavior - Protocols)
-New version - jan 2026
-"""
-
-import threading
-import numpy as np
-import time
-import csv
-import os
-import random
-from PyQt5.QtCore import QTimer
-from piezo_reader import PiezoReader
-from file_writer import create_data_file
-from gpio_map import *
-
-
-class FreeLickingTask:
-    
-    def __init__(self, gui_controls, csv_file_path): 
-    
-        # Directory to save file with trials data
-        self.csv_file_path = csv_file_path
-        self.save_dir = os.path.dirname(csv_file_path)
-        os.makedirs(self.save_dir, exist_ok=True)
-        self.file_path = csv_file_path # use the csv file name
-        
-        # Connection to GUI
-        self.gui_controls = gui_controls
-        self.piezo_reader = gui_controls.piezo_reader  
-
-        # Experiment parameters
-        self.QW = 0 # Quiet window in seconds
-        self.ITI_min = 0.1 # default ITI min
-        self.ITI_max = 0.1 # default ITI max
-        self.ITI = round(random.uniform(self.ITI_min, self.ITI_max),1) # in this case the ITI is always 0.1, to create more opportunities for the mouse to lick
-        self.RW = 3 # Response window in seconds
-        self.threshold_left = 1
-        self.threshold_right = 1
-        self.valve_opening = 0.08 # Reward duration   
-        
-        # Counters
-        self.total_trials = 0
-        self.total_licks = 0
-        self.licks_left = 0
-        self.licks_right = 0
-        
-        # Booleans
-        self.trialstarted = False
-        self.running = False
-        self.first_trial = True
-        self.next_trial_eligible = False
-        self.is_rewarded = False
-        
-        # Time variables
-        self.tstart = None # start of the task
-        self.ttrial = None # start of the trial
-        self.tlick = None # time of 1st lick within response window
-        self.tend = None # end of trial
-        self.trial_duration = None # trial duration
-        self.RW_start = None # start of response window
-        self.reward_time = None # time reward is delivered
-        
-        # Lock for thread-safe operations
-        self.lock = threading.Lock()
-        
-        self.first_lick = None
-        
-        self.trial_saved = False 
-        
-
-    def start (self):
-        print ('Free Licking task starting')
-        
-        # Turn the LEDS ON initially
-        pump_l.on()
-        pump_r.on()
-        
-        self.gui_controls.lick_plot.reset_plot() # Plot main tab
-        self.gui_controls.lick_plot_ov.reset_plot() # Plot overview tab
-        
-        self.running = True
-        self.tstart = time.time() # record the start time
-        
-        # Start main loop in a separate thread
-        self.print_thread = threading.Thread(target=self.main, daemon=True)
-        self.print_thread.start()   
-        
-        
-    def stop(self):
-        print("Stopping Free Licking Task...")
-        
-        self.running = False
-        
-        if self.print_thread.is_alive():
-            self.print_thread.join()
-        pump_l.on() 
-        pump_r.on()
-        
-    
-    def check_animal_quiet(self):
-        """Count QW only from call time; if any lick happens during QW, restart the timer."""
-        if self.QW == 0:  
-            return True
-    
-        SAMPLERATE = 60.0  # Hz
-        anchor = time.time()  # when we started counting quiet
-    
-        while self.running:
-            # Read buffers
-            p1 = np.array(self.piezo_reader.piezo_adder1, dtype=np.uint16)
-            p2 = np.array(self.piezo_reader.piezo_adder2, dtype=np.uint16)
-    
-            # How many samples correspond to time since we started counting quiet?
-            elapsed = time.time() - anchor
-            samples_needed = int(elapsed * SAMPLERATE)
-            if samples_needed <= 0:
-                time.sleep(0.005)
-                continue
-    
-            # Look only at samples collected SINCE 'anchor'
-            n1 = min(samples_needed, p1.size)
-            n2 = min(samples_needed, p2.size)
-            win1 = p1[-n1:] if n1 > 0 else None
-            win2 = p2[-n2:] if n2 > 0 else None
-    
-            # Any activity in that window? (> threshold; change to >0 for amplitude-independent)
-            active_left  = (win1 is not None) and win1.size and (win1.max() > self.threshold_left)
-            active_right = (win2 is not None) and win2.size and (win2.max() > self.threshold_right)
-            active = active_left or active_right
-    
-            if active:
-                # Restart quiet timing because a lick occurred during QW
-                anchor = time.time()
-                print('Licks detected during Quiet Window')
-    
-            elif elapsed >= self.QW:
-                # Achieved continuous quiet for QW seconds since 'anchor'
-                return True
-    
-            time.sleep(0.005)
-    
-        return False
-
-
-    
-     
-    def start_trial(self):
-        
-        """ Initiates a trial, runs LED in parallel, and logs trial start"""
-        
-        with self.lock:
-            self.trial_saved = False 
-            self.trialstarted = True
-            self.total_trials +=1
-            self.gui_controls.update_total_trials(self.total_trials)
-            self.ttrial = time.time() # Update trial start time
-            self.RW_start = time.time() # Start response window
-            self.first_lick = None # Reset first lick at the start of each trial
-            self.reward_time = None # Reset reward delivery time at the start of each trial
-            self.is_rewarded = False
-            self.data_saved = False
-            
-            print(f'Trial: {self.total_trials}')
-            
-            # Wait for response window to finish if no lick happens
-            threading.Thread(target=self.wait_for_response, daemon=True).start()
-            
-    def wait_for_response(self):
-        self.timer_3 = threading.Timer(self.RW, self.noresponse_callback)
-        self.timer_3.start()
-        
-    
-    def noresponse_callback(self):
-        print('No licks detected - aborting trial')
-        self.trialstarted = False
-        self.tend = time.time()
-        self.trial_duration = (self.tend-self.ttrial)
-        self.gui_controls.update_trial_duration(self.trial_duration)
-        self.next_trial_eligible = True
-        # Update live stair plot
-        self.gui_controls.update_lick_plot(self.total_trials, self.total_licks, self.licks_left, self.licks_right)
-    
-        # Save trial data
-        self.save_data() 
-        
-        
-    def detect_licks(self):
-        """Detect any lick (amplitude-independent) during the response window and handle outcome."""
-    
-        # Grab current buffers (60 Hz stream; values assumed unsigned integers)
-        p1 = np.array(self.piezo_reader.piezo_adder1, dtype=np.uint16)  # left
-        p2 = np.array(self.piezo_reader.piezo_adder2, dtype=np.uint16)  # right
-    
-        # Tiny sleep to reduce CPU churn
-        time.sleep(0.001)
-    
-        # Helper: timestamp of the first non-zero sample in a buffer; None if no lick
-        def first_nonzero_time(buf):
-            if buf.size == 0 or buf.max() == 0:
-                return None
-            first_idx = np.flatnonzero(buf > 0)[0]
-            # Reconstruct wall-clock time of that sample (buffer is latest at the end; 60 Hz)
-            return time.time() - (1/60.0) * (len(buf) - first_idx)
-    
-        t_left  = first_nonzero_time(p1)
-        t_right = first_nonzero_time(p2)
-    
-        # Response window in FreeLickingTask is [ttrial, ttrial+RW)
-        if self.ttrial is None:
-            return
-        in_rw_left  = (t_left  is not None) and (self.ttrial < t_left  < self.RW_start + self.RW)
-        in_rw_right = (t_right is not None) and (self.ttrial < t_right < self.RW_start + self.RW)
-    
-        # Nothing to do or we already handled the first lick
-        if not (in_rw_left or in_rw_right) or self.first_lick is not None:
-            return
-    
-        # Pick the earliest lick if both occurred
-        if in_rw_left and in_rw_right:
-            side, tlick = (('left', t_left) if t_left <= t_right else ('right', t_right))
-        elif in_rw_left:
-            side, tlick = 'left', t_left
-        else:
-            side, tlick = 'right', t_right
-    
-        with self.lock:
-            # Double-check no one beat us to it
-            if self.first_lick is not None:
-                return
-    
-            self.first_lick = side
-            self.tlick = tlick
-    
-            # Reward (non-blocking)
-            threading.Thread(target=self.reward, args=(side,)).start()
-            self.is_rewarded = True
-    
-            # Counters & GUI
-            self.total_licks += 1
-            if side == 'left':
-                self.licks_left += 1
-                self.gui_controls.update_licks_left(self.licks_left)
-            else:
-                self.licks_right += 1
-                self.gui_controls.update_licks_right(self.licks_right)
-            self.gui_controls.update_total_licks(self.total_licks)
-    
-            # End trial
-            if hasattr(self, 'timer_3') and self.timer_3:
-                try:
-                    self.timer_3.cancel()
-                except Exception:
-                    pass
-            self.trialstarted = False
-            self.tend = time.time()
-            self.trial_duration = (self.tend - self.ttrial)
-            self.gui_controls.update_trial_duration(self.trial_duration)
-            self.next_trial_eligible = True
-    
-            # Live stair plot
-            self.gui_controls.update_lick_plot(self.total_trials, self.total_licks, self.licks_left, self.licks_right)
-    
-            # Save trial once
-            if not self.trial_saved:
-                self.save_data()
-                self.trial_saved = True
-
-    
-    def reward(self, side):
-        
-        """Delivers a reward without blocking the main loop."""
-    
-        if side == 'left':
-            pump_l.off()
-            time.sleep(self.valve_opening)
-            pump_l.on()
-            self.reward_time = time.time()
-            print('Reward delivered - left')
-            
-        elif side == 'right':
-            pump_r.off()
-            time.sleep(self.valve_opening)
-            pump_r.on()
-            self.reward_time = time.time()
-            print('Reward delivered - right')
-    
-        
-        
-    def main(self):
-        
-        while self.running:
-            if self.first_trial:
-                print(f"ITI duration: {self.ITI} seconds")  # Print ITI value for debugging
-                if self.check_animal_quiet():
-                    self.start_trial()
-                    self.first_trial = False
-                    self.ITI = round(random.uniform(self.ITI_min, self.ITI_max),1)
-                else:
-                    pass
-                
-            if self.next_trial_eligible == True and ((time.time() - (self.tend)) >= self.ITI) and not self.trialstarted:
-                print(f"ITI duration: {self.ITI} seconds")  # Print ITI value for debugging
-                if self.check_animal_quiet():
-                    self.start_trial()
-                    self.next_trial_eligible = False
-                    self.ITI = round(random.uniform(self.ITI_min, self.ITI_max),1)
-             
-            self.detect_licks()
-            
-            
-    def save_data(self):
-        """ Saves trial data, ensuring missing variables are filled with NaN while maintaining structure. """
-    
-        # Determine if omission happened
-        was_omission = getattr(self, 'omission_counted', False) and not getattr(self, 'first_lick', None)
-    
-        # Define trial data, using hasattr() to check for missing variables
-        trial_data = [
-            np.nan if not hasattr(self, 'total_trials') else self.total_trials,  # trial number
-            np.nan if not hasattr(self, 'ttrial') else self.ttrial,  # trial start
-            np.nan if not hasattr(self, 'RW_start') else self.RW_start, # Response window start
-            np.nan if not hasattr(self, 'tend') else self.tend,  # trial end
-            np.nan if not hasattr(self, 'trial_duration') else self.trial_duration,  # trial duration
-            np.nan if not hasattr(self, 'ITI') else self.ITI,  # ITI
-            np.nan if not hasattr(self, 'current_block') else self.current_block,  # block
-            np.nan if not hasattr(self, 'early_lick_counted') else (1 if self.early_lick_counted else 0),  # early licks
-            np.nan if not hasattr(self, 'early_lick_time') else self.early_lick_time,  # early licks time
-            np.nan if not hasattr(self, 'sound_played') else (1 if self.sound_played else 0),  # stim
-            np.nan if not hasattr(self, 'current_tone') else (1 if self.current_tone == '8KHz' else 0),  # 8KHz
-            np.nan if not hasattr(self, 'current_tone') else (1 if self.current_tone == '16KHz' else 0),  # 16KHz 
-            np.nan if not hasattr(self, 'stim_time') else self.stim_time, # stim (tone) time            
-            np.nan if not hasattr(self, 'first_lick') else (1 if self.first_lick else 0),  # lick
-            np.nan if not hasattr(self, 'first_lick') else (1 if self.first_lick == 'left' else 0),  # left spout
-            np.nan if not hasattr(self, 'first_lick') else (1 if self.first_lick == 'right' else 0),  # right spout
-            np.nan if not hasattr(self, 'tlick') else (self.tlick if self.first_lick else np.nan),  # lick_time
-            np.nan if not hasattr(self, 'is_rewarded') else (1 if self.is_rewarded else 0),  # reward
-            np.nan if not hasattr(self, 'is_punished') else (1 if self.is_punished else 0),  # punishment
-            np.nan if not hasattr(self, 'first_lick') else (1 if was_omission else 0),  # omission
-            np.nan if not hasattr(self, 'reward_time') else self.reward_time, # time reward is delivered
-            np.nan if not hasattr(self, 'punishment_time') else self.punishment_time, # time punishment is delivered
-            np.nan if not hasattr(self, 'RW') else self.RW,
-            np.nan if not hasattr(self, 'QW') else self.QW,
-            np.nan if not hasattr(self, 'WW') else self.WW,
-            np.nan if not hasattr(self, 'valve_opening') else self.valve_opening,
-            np.nan if not hasattr(self, 'ITI_min') else self.ITI_min,
-            np.nan if not hasattr(self, 'ITI_max') else self.ITI_max,
-            np.nan if not hasattr(self, 'threshold_left') else self.threshold_left,
-            np.nan if not hasattr(self, 'threshold_right') else self.threshold_right,
-            1 if self.gui_controls.ui.chk_NoPunishment.isChecked() else np.nan,
-            1 if self.gui_controls.ui.chk_IgnoreLicksWW.isChecked() else np.nan,
-            np.nan if not hasattr(self, 'catch_trial_counted') else (1 if self.catch_trial_counted else 0),  # catch trials
-            np.nan if not hasattr(self, 'is_distractor_trial') else (1 if self.is_distractor_trial else 0),  # Distractor trial flag
-            np.nan if not hasattr(self, 'distractor_led') else (1 if self.distractor_led == "left" else 0),  # Distractor on left
-            np.nan if not hasattr(self, 'distractor_led') else (1 if self.distractor_led == "right" else 0),  # Distractor on right
-            np.nan if not hasattr(self, 'tstart') else self.tstart  # session start
-        ]
-    
-  
-        # Append data to the CSV file
-        with open(self.csv_file_path, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(trial_data)
-            
-    
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Jul 20 17:47:58 2024
+
+@author: JoanaCatarino
+
+ -- Free Licking task --
+ 
+- First training stage
+- The goal of this task is to make the animals familiarized with the spouts and the reward type they give (2uL sucrose water)
+- In this task animals should receive a reward when they lick either of the spouts
+- Criterion: After 100 licks a Quiet window starts to be introduced
+    - First quite winfdow is 1 sec, after 100 licks it moves to 2 sec and after another 100 licks to 3s.
+    - After the QW=3s is achieved, a full session of 3s is done - If 100 licks are achieved in this session, the animal is moved to the next training stage
+
+Important
+- when pump is set to ON it is actually OFF and when it is set to OFF it is pumping water
+
+Version - 2025 saved in the drive (Behavior - Protocols)
+New version - jan 2026
+"""
+
+import numpy as np
+import os
+import random
+from PyQt5.QtCore import QTimer
+from piezo_reader import PiezoReader
+from file_writer import create_data_file
+from gpio_map import *
+from task_engine import TaskEngine
+
+
+class FreeLickingTask(TaskEngine):
+    
+    task_name = 'Free Licking Task'
+    QW_from_start = True # Count QW only from the moment it starts; if any lick happens during QW, restart the timer
+    
+    def __init__(self, gui_controls, csv_file_path): 
+        super().__init__(gui_controls, csv_file_path)
+
+        # Experiment parameters
+        self.QW = 0 # Quiet window in seconds
+        self.ITI_min = 0.1 # default ITI min
+        self.ITI_max = 0.1 # default ITI max
+        self.ITI = round(random.uniform(self.ITI_min, self.ITI_max),1) # in this case the ITI is always 0.1, to create more opportunities for the mouse to lick
+        self.RW = 3 # Response window in seconds
+        self.threshold_left = 1
+        self.threshold_right = 1
+        self.valve_opening = 0.08 # Reward duration   
+        
+        # Booleans
+        self.is_rewarded = False
+        
+        # Time variables
+        self.reward_time = None # time reward is delivered
+        
+
+    def on_start(self):
+        self.gui_controls.lick_plot.reset_plot() # Plot main tab
+        self.gui_controls.lick_plot_ov.reset_plot() # Plot overview tab
+        
+     
+    def prepare_trial(self):
+        self.reward_time = None # Reset reward delivery time at the start of each trial
+        self.is_rewarded = False
+        print(f'Trial: {self.total_trials}')
+        # No cue - the response window starts with the trial
+        
+
+    def on_response(self, side, tlick):
+        """ First lick in the response window: reward on the licked spout """
+        self.reward(side)
+        self.is_rewarded = True
+        self.count_lick(side)
+        
+    
+    def trial_ended(self):
+        # Update live stair plot
+        self.gui_controls.update_lick_plot(self.total_trials, self.total_licks, self.licks_left, self.licks_right)
+            
+            
+    def save_data(self):
+        """ Saves trial data, ensuring missing variables are filled with NaN while maintaining structure. """
+    
+        # Determine if omission happened
+        was_omission = getattr(self, 'omission_counted', False) and not getattr(self, 'first_lick', None)
+    
+        # Define trial data, using hasattr() to check for missing variables
+        trial_data = [
+            np.nan if not hasattr(self, 'total_trials') else self.total_trials,  # trial number
+            np.nan if not hasattr(self, 'ttrial') else self.ttrial,  # trial start
+            np.nan if not hasattr(self, 'RW_start') else self.RW_start, # Response window start
+            np.nan if not hasattr(self, 'tend') else self.tend,  # trial end
+            np.nan if not hasattr(self, 'trial_duration') else self.trial_duration,  # trial duration
+            np.nan if not hasattr(self, 'ITI') else self.ITI,  # ITI
+            np.nan if not hasattr(self, 'current_block') else self.current_block,  # block
+            np.nan if not hasattr(self, 'early_lick_counted') else (1 if self.early_lick_counted else 0),  # early licks
+            np.nan if not hasattr(self, 'early_lick_time') else self.early_lick_time,  # early licks time
+            np.nan if not hasattr(self, 'sound_played') else (1 if self.sound_played else 0),  # stim
+            np.nan if not hasattr(self, 'current_tone') else (1 if self.current_tone == '8KHz' else 0),  # 8KHz
+            np.nan if not hasattr(self, 'current_tone') else (1 if self.current_tone == '16KHz' else 0),  # 16KHz 
+            np.nan if not hasattr(self, 'stim_time') else self.stim_time, # stim (tone) time            
+            np.nan if not hasattr(self, 'first_lick') else (1 if self.first_lick else 0),  # lick
+            np.nan if not hasattr(self, 'first_lick') else (1 if self.first_lick == 'left' else 0),  # left spout
+            np.nan if not hasattr(self, 'first_lick') else (1 if self.first_lick == 'right' else 0),  # right spout
+            np.nan if not hasattr(self, 'tlick') else (self.tlick if self.first_lick else np.nan),  # lick_time
+            np.nan if not hasattr(self, 'is_rewarded') else (1 if self.is_rewarded else 0),  # reward
+            np.nan if not hasattr(self, 'is_punished') else (1 if self.is_punished else 0),  # punishment
+            np.nan if not hasattr(self, 'first_lick') else (1 if was_omission else 0),  # omission
+            np.nan if not hasattr(self, 'reward_time') else self.reward_time, # time reward is delivered
+            np.nan if not hasattr(self, 'punishment_time') else self.punishment_time, # time punishment is delivered
+            np.nan if not hasattr(self, 'RW') else self.RW,
+            np.nan if not hasattr(self, 'QW') else self.QW,
+            np.nan if not hasattr(self, 'WW') else self.WW,
+            np.nan if not hasattr(self, 'valve_opening') else self.valve_opening,
+            np.nan if not hasattr(self, 'ITI_min') else self.ITI_min,
+            np.nan if not hasattr(self, 'ITI_max') else self.ITI_max,
+            np.nan if not hasattr(self, 'threshold_left') else self.threshold_left,
+            np.nan if not hasattr(self, 'threshold_right') else self.threshold_right,
+            1 if self.no_punishment else np.nan,
+            1 if self.ignore_licks_WW else np.nan,
+            np.nan if not hasattr(self, 'catch_trial_counted') else (1 if self.catch_trial_counted else 0),  # catch trials
+            np.nan if not hasattr(self, 'is_distractor_trial') else (1 if self.is_distractor_trial else 0),  # Distractor trial flag
+            np.nan if not hasattr(self, 'distractor_led') else (1 if self.distractor_led == "left" else 0),  # Distractor on left
+            np.nan if not hasattr(self, 'distractor_led') else (1 if self.distractor_led == "right" else 0),  # Distractor on right
+            np.nan if not hasattr(self, 'tstart') else self.tstart  # session start
+        ]
+    
+  
+        # Queue the row for the session writer (written to the CSV file on its own thread)
+        self.session_writer.write(trial_data)
+            
+    
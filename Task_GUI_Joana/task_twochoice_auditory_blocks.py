@@ -14,37 +14,27 @@ New version - jan 2026
 """
 
 
-import threading
 import numpy as np
-import time
 import csv
 import os
 import random
-from collections import deque
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QColor, QPalette
 from piezo_reader import PiezoReader
 from file_writer import create_data_file
 from gpio_map import *
-from sound_generator import tone_16KHz, tone_8KHz, white_noise
+from task_engine import TaskEngine
 from pathlib import Path
 
 
-class TwoChoiceAuditoryTask_Blocks:
+class TwoChoiceAuditoryTask_Blocks(TaskEngine):
     
-    def __init__(self, gui_controls, csv_file_path): 
+    task_name = 'Two-Choice Auditory Task with Blocks'
     
-        # Directory to save file with trials data
-        self.csv_file_path = csv_file_path
-        self.save_dir = os.path.dirname(csv_file_path)
-        os.makedirs(self.save_dir, exist_ok=True)
-        self.file_path = csv_file_path # use the csv file name
+    def __init__(self, gui_controls, csv_file_path): 
+        super().__init__(gui_controls, csv_file_path)
         self.trials = [] # list to store trial data
         
-        # Connection to GUI
-        self.gui_controls = gui_controls
-        self.piezo_reader = gui_controls.piezo_reader
-        
         # Get the selected Animal ID from the GUI dropdown
         self.animal_id = str(self.gui_controls.ui.ddm_Animal_ID.currentText()).strip()
         
@@ -66,10 +56,6 @@ class TwoChoiceAuditoryTask_Blocks:
         self.WW = 1 # waiting window
         
         # Counters
-        self.total_trials = 0
-        self.total_licks = 0
-        self.licks_left = 0
-        self.licks_right = 0
         self.correct_trials = 0
         self.incorrect_trials = 0
         self.early_licks = 0
@@ -78,37 +64,19 @@ class TwoChoiceAuditoryTask_Blocks:
         self.sound_16KHz = 0
       
         # Booleans
-        self.trialstarted = False
-        self.running = False
-        self.first_trial = True
-        self.next_trial_ready = False
         self.early_lick_counted = False
         self.sound_played = False
         self.omission_counted = False
         
         # Time variables
-        self.tstart = None # start of the task
-        self.ttrial = None # start of the trial
         self.t = None # current time
         self.tlick_l = None # last lick left spout
         self.tlick_r = None # last lick right spout
-        self.tlick = None # time of 1st lick within response window
-        self.RW_start = None
         self.current_time = None
         self.early_lick_time = None # time of early lick that aborted trial
         self.stim_time = None # time sound is played
         self.reward_time = None # time reward is delivered
         self.punishment_time = None #time punishment is delivered
-        self.tend = None # end of the trial
-        self.trial_duration = None # trial duration
-        self.next_trial_eligible = False
-        self.timer_3 = None 
-        
-        # Lock for thread-safe operations
-        self.lock = threading.Lock()
-        
-        self.first_lick = None
-        self.trial_saved = False 
         
         # Debiasing variables 
         self.decision_history = [] # Stores last N trial outcomes
@@ -123,50 +91,7 @@ class TwoChoiceAuditoryTask_Blocks:
         self.block_size = 10 # added for blocks
         self.current_block_side = None # added for blocks
         self.correct_in_block = 0 # added for blocks
-        
-        # Trial monitor
-        self.monitor_history = deque(maxlen=15)
 
-    def start (self):
-        print ('Two-Choice Auditory task with Blocks starting')
-        
-        # Turn the LEDS ON initially
-        pump_l.on()
-        pump_r.on()
-        
-        self.gui_controls.performance_plot.reset_plot() # Plot main tab
-        self.gui_controls.performance_plot_ov.reset_plot() # Plot overview tab
-        
-        self.running = True
-        self.tstart = time.time() # record the start time
-        
-        # Start main loop in a separate thread
-        self.print_thread = threading.Thread(target=self.main, daemon=True)
-        self.print_thread.start()   
-        
-        
-    def stop(self):
-        print("Stopping Two-Choice Auditory task with Blocks...")
-        
-        self.running = False
-        self.trialstarted = False
-        
-        if self.print_thread.is_alive():
-            self.print_thread.join()
-            
-        if self.trialstarted and not self.trial_saved:  #Added all this part 15/05/2025
-            self.tend = time.time()
-            self.trial_duration = self.tend - self.ttrial
-            self.gui_controls.update_trial_duration(self.trial_duration)
-            self.save_data()
-            self.trial_saved = True
-            print("Saved trial during manual stop.")
-            
-        pump_l.on()
-        pump_r.on()
-        led_blue.off()
-        
-    
     def load_spout_tone_mapping(self):
         """ Reads the CSV file and assigns the correct spout for each frequency based on the animal ID. """
         
@@ -213,349 +138,119 @@ class TwoChoiceAuditoryTask_Blocks:
         
         return self.current_block_side
         
-        
     
-    def check_animal_quiet(self):
+    @property
+    def ignore_WW_licks(self):
+        """ The two-choice tasks let licks in the WW through when "Ignore licks during WW" is checked """
+        return self.ignore_licks_WW
+
+    def on_start(self):
+        self.gui_controls.performance_plot.reset_plot() # Plot main tab
+        self.gui_controls.performance_plot_ov.reset_plot() # Plot overview tab
         
-        """ Continuously checks for a quiet period before starting a trial, unless QW = 0 """
+    def on_stop(self):
+        led_blue.off()
         
-        if self.QW == 0:
-            return True
+     
+    def prepare_trial(self):
+        """ Chooses the tone of the new trial, updates the GUI and turns the blue LED on """
         
-        required_samples = self.QW*60 # Serial runs in 60 Hz   
-        
-        while True:
-            if not self.running:
-                return False
-            
-            p1 = np.array(self.piezo_reader.piezo_adder1,dtype=np.uint16)
-            p2 = np.array(self.piezo_reader.piezo_adder2,dtype=np.uint16)
+        self.early_lick_counted = False # For saving data
+        self.sound_played = False # For saving data
+        self.omission_counted = False # For saving data
         
+        # reset time variables at the beginning of each trial
+        self.early_lick_time = None # time of early lick that aborted trial
+        self.stim_time = None # time sound is played
+        self.reward_time = None # time reward is delivered
+        self.punishment_time = None #time punishment is delivered
         
-            if len(p1) >= required_samples and len(p2) >= required_samples:
-                quiet_left = max(p1[-required_samples:]) < self.threshold_left
-                quiet_right = max(p2[-required_samples:]) < self.threshold_right
-               
-                if quiet_left and quiet_right:
-                    return True # Animal was quiet
-                else:
-                    print('Licks detected during Quiet Window')
-                    
-            else:
-                print('Waiting for enough data to check quiet window')
-            
-    
+        # Select Cue according to block
+        self.correct_spout = self.choose_next_trial_blockwise()   # added for blocks
+        self.current_tone = "8KHz" if self.correct_spout == self.spout_8KHz else "16KHz"
+        print(f' trial:{self.total_trials}  current_tone:{self.current_tone} - correct_spout:{self.correct_spout}')
      
-    def start_trial(self):
-        
-        """ Initiates a trial, runs LED in paralledl, and logs trial start"""
-        
-        with self.lock:
-            
-            if self.trialstarted:
-                return
-            
-            self.trial_saved = False 
-            self.trialstarted = True
-            self.total_trials +=1
-            self.gui_controls.update_total_trials(self.total_trials)
-            self.ttrial = time.time() # Update trial start time
-            self.first_lick = None # Reset first lick at the start of each trial
-            self.early_lick_counted = False # For saving data
-            self.sound_played = False # For saving data
-            self.omission_counted = False # For saving data
-            self.data_saved = False
-            self.plot_updated = False
-            
-            # reset time variables at the beginning of each trial
-            self.RW_start = None
-            self.early_lick_time = None # time of early lick that aborted trial
-            self.stim_time = None # time sound is played
-            self.reward_time = None # time reward is delivered
-            self.punishment_time = None #time punishment is delivered
-            
-            # Select Cue according to block
-            self.correct_spout = self.choose_next_trial_blockwise()   # added for blocks
-
-            self.current_tone = "8KHz" if self.correct_spout == self.spout_8KHz else "16KHz"
-            print(
-                f' trial:{self.total_trials}  current_tone:{self.current_tone} - correct_spout:{self.correct_spout}')
-         
-            # Update gui with trial type
-            self.gui_controls.ui.box_CurrentTrial.setText(f"Tone: {self.current_tone}  |  Spout: {self.correct_spout}")
-            self.gui_controls.ui.OV_box_CurrentTrial.setText(f"Tone: {self.current_tone}  |  Spout: {self.correct_spout}")
-            
-            # Update Sound Counters
-            if self.current_tone == '8KHz':
-                self.sound_8KHz +=1
-                self.gui_controls.update_sound_8KHz(self.sound_8KHz)
-            elif self.current_tone == '16KHz':
-                self.sound_16KHz +=1
-                self.gui_controls.update_sound_16KHz(self.sound_16KHz)
-            
-            # Turn LED on
-            threading.Thread(target=self.blue_led_on, daemon=True).start()
-            
-            
-            if self.detect_licks_during_waiting_window():  # If a lick happens, abort trial
-                print("Trial aborted due to early lick.")
-                self.early_licks += 1
-                self.early_lick_counted = True
-                self.gui_controls.update_early_licks(self.early_licks)
-                self.trialstarted = False  # Reset trial state
-                threading.Thread(target=self.blue_led_off, daemon=True).start()
-                self.tend= time.time()
-                self.trial_duration = (self.tend-self.ttrial)
-                self.gui_controls.update_trial_duration(self.trial_duration)
-                self.schedule_next_trial()
-                # Save trial data
-                if not self.trial_saved: 
-                    self.save_data()
-                    self.trial_saved = True
-                return  # Exit trial 
-           
-            # Play sound  
-            self.play_sound(self.current_tone)
-            self.sound_played = True
+        # Update gui with trial type
+        self.gui_controls.update_current_trial(f"Tone: {self.current_tone}  |  Spout: {self.correct_spout}")
+        
+        # Update Sound Counters
+        if self.current_tone == '8KHz':
+            self.sound_8KHz +=1
+            self.gui_controls.update_sound_8KHz(self.sound_8KHz)
+        elif self.current_tone == '16KHz':
+            self.sound_16KHz +=1
+            self.gui_controls.update_sound_16KHz(self.sound_16KHz)
+        
+        # Turn LED on
+        led_blue.on()
             
-            # Start response window
-            self.RW_start = time.time() 
-             
-            # Wait for response window to finish if no lick happens
-            threading.Thread(target=self.wait_for_response, daemon=True).start()
+    
+    def present_cue(self):
+        """ Plays the tone of the trial (the response window starts at its onset) """
+        cue = self.play_sound(self.current_tone)
+        self.sound_played = True
+        return cue
             
     
     def play_sound(self, frequency):
+        """ Starts a cue without waiting for it to end; returns its Playback (None if nothing is played) """
         
-        if frequency == "8KHz":
-            tone_8KHz() 
-            self.stim_time = time.time()
-        elif frequency == "16KHz":
-            tone_16KHz()
-            self.stim_time = time.time()
+        if frequency in ("8KHz", "16KHz"):
+            cue = self.play_cue(frequency)
+            self.stim_time = self.cue_onset(cue) # measured onset of the tone
         elif frequency == "white_noise":
-            white_noise()
-            self.punishment_time = time.time()
-            
-
-    def blue_led_on(self):
-        led_blue.on()
-        
-    
-    def blue_led_off(self):
-        led_blue.off()
-        
-    
-    def detect_licks_during_waiting_window(self):
-        """ Detects licks during the waiting window (WW) and aborts the trial if necessary. """
-        
-        WW_start = time.time()  # Mark the WW start time
-        self.early_lick_time = None # reset early lick time stamp
-        
-        ignore_licks = self.gui_controls.ui.chk_IgnoreLicksWW.isChecked() # Check if Ignore Licks during WW option is checked in the gui
-        
-        while time.time() - WW_start < self.WW:  # Wait for WW duration
-            p1 = np.array(self.piezo_reader.piezo_adder1,dtype=np.uint16)
-            p2 = np.array(self.piezo_reader.piezo_adder2,dtype=np.uint16)
-            
-            # Check if a lick is detected
-            if not ignore_licks:
-                if p1.size and p1[-1] > self.threshold_left:
-                    self.early_lick_time = time.time()
-                    return True  # Abort trial
-        
-                if p2.size and p2[-1] > self.threshold_right:
-                    self.early_lick_time = time.time()
-                    return True  # Abort trial
-            
-            time.sleep(0.001)  # Small delay to prevent CPU overload
-        
-        return False  # No licks detected, trial can proceed
+            cue = self.play_cue(frequency)
+            self.punishment_time = self.cue_onset(cue) # measured onset of the noise
+            self.punishment_cue = cue
+        else:
+            return None
+        return cue
     
-    def schedule_next_trial(self):
-        self.next_trial_ready = True
-        print("Next trial is now allowed after ITI.")
     
-        self.ITI = round(random.uniform(self.ITI_min, self.ITI_max),1)
-        print(self.ITI) #Troubleshoot
-        
-        # Start the next trial after ITI delay
-        threading.Timer(self.ITI, self.check_and_start_next_trial).start()
+    def on_early_lick(self, tlick):
+        """ Lick in the waiting window - the trial is aborted """
+        print("Trial aborted due to early lick.")
+        self.early_lick_time = tlick
+        self.early_licks += 1
+        self.early_lick_counted = True
+        self.gui_controls.update_early_licks(self.early_licks)
         
     
-    def check_and_start_next_trial(self):
-        """ Starts the next trial if conditions allow it """
-        if self.next_trial_ready and not self.trialstarted:
-            if self.check_animal_quiet(): # troubleshoot
-                print("Starting next trial")    
-                self.start_trial()
-    
+    def on_response(self, side, tlick):
+        """ First lick in the response window: reward on the correct spout, punishment on the other """
+        self.decision_history.append("L" if side == "left" else "R")
+        self.decision_history = self.decision_history[-self.min_trials_debias:]
 
-    def detect_licks(self):
-        """Detect any lick (amplitude-independent) during the response window and handle outcome."""
-        # Read buffers (60 Hz stream)
-        p1 = np.array(self.piezo_reader.piezo_adder1, dtype=np.uint16)  # left
-        p2 = np.array(self.piezo_reader.piezo_adder2, dtype=np.uint16)  # right
-    
-        time.sleep(0.001)  # keep CPU cool
-    
-        # Helper: timestamp of first non-zero sample in a buffer; None if none
-        def first_nonzero_time(buf):
-            if buf.size == 0 or buf.max() == 0:
-                return None
-            first_idx = np.flatnonzero(buf > 0)[0]
-            # Reconstruct wall-clock time for that sample (latest at end; 60 Hz)
-            return time.time() - (1/60.0) * (len(buf) - first_idx)
-    
-        t_left  = first_nonzero_time(p1)
-        t_right = first_nonzero_time(p2)
-    
-        # Need a started RW
-        if self.RW_start is None:
-            return
-    
-        in_rw_left  = (t_left  is not None) and (self.RW_start < t_left  < self.RW_start + self.RW)
-        in_rw_right = (t_right is not None) and (self.RW_start < t_right < self.RW_start + self.RW)
-    
-        # Nothing yet or already handled first lick
-        if not (in_rw_left or in_rw_right) or self.first_lick is not None:
-            return
-    
-        # Choose earliest side if both present
-        if in_rw_left and in_rw_right:
-            side, tlick = (('left', t_left) if t_left <= t_right else ('right', t_right))
-        elif in_rw_left:
-            side, tlick = 'left', t_left
+        if self.correct_spout == side:
+            self.reward(side)
+            self.correct_trials += 1
+            self.correct_in_block += 1  # block progress
+            self.gui_controls.update_correct_trials(self.correct_trials)
         else:
-            side, tlick = 'right', t_right
-    
-        with self.lock:
-            if self.first_lick is not None:
-                return
-    
-            self.first_lick = side
-            self.tlick = tlick
-            self.decision_history.append("L" if side == "left" else "R")
-            self.decision_history = self.decision_history[-self.min_trials_debias:]
-    
-            # Outcome (reward vs punishment)
-            if self.correct_spout == side:
-                threading.Thread(target=self.reward, args=(side,)).start()
-                self.correct_trials += 1
-                self.correct_in_block += 1  # block progress
-                self.gui_controls.update_correct_trials(self.correct_trials)
-            else:
-                if not self.gui_controls.ui.chk_NoPunishment.isChecked():
-                    self.play_sound('white_noise')
-                    print('wrong spout')
-                else:
-                    print('wrong spout - punishment skipped')
-                self.incorrect_trials += 1
-                self.gui_controls.update_incorrect_trials(self.incorrect_trials)
-    
-            # Counters & UI
-            self.total_licks += 1
-            if side == 'left':
-                self.licks_left += 1
-                self.gui_controls.update_licks_left(self.licks_left)
+            if not self.no_punishment:
+                self.play_sound('white_noise')
+                print('wrong spout')
             else:
-                self.licks_right += 1
-                self.gui_controls.update_licks_right(self.licks_right)
-            self.gui_controls.update_total_licks(self.total_licks)
-    
-            # Wrap up trial
-            if self.timer_3 and self.timer_3.is_alive():
-                self.timer_3.cancel()
-            self.trialstarted = False
-            threading.Thread(target=self.blue_led_off, daemon=True).start()
-            self.tend = time.time()
-            self.trial_duration = (self.tend - self.ttrial)
-            self.gui_controls.update_trial_duration(self.trial_duration)
-            self.next_trial_eligible = True
-    
-            # Save once
-            if not self.trial_saved:
-                self.save_data()
-                self.trial_saved = True
+                print('wrong spout - punishment skipped')
+            self.incorrect_trials += 1
+            self.gui_controls.update_incorrect_trials(self.incorrect_trials)
+            
+        self.count_lick(side)
+        
 
-                  
-    def omission_callback(self):
-        with self.lock:
-            if not self.trialstarted or self.first_lick is not None: # Added this 15/05/2025
-                return
+    def on_omission(self):
+        self.omissions += 1
+        self.omission_counted = True
+        self.gui_controls.update_omissions(self.omissions)
         
-            print('No licks detected - aborting trial')
-            self.trialstarted = False
-            threading.Thread(target=self.blue_led_off, daemon=True).start()
-            self.tend = time.time()
-            self.trial_duration = (self.tend-self.ttrial)
-            self.gui_controls.update_trial_duration(self.trial_duration)
-            self.omissions += 1
-            self.omission_counted = True
-            self.gui_controls.update_omissions(self.omissions)
-            self.next_trial_eligible = True
-            
-            # Save trial data
-            if not self.trial_saved: # Added this 15/05/2025
-                self.save_data()
-                self.trial_saved=True
-      
-    
-    def wait_for_response(self):
-        self.timer_3 = threading.Timer(self.RW, self.omission_callback)
-        self.timer_3.start()
+    def trial_ended(self):
+        led_blue.off()
         
-    
-    def reward(self, side):
-        """Delivers a reward without blocking the main loop."""
-    
-        if side == 'left':
-            pump_l.off()
-            time.sleep(self.valve_opening)
-            pump_l.on()
-            self.reward_time = time.time()
-            print('Reward delivered - left')
-            
-        elif side == 'right':
-            pump_r.off()
-            time.sleep(self.valve_opening)
-            pump_r.on()
-            self.reward_time = time.time()
-            print('Reward delivered - right')
-    
-    
-    def main(self):
-        while self.running:
-            
-            if self.first_trial:
-                print(f"ITI duration: {self.ITI} seconds")  # Print ITI value for debugging
-                if self.check_animal_quiet():
-                    self.trial_saved = False 
-                    self.start_trial()
-                    self.first_trial = False
-                    self.ITI = round(random.uniform(self.ITI_min, self.ITI_max),1)
-                else:
-                    pass
-                
-            if self.next_trial_eligible == True and ((time.time() - (self.tend)) >= self.ITI) and not self.trialstarted:
-                print(f"ITI duration: {self.ITI} seconds")  # Print ITI value for debugging
-                if self.check_animal_quiet():
-                    self.trial_saved = False 
-                    self.start_trial()
-                    self.next_trial_eligible = False
-                    self.ITI = round(random.uniform(self.ITI_min, self.ITI_max),1)
-             
-            self.detect_licks()
-            
-    
+
+
     def save_data(self):
         """ Saves trial data, ensuring missing variables are filled with NaN while maintaining structure. """
         
-        # Prevent duplicate calls
-        if hasattr(self, 'data_saved') and self.data_saved:
-            return
-        self.data_saved = True  # Mark data as saved to avoid duplicate calls
-        
         # Update plot
         self.gui_controls.update_performance_plot(self.total_trials, self.correct_trials, self.incorrect_trials)
                 
@@ -595,7 +290,7 @@ class TwoChoiceAuditoryTask_Blocks:
             np.nan if not hasattr(self, 'first_lick') else (1 if was_punished else 0),  # punishment
             np.nan if not hasattr(self, 'first_lick') else (1 if was_omission else 0),  # omission
             np.nan if not hasattr(self, 'reward_time') else self.reward_time, # time reward was delivered
-            np.nan if not hasattr(self, 'punishment_time') else self.punishment_time, # time punishment was delivered
+            self.punishment_time, # time punishment was delivered
             np.nan if not hasattr(self, 'RW') else self.RW,
             np.nan if not hasattr(self, 'QW') else self.QW,
             np.nan if not hasattr(self, 'WW') else self.WW,
@@ -604,8 +299,8 @@ class TwoChoiceAuditoryTask_Blocks:
             np.nan if not hasattr(self, 'ITI_max') else self.ITI_max,
             np.nan if not hasattr(self, 'threshold_left') else self.threshold_left,
             np.nan if not hasattr(self, 'threshold_right') else self.threshold_right,
-            1 if self.gui_controls.ui.chk_NoPunishment.isChecked() else np.nan,
-            1 if self.gui_controls.ui.chk_IgnoreLicksWW.isChecked() else np.nan,
+            1 if self.no_punishment else np.nan,
+            1 if self.ignore_licks_WW else np.nan,
             np.nan if not hasattr(self, 'catch_trial_counted') else (1 if self.catch_trial_counted else 0),  # catch trials
             np.nan if not hasattr(self, 'is_distractor_trial') else (1 if self.is_distractor_trial else 0),  # Distractor trial flag
             np.nan if not hasattr(self, 'distractor_led') else (1 if self.distractor_led == "left" else 0),  # Distractor on left
@@ -613,10 +308,8 @@ class TwoChoiceAuditoryTask_Blocks:
             np.nan if not hasattr(self, 'tstart') else self.tstart  # session start
         ]
     
-        # Append data to the CSV file
-        with open(self.csv_file_path, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(trial_data)
+        # Queue the row for the session writer (written to the CSV file on its own thread)
+        self.session_writer.write(trial_data)
             
         # **Convert block type for display**
         block_type_display = {
@@ -634,44 +327,6 @@ class TwoChoiceAuditoryTask_Blocks:
             "trial_number": self.total_trials  # Trial ID
         }
         
-        if isinstance(trial_data_gui, dict):  # Ensure only valid dictionaries are stored
-            self.monitor_history.append(trial_data_gui) 
-        else:
-            print("Warning: Invalid trial data format detected:", trial_data_gui)
-    
         # **Update the GUI**
-        self.update_trial_history()
-        
-        
-    def update_trial_history(self):
-        """ Updates the GUI labels for trial history using a single outcome label per trial """
-    
-        for i, trial in enumerate(self.monitor_history):
-            col = i + 1  # QLabel names are lbl_O1 to lbl_O15 (one per trial)
-            
-            # **Update Block Type (S, AL, AR, or Empty)**
-            lbl_block = getattr(self.gui_controls.ui, f"lbl_B{col}", None)
-            if lbl_block:
-                lbl_block.setText(trial["block_type"])
-    
-            # **Find the Outcome Label**
-            lbl_outcome = getattr(self.gui_controls.ui, f"lbl_O{col}", None)
-    
-            # **Reset previous color**
-            if lbl_outcome:
-                lbl_outcome.setStyleSheet("")  # Clear previous color
-    
-                # **Assign color based on outcome**
-                if trial["outcome"] == "correct":
-                    lbl_outcome.setStyleSheet("background-color: #0DE20D;")
-                elif trial["outcome"] == "incorrect":
-                    lbl_outcome.setStyleSheet("background-color: red;")
-                else:
-                    lbl_outcome.setStyleSheet("background-color: gray;")
-                    
-            # **Update Trial Number**
-            lbl_T = getattr(self.gui_controls.ui, f"lbl_T{col}", None)
-            if lbl_T:
-                lbl_T.setText(str(trial["trial_number"])) 
-                    
-                
+        self.gui_controls.update_trial_monitor(trial_data_gui)
+        
\ No newline at end of file
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:51:09 2026
+
+@author: JoanaCatarino
+
+The modules of the GUI import each other by name (flat folder), and the tasks need the simulated rig
+"""
+
+import os
+import sys
+
+os.environ['TASKGUI_SIMULATION'] = '1' # mock pins and a fake Arduino - set before gpio_map is imported
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
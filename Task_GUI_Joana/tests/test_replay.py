@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:40:05 2026
+
+@author: JoanaCatarino
+
+Replay: the replayed trials follow the ITI and trial types of the session csv (new draws only with redraw)
+"""
+
+import random
+import numpy as np
+import pytest
+from clock import SimulatedClock
+from replay import virtual_task, drive, recorded_trials
+from session_loader import read_session_csv
+from simulation import VirtualMouse, load_task_class
+
+
+def virtual_samples(duration, seed):
+    random.seed(seed)
+    mouse = VirtualMouse(bout_rate=0.3)
+    n = int(duration * mouse.sample_rate)
+    samples = np.array([mouse.sample(i) for i in range(n)], dtype=np.uint16).reshape(n, 2) * 10
+    stamps = np.arange(n, dtype=np.int64) * (1_000_000_000 // mouse.sample_rate)
+    return samples[:, 0], samples[:, 1], stamps
+
+
+def run(task_class, csv_file_path, samples, seed, recorded=None):
+    random.seed(seed)
+    np.random.seed(seed)
+    clock = SimulatedClock()
+    task, reader = virtual_task(task_class, clock, str(csv_file_path), {'ITI_min': 1, 'ITI_max': 6, 'spout_8KHz': 'left', 'spout_16KHz': 'right'}, recorded)
+    drive(task, reader, clock, *samples)
+    return task
+
+
+TRIAL_TYPE = ['ITI', 'block', '8KHz', '16KHz', 'catch_trial']
+
+@pytest.mark.parametrize('task_name', ['TwoChoiceAuditoryTask', 'TwoChoiceAuditoryTask_Blocks', 'AdaptiveSensorimotorTask'])
+def test_replay_follows_the_recorded_trials(task_name, tmp_path):
+    task_class = load_task_class(task_name)
+    samples = virtual_samples(600, seed=1)
+    run(task_class, tmp_path / 'session.csv', samples, seed=1)
+    session = read_session_csv(str(tmp_path / 'session.csv'))
+    assert len(session) > 20
+
+    # Same samples, other seed: the recorded draws are used
+    run(task_class, tmp_path / 'replay.csv', samples, seed=2, recorded=recorded_trials(str(tmp_path / 'session.csv')))
+    replay = read_session_csv(str(tmp_path / 'replay.csv'))
+    assert len(replay) == len(session)
+    for column in TRIAL_TYPE:
+        assert replay[column].astype(str).tolist() == session[column].astype(str).tolist(), column
+
+    # Other seed without the recorded trials: new ITIs
+    run(task_class, tmp_path / 'redraw.csv', samples, seed=2)
+    redraw = read_session_csv(str(tmp_path / 'redraw.csv'))
+    assert redraw['ITI'].tolist()[:10] != session['ITI'].tolist()[:10]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:53:40 2026
+
+@author: JoanaCatarino
+
+Session loader on sessions written by every task class (fast simulation)
+"""
+
+import os
+import csv
+import json
+import numpy as np
+import pytest
+from simulation import TASK_MODULES, load_task_class, run_fast
+from session_loader import load_animal_sessions
+from trial_table import TRIAL_DTYPE
+
+ANIMAL = 'TEST01'
+FLAGS = [name for name in TRIAL_DTYPE.names if TRIAL_DTYPE[name] == np.dtype('i1')]
+
+
+def csv_rows(csv_file_path):
+    with open(csv_file_path, newline='') as file:
+        header, *rows = [row for row in csv.reader(file) if row]
+    return header, rows
+
+
+@pytest.fixture(scope='module')
+def save_dir(tmp_path_factory):
+    """One simulated session of every task class for the same animal."""
+    save_dir = tmp_path_factory.mktemp('save_dir')
+    animal_directory = save_dir / ANIMAL
+    animal_directory.mkdir()
+    for i, task_name in enumerate(sorted(TASK_MODULES)):
+        run_fast(load_task_class(task_name), 300, str(animal_directory / f'{i:02d}_{task_name}.csv'), seed=i)
+    return save_dir
+
+
+@pytest.mark.parametrize('workers', [1, None])
+def test_loads_sessions_of_every_task(save_dir, workers):
+    trials, sessions = load_animal_sessions(ANIMAL, save_dir=str(save_dir), workers=workers, use_cache=False)
+    assert len(sessions) == len(TASK_MODULES)
+
+    for i, session in enumerate(sessions):
+        header, rows = csv_rows(os.path.join(save_dir, ANIMAL, str(session['file'])))
+        session_trials = trials[trials['session'] == i]
+        assert session['n_trials'] == len(rows) == len(session_trials) > 0
+
+        # Flags are 0/1 or missing - never a shifted value truncated into int8
+        for name in FLAGS:
+            assert np.isin(session_trials[name], (-1, 0, 1)).all(), (session['file'], name)
+
+        # Rows that do not match the header are left empty, the others keep their trial numbers
+        aligned = np.array([len(row) == len(header) for row in rows])
+        assert (session_trials['trial_number'][~aligned] == -1).all()
+        assert np.isnan(session_trials['session_start'][~aligned]).all()
+        numbers = [int(row[0]) for row, ok in zip(rows, aligned) if ok]
+        assert session_trials['trial_number'][aligned].tolist() == numbers
+
+
+def test_unreadable_session_is_skipped(save_dir, tmp_path):
+    animal_directory = tmp_path / ANIMAL
+    animal_directory.mkdir()
+    for name in sorted(os.listdir(save_dir / ANIMAL))[:2]:
+        (animal_directory / name).write_bytes((save_dir / ANIMAL / name).read_bytes())
+    (animal_directory / 'broken.csv').write_text('trial_number\n1\n')
+    (animal_directory / 'broken.json').write_text('{not json')
+
+    for workers in (1, None):
+        trials, sessions = load_animal_sessions(ANIMAL, save_dir=str(tmp_path), workers=workers, use_cache=False)
+        assert 'broken.csv' not in sessions['file'].tolist()
+        assert len(sessions) == len([name for name in os.listdir(animal_directory) if name.endswith('.json')]) - 1
+
+    # The cache keeps the sessions that loaded and the broken one is tried again
+    load_animal_sessions(ANIMAL, save_dir=str(tmp_path), workers=1)
+    trials_cached, sessions_cached = load_animal_sessions(ANIMAL, save_dir=str(tmp_path), workers=1)
+    assert sessions_cached['file'].tolist() == sessions['file'].tolist()
+    assert len(trials_cached) == len(trials)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:37 2026
+
+@author: JoanaCatarino
+
+Task engine on a simulated clock: licks in the waiting window, with and without "Ignore licks during WW",
+and the ITI after a punishment
+"""
+
+import numpy as np
+import pytest
+from clock import SimulatedClock
+from replay import virtual_task
+from sound_generator import STIMULI
+from task_twochoice_auditory import TwoChoiceAuditoryTask
+from task_twochoice_auditory_blocks import TwoChoiceAuditoryTask_Blocks
+
+
+def start_in_WW(task_class, ignore_licks, tmp_path):
+    """Task in the WW of its first trial (QW=0) at t=0 of a simulated clock."""
+    clock = SimulatedClock()
+    task, reader = virtual_task(task_class, clock, str(tmp_path / 'session.csv'), {'QW': 0, 'WW': 1, 'RW': 3})
+    task.ignore_licks_WW = ignore_licks # what GuiControls.update_task_options copies from the checkbox
+    task.open_session()
+    task.run_timers()
+    assert task.state == 'WW'
+    return task, reader, clock
+
+
+def lick(task, reader, clock, t, side='left'):
+    """One lick on a spout at t (s) - two samples above the threshold."""
+    stamps = np.array([t, t + 1/60, t + 2/60]) * 1e9
+    values = np.array([0, 200, 200], dtype=np.uint16)
+    silent = np.zeros(3, dtype=np.uint16)
+    clock.set(stamps[-1] / 1e9)
+    if side == 'left':
+        reader.ingest(values, silent, stamps.astype(np.int64))
+    else:
+        reader.ingest(silent, values, stamps.astype(np.int64))
+    task.poll_licks()
+
+
+@pytest.mark.parametrize('task_class', [TwoChoiceAuditoryTask, TwoChoiceAuditoryTask_Blocks])
+def test_WW_lick_aborts_the_trial(task_class, tmp_path):
+    task, reader, clock = start_in_WW(task_class, False, tmp_path)
+    lick(task, reader, clock, 0.5)
+    assert task.state == 'ITI'
+    assert task.early_lick_counted
+    task.stop()
+
+
+@pytest.mark.parametrize('task_class', [TwoChoiceAuditoryTask, TwoChoiceAuditoryTask_Blocks])
+def test_WW_lick_is_ignored(task_class, tmp_path):
+    task, reader, clock = start_in_WW(task_class, True, tmp_path)
+    lick(task, reader, clock, 0.5)
+    assert task.state == 'WW'
+    assert not task.early_lick_counted
+
+    # The trial goes on to the cue and the response window at the end of the WW
+    clock.set(task.next_deadline())
+    task.run_timers()
+    assert task.state == 'RW'
+    task.stop()
+
+
+def test_ITI_starts_after_the_punishment_noise(tmp_path):
+    task, reader, clock = start_in_WW(TwoChoiceAuditoryTask, False, tmp_path)
+    clock.set(task.next_deadline())
+    task.run_timers()
+    assert task.state == 'RW'
+
+    wrong = 'right' if task.correct_spout == 'left' else 'left'
+    lick(task, reader, clock, clock.time() + 0.2, wrong)
+    assert task.state == 'ITI'
+    assert task.punishment_time is not None
+
+    # The 2 s noise plays first, then the whole ITI
+    noise_end = task.punishment_time + STIMULI['white_noise'][2]
+    assert task.next_deadline() == pytest.approx(noise_end + task.ITI, abs=1e-6)
+    task.stop()
@@ -1,128 +1,185 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Tue Mar 18 11:42:26 2025
-
-@author: JoanaCatarino
-
-# version working before I tried to add colors to the trial monitor - jan 2026
-"""
-
-from PyQt5.QtWidgets import QWidget, QLabel, QGridLayout
-from PyQt5.QtGui import QColor, QPalette
-from PyQt5.QtCore import Qt
-from collections import deque
-
-class TrialMonitor(QWidget):
-    
-    def __init__(self, gui_controls):
-        
-        # Connection to GUI
-        self.gui_controls = gui_controls
-
-        self.trial_history = deque(maxlen=15)  # Store last 15 trials
-
-        self.grid_layout = QGridLayout(self)  # Layout for labels
-        self.labels = {"block": [], "left_spout": [], "right_spout": [], "trial_number": []}
-
-        for col in range(15):
-            # Block type (Top row: "B1" to "B15")
-            lbl_block = QLabel("S", self)
-            lbl_block.setObjectName(f"lbl_B{col + 1}")  # Naming convention
-            lbl_block.setAlignment(Qt.AlignCenter)
-            self.grid_layout.addWidget(lbl_block, 0, col)
-            self.labels["block"].append(lbl_block)
-
-            # Left Spout (Middle row: "L1" to "L15")
-            lbl_left = QLabel(" ")
-            lbl_left.setObjectName(f"lbl_L{col + 1}")
-            lbl_left.setAutoFillBackground(True)
-            self.grid_layout.addWidget(lbl_left, 1, col)
-            self.labels["left_spout"].append(lbl_left)
-
-            # Right Spout (Middle row: "R1" to "R15")
-            lbl_right = QLabel(" ")
-            lbl_right.setObjectName(f"lbl_R{col + 1}")
-            lbl_right.setAutoFillBackground(True)
-            self.grid_layout.addWidget(lbl_right, 2, col)
-            self.labels["right_spout"].append(lbl_right)
-
-            # Trial Number (Bottom row: "T1" to "T15")
-            lbl_trial = QLabel(str(col + 1), self)
-            lbl_trial.setObjectName(f"lbl_T{col + 1}")
-            lbl_trial.setAlignment(Qt.AlignCenter)
-            self.grid_layout.addWidget(lbl_trial, 3, col)
-            self.labels["trial_number"].append(lbl_trial)
-
-        self.setLayout(self.grid_layout)
-
-    def update_trial(self, trial_data):
-        """ Update the QLabel widgets with new trial data """
-        self.trial_history.append(trial_data)
-    
-        for col, trial in enumerate(self.trial_history):
-            # Update Block Type (S, AL, AR)
-            self.labels["block"][col].setText(trial.get("block_type", ""))
-    
-            # NEW: determine trial "status"
-            # Prefer "status" if provided; fallback to old "outcome"
-            status = trial.get("status", trial.get("outcome", "unknown"))
-    
-            # If trial-type status should override everything, color BOTH spouts
-            # Catch trial → orange (both spouts)
-            if status == "catch":
-                self._set_bg(self.labels["left_spout"][col], QColor("#E67B51"))
-                self._set_bg(self.labels["right_spout"][col], QColor("#E67B51"))
-    
-            # Early lick → blue (both spouts)
-            elif status == "early":
-                self._set_bg(self.labels["left_spout"][col], QColor("#3CBBC9"))
-                self._set_bg(self.labels["right_spout"][col], QColor("#3CBBC9"))
-                
-            elif status == "omission":
-                self._set_bg(self.labels["left_spout"][col], QColor(Qt.lightGray))  # gray
-                self._set_bg(self.labels["right_spout"][col], QColor(Qt.lightGray))
-                
-            else:
-                # Normal trials: color only the chosen spout based on correct/incorrect
-                self.update_color(self.labels["left_spout"][col], trial, "L")
-                self.update_color(self.labels["right_spout"][col], trial, "R")
-    
-            # Update Trial Number
-            self.labels["trial_number"][col].setText(str(trial.get("trial_number", "")))
-    
-    
-    def update_color(self, label, trial, spout_side):
-        """ Set QLabel background color for normal trials (chosen spout only) """
-        # Default: not chosen -> light gray
-        color = QColor(Qt.lightGray)
-    
-        chosen = trial.get("spout", None)  # "L" or "R" expected
-        outcome = trial.get("outcome", trial.get("status", "unknown"))  # fallback either way
-    
-        if chosen == spout_side:
-            if outcome == "correct":
-                color = QColor(Qt.green)
-            elif outcome == "incorrect":
-                color = QColor(Qt.red)
-            else:
-                # if chosen but unknown outcome, keep gray
-                color = QColor(Qt.lightGray)
-    
-        self._set_bg(label, color)
-    
-    
-    def _set_bg(self, label, color: QColor):
-        palette = label.palette()
-        palette.setColor(QPalette.Window, color)
-        label.setPalette(palette)
-#%%
-
-
-
-
-
-
-#%%
-
-
-
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Mar 18 11:42:26 2025
+
+@author: JoanaCatarino
+
+Trial monitor - strip with the last trials of the session in the Box tab, oldest first: block type (top row),
+outcome color (middle row) and trial number (bottom row), one column per trial
+- Model/view: TrialHistoryModel keeps the last `length` trials in a ring buffer (a new trial is one column inserted,
+  and the oldest one removed when the strip is full - O(1) per trial) and the TrialMonitor view (a QTableView) only
+  paints the columns that are visible. With more trials than fit in the strip it scrolls horizontally, and it keeps
+  following the newest trial unless it was scrolled back
+- OutcomeDelegate paints the cells directly (row background, colored box for the outcome, centered text)
+- place_trial_monitor(ui, length) puts the strip where the lbl_B/lbl_O/lbl_T labels of the form are (and hides them),
+  e.g. length=15 for the old window or 500 to see long runs (side bias, blocks)
+- Only used from the GUI thread (the tasks send their trials through the UI bus - see GuiControls.update_trial_monitor)
+"""
+
+from PyQt5.QtWidgets import QTableView, QAbstractItemView, QHeaderView, QStyledItemDelegate
+from PyQt5.QtGui import QColor, QPen, QPalette
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# Color of the outcome box for each trial status (tasks send a status - catch, early... - or only the outcome)
+OUTCOME_COLORS = {
+    'catch': '#E67B51', # orange
+    'early': '#3CBBC9', # blue
+    'omission': 'gray',
+    'correct': '#0DE20D', # green
+    'incorrect': 'red',
+    'unknown': 'lightgray',
+    }
+
+# Rows of the strip and their background (same colors as the old label rows)
+BLOCK_ROW, OUTCOME_ROW, TRIAL_ROW = 0, 1, 2
+ROW_COLORS = ['#D6ECEE', '#EAEAEA', '#EBEBEB']
+
+
+class TrialHistoryModel(QAbstractTableModel):
+    """One column per trial: (block type, status, trial number), oldest first."""
+
+    def __init__(self, length=15, parent=None):
+        super().__init__(parent)
+        self.length = length
+        self.ring = [None] * length # ring buffer of the last trials
+        self.start = 0 # ring index of the oldest trial
+        self.count = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 3
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.count
+
+    def trial(self, column):
+        return self.ring[(self.start + column) % self.length]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        block_type, status, trial_number = self.trial(index.column())
+        if role == Qt.DisplayRole:
+            if index.row() == BLOCK_ROW:
+                return block_type
+            if index.row() == TRIAL_ROW:
+                return trial_number
+            return None
+        if role == Qt.UserRole: # status, for the delegate
+            return status
+        if role == Qt.ToolTipRole:
+            return f"Trial {trial_number}: {status}"
+        return None
+
+    def add_trial(self, trial):
+        """Appends a trial (dict with block_type, status or outcome, trial_number); drops the oldest when full."""
+        status = trial.get("status", trial.get("outcome", "unknown"))
+        if status not in OUTCOME_COLORS:
+            status = 'unknown'
+
+        if self.count == self.length:
+            self.beginRemoveColumns(QModelIndex(), 0, 0)
+            self.start = (self.start + 1) % self.length
+            self.count -= 1
+            self.endRemoveColumns()
+
+        self.beginInsertColumns(QModelIndex(), self.count, self.count)
+        self.ring[(self.start + self.count) % self.length] = (trial.get("block_type", ""), status, str(trial.get("trial_number", "")))
+        self.count += 1
+        self.endInsertColumns()
+
+    def clear(self):
+        self.beginResetModel()
+        self.start = 0
+        self.count = 0
+        self.endResetModel()
+
+
+class OutcomeDelegate(QStyledItemDelegate):
+    """Paints the cells of the strip without going through the widget style."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.row_colors = [QColor(color) for color in ROW_COLORS]
+        self.outcome_colors = {status: QColor(color) for status, color in OUTCOME_COLORS.items()}
+        self.border = QPen(QColor('black'))
+
+    def paint(self, painter, option, index):
+        rect = option.rect
+        painter.fillRect(rect, self.row_colors[index.row()])
+
+        if index.row() == OUTCOME_ROW:
+            box = rect.adjusted(7, 4, -8, -5) # like the framed lbl_O labels
+            painter.fillRect(box, self.outcome_colors[index.data(Qt.UserRole)])
+            painter.setPen(self.border)
+            painter.drawRect(box)
+        else:
+            painter.setPen(option.palette.color(QPalette.Text))
+            painter.drawText(rect, Qt.AlignCenter, index.data())
+
+
+class TrialMonitor(QTableView):
+
+    column_width = 40 # px per trial (room for 4-digit trial numbers)
+
+    def __init__(self, parent=None, length=15):
+        super().__init__(parent)
+        self.history = TrialHistoryModel(length, self)
+        self.setModel(self.history)
+        self.setItemDelegate(OutcomeDelegate(self))
+
+        # Plain strip: no headers, grid, selection or editing
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.horizontalHeader().setMinimumSectionSize(1)
+        self.horizontalHeader().setDefaultSectionSize(self.column_width)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.setShowGrid(False)
+        self.setFrameShape(QTableView.NoFrame)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+
+        # Follow the newest trial while the strip is scrolled to the end
+        self.follow = True
+        bar = self.horizontalScrollBar()
+        bar.valueChanged.connect(self.scrolled)
+        bar.rangeChanged.connect(self.range_changed)
+
+    def scrolled(self, value):
+        self.follow = value >= self.horizontalScrollBar().maximum()
+
+    def range_changed(self, minimum, maximum):
+        if self.follow:
+            self.horizontalScrollBar().setValue(maximum)
+
+    def add_trials(self, trials):
+        """Adds the trials that were sent since the last frame."""
+        for trial in trials:
+            self.history.add_trial(trial)
+
+    def clear(self):
+        self.history.clear()
+        self.follow = True
+
+
+def place_trial_monitor(ui, length=15):
+    """Puts a TrialMonitor where the trial monitor labels of the form are (the labels are hidden); returns it."""
+    frames = [ui.bkg_Blocks, ui.bkg_RightSpout, ui.bkg_Trials]
+    rect = frames[0].geometry().united(frames[-1].geometry())
+    for frame in frames:
+        frame.hide()
+    for col in range(1, 16):
+        for name in (f"lbl_B{col}", f"lbl_O{col}", f"lbl_T{col}"):
+            label = getattr(ui, name, None)
+            if label is not None:
+                label.hide()
+
+    monitor = TrialMonitor(frames[0].parentWidget(), length)
+    monitor.setFont(ui.lbl_B1.font())
+    monitor.setGeometry(rect)
+    monitor.show()
+    return monitor
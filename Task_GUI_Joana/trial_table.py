@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:41:17 2026
+
+@author: JoanaCatarino
+
+Trial table - typed, columnar copy of the session csv
+- Same columns as the csv (CSV_HEADERS in file_writer), with types instead of text:
+    - float64 for the times and parameters (NaN when missing)
+    - int32 for trial_number, int8 for the 0/1 flags (-1 when missing)
+    - block is categorical: int8 code into BLOCK_CATEGORIES (-1 when missing); in parquet it is an Arrow
+      dictionary column (nulls when missing)
+- Rows are mapped to the columns by name, so a row must have one value per header. A task whose rows do not match
+  CSV_HEADERS gets no table (the session writer drops it at the first such row - the csv is still written)
+- Written by the session writer next to the csv, one row group (row_group trials) at a time
+- Without pyarrow the table is a raw file of fixed-size records (<session>_trials.bin, like the raw piezo file): a crash
+  only loses the last unfinished group. With pyarrow it is a parquet file (<session>_trials.parquet), which is only
+  readable once it is closed (the footer is written at the end): after a crash the loader reads the csv instead.
+  load_trial_table reads both into the same structured array (fields as in TRIAL_DTYPE)
+"""
+
+import os
+import numpy as np
+from file_writer import CSV_HEADERS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None # optional - the NumPy format is used without it
+
+# Values of the block column (the code stored in the table is the index in this list)
+BLOCK_CATEGORIES = ['sound', 'action-left', 'action-right']
+
+FLOAT_COLUMNS = ["trial_start", "RW_start", "trial_end", "trial_duration", "ITI", "early_lick_time", "stim_time",
+                 "lick_time", "reward_time", "punishment_time", "RW", "QW", "WW", "valve_opening", "ITImin", "ITImax",
+                 "threshold_left", "threshold_right", "session_start"]
+
+def column_type(name):
+    if name == 'trial_number':
+        return '<i4'
+    if name in FLOAT_COLUMNS:
+        return '<f8'
+    return 'i1' # flags and the block code
+
+# One record per trial (little endian, no padding)
+TRIAL_DTYPE = np.dtype([(name, column_type(name)) for name in CSV_HEADERS])
+
+# Value of every column when it is missing
+MISSING_TRIAL = np.array(tuple(np.nan if TRIAL_DTYPE[name].kind == 'f' else -1 for name in CSV_HEADERS), dtype=TRIAL_DTYPE)
+
+
+def empty_trials(n):
+    """n records with every column missing (NaN/-1)."""
+    return np.full(n, MISSING_TRIAL, dtype=TRIAL_DTYPE)
+
+
+def trial_table_path(csv_file_path):
+    """Path of the trial table that belongs to a session csv."""
+    extension = '.parquet' if pa is not None else '.bin'
+    return os.path.splitext(csv_file_path)[0] + '_trials' + extension
+
+
+def column_value(name, value):
+    """
+    One value (from a trial row, or the text of a csv cell) as it is stored in column `name`.
+    Missing values and values that do not fit the column (text in a number column, a number that is not a 0/1 flag
+    or does not fit int8/int32) are NaN/-1.
+    """
+    if name == 'block':
+        return BLOCK_CATEGORIES.index(value) if value in BLOCK_CATEGORIES else -1
+
+    kind = TRIAL_DTYPE[name].kind
+    missing = np.nan if kind == 'f' else -1
+    if isinstance(value, str):
+        if value in ('True', 'False'):
+            value = value == 'True'
+    try:
+        value = float(value) # numbers, bools and numeric text ('', 'nan', 'None', words... are not)
+    except (TypeError, ValueError):
+        return missing
+    if kind == 'f':
+        return value
+
+    limits = np.iinfo(TRIAL_DTYPE[name])
+    if not (np.isfinite(value) and value.is_integer() and limits.min <= value <= limits.max):
+        return -1
+    return int(value)
+
+
+def to_record(row, record):
+    """Fills one TRIAL_DTYPE record from a csv row (the trial_data list of save_data), column by column name."""
+    if len(row) != len(CSV_HEADERS):
+        raise ValueError(f"trial row has {len(row)} values for {len(CSV_HEADERS)} columns")
+    for name, value in zip(CSV_HEADERS, row):
+        record[name] = column_value(name, value)
+
+
+def load_trial_table(path):
+    """Reads a trial table (raw records or parquet) into a structured array (fields as in TRIAL_DTYPE)."""
+    if path.endswith('.parquet'):
+        table = pq.read_table(path)
+        trials = empty_trials(table.num_rows)
+        for name in CSV_HEADERS:
+            if name not in table.column_names:
+                continue
+            if name == 'block': # dictionary column - labels, None when missing
+                trials[name] = [column_value(name, label) for label in table.column(name).to_pylist()]
+            else:
+                trials[name] = table.column(name).to_numpy()
+        return trials
+    return np.fromfile(path, dtype=TRIAL_DTYPE)
+
+
+def block_labels(trials):
+    """block column as strings ('' when missing)."""
+    labels = np.array(BLOCK_CATEGORIES + [''], dtype=object)
+    return labels[trials['block']] # code -1 is the last entry
+
+
+class TrialTableWriter:
+    def __init__(self, file_path, row_group=10):
+        self.file_path = file_path
+        self.row_group = row_group
+        self.rows = empty_trials(row_group) # the row group being filled
+        self.n_rows = 0
+        self.n_written = 0
+
+        if pa is not None:
+            self.schema = pa.schema([(name, pa.dictionary(pa.int8(), pa.string()) if name == 'block'
+                                     else pa.from_numpy_dtype(TRIAL_DTYPE[name])) for name in CSV_HEADERS])
+            self.parquet = pq.ParquetWriter(file_path, self.schema)
+            self.file = None
+        else:
+            self.parquet = None
+            self.file = open(file_path, 'ab')
+
+    def append(self, row):
+        """Adds one trial (csv row); the row group is written when it is full. ValueError if the row does not fit the header."""
+        self.rows[self.n_rows] = MISSING_TRIAL # nothing is left from an earlier trial
+        to_record(row, self.rows[self.n_rows])
+        self.n_rows += 1
+        if self.n_rows == self.row_group:
+            self.write_group()
+
+    def write_group(self):
+        if self.n_rows == 0:
+            return
+        rows = self.rows[:self.n_rows]
+        if self.parquet is not None:
+            columns = [self.block_column(rows[name]) if name == 'block' else pa.array(rows[name]) for name in CSV_HEADERS]
+            self.parquet.write_table(pa.Table.from_arrays(columns, schema=self.schema))
+        else:
+            self.file.write(rows.tobytes())
+            self.file.flush()
+        self.n_written += self.n_rows
+        self.n_rows = 0
+
+    def block_column(self, codes):
+        """block codes as an Arrow dictionary (categorical) array over BLOCK_CATEGORIES; missing blocks are nulls."""
+        indices = pa.array(codes, type=pa.int8(), mask=codes < 0)
+        return pa.DictionaryArray.from_arrays(indices, pa.array(BLOCK_CATEGORIES, type=pa.string()))
+
+    def close(self):
+        """Writes the last (partial) row group and closes the file."""
+        self.write_group()
+        if self.parquet is not None:
+            self.parquet.close()
+        else:
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+    def discard(self):
+        """Closes and deletes the table (the session is then only in the csv)."""
+        self.n_rows = 0
+        try:
+            self.close()
+        finally:
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:05:41 2026
+
+@author: JoanaCatarino
+
+UI bus - GUI updates from the task threads, applied by the GUI thread once per frame
+- The task threads never touch the widgets: they post state changes (counters, current trial, bias, trial history)
+  with post(key, value), which only stores the value and returns. The first post of a frame wakes the GUI thread
+  with a queued signal; the GUI thread applies everything that arrived during the frame in one go (drain)
+- Changes are coalesced by key: if a counter changes three times in a frame only the last value is shown.
+  Keys subscribed with accumulate=True keep every value of the frame instead (the handler gets the list)
+- The handlers run on the GUI thread (subscribe(key, handler) - usually GuiControls.show_* methods)
+"""
+
+import threading
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class UiBus(QObject):
+
+    wake = pyqtSignal() # emitted (from any thread) when the first change of a frame is posted
+
+    def __init__(self, frame_interval=33, parent=None):
+        super().__init__(parent)
+        self.lock = threading.Lock()
+        self.pending = {} # key -> latest value (or list of values for the accumulating keys)
+        self.handlers = {}
+        self.accumulating = set()
+        self.scheduled = False # a frame is already waiting to be drained
+
+        # Frame timer (single shot): started by the first change, everything posted until it fires is applied together
+        self.frame = QTimer(self)
+        self.frame.setSingleShot(True)
+        self.frame.setInterval(frame_interval)
+        self.frame.timeout.connect(self.drain)
+        self.wake.connect(self.start_frame) # queued when emitted from a task thread (the bus lives in the GUI thread)
+
+    def subscribe(self, key, handler, accumulate=False):
+        """handler(value) applies the changes of key on the GUI thread."""
+        self.handlers[key] = handler
+        if accumulate:
+            self.accumulating.add(key)
+
+    def post(self, key, value):
+        """Queues a change (any thread, never blocks on the GUI)."""
+        with self.lock:
+            if key in self.accumulating:
+                self.pending.setdefault(key, []).append(value)
+            else:
+                self.pending[key] = value
+            wake = not self.scheduled
+            self.scheduled = True
+        if wake:
+            self.wake.emit()
+
+    def start_frame(self):
+        if not self.frame.isActive():
+            self.frame.start()
+
+    def drain(self):
+        """GUI thread - applies the changes posted since the last frame."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.scheduled = False
+
+        for key, value in pending.items():
+            handler = self.handlers.get(key)
+            if handler is None:
+                print(f"UI bus: nothing shows '{key}'")
+                continue
+            try:
+                handler(value)
+            except Exception as e:
+                print(f"Error updating the GUI ({key}): {e}")